@@ -17,7 +17,9 @@ To use this with SageMCP:
    - package_path: "/path/to/this/directory"
 """
 
+import io
 import os
+import sys
 import asyncio
 from mcp.server import Server
 from mcp import types
@@ -26,101 +28,119 @@ from mcp import types
 # Create MCP server
 server = Server("example-python-server")
 
+# SageMCP injects these variables when it spawns the process and never changes
+# them afterwards, so read them once at startup instead of on every tool call.
+_ENV = {
+    key: os.environ.get(key, "not set")
+    for key in ("TENANT_ID", "CONNECTOR_ID", "SAGEMCP_MODE")
+}
+
+_ENV_INFO = f"""Runtime Environment Information:
+- Tenant ID: {_ENV["TENANT_ID"]}
+- Connector ID: {_ENV["CONNECTOR_ID"]}
+- SageMCP Mode: {_ENV["SAGEMCP_MODE"]}
+- Python Version: {os.sys.version}
+"""
+
+
+def _oauth_status() -> str:
+    """Describe which OAuth token (if any) was injected, with the value masked."""
+    for var in ("OAUTH_TOKEN", "ACCESS_TOKEN"):
+        token = os.environ.get(var, "")
+        if token:
+            masked_token = token[:8] + "..." + token[-4:]
+            return f"✓ OAuth token available ({var}): {masked_token}"
+    return "✗ No OAuth token found in environment"
+
+
+_OAUTH_STATUS = _oauth_status()
+
+# Tool and resource definitions are static, so build them once at import time.
+_TOOLS = [
+    types.Tool(
+        name="echo",
+        description="Echo back the input message",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {
+                    "type": "string",
+                    "description": "The message to echo"
+                }
+            },
+            "required": ["message"]
+        }
+    ),
+    types.Tool(
+        name="get_env_info",
+        description="Get information about the runtime environment",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    types.Tool(
+        name="check_oauth",
+        description="Check if OAuth token is available (for testing)",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+]
+
+_RESOURCES = [
+    types.Resource(
+        uri="example://hello",
+        name="Hello Resource",
+        description="A simple example resource",
+        mimeType="text/plain"
+    )
+]
+
 
 @server.list_tools()
 async def list_tools() -> list[types.Tool]:
     """List available tools."""
-    return [
-        types.Tool(
-            name="echo",
-            description="Echo back the input message",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "The message to echo"
-                    }
-                },
-                "required": ["message"]
-            }
-        ),
-        types.Tool(
-            name="get_env_info",
-            description="Get information about the runtime environment",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        types.Tool(
-            name="check_oauth",
-            description="Check if OAuth token is available (for testing)",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-    ]
+    return _TOOLS
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
-    """Execute a tool."""
+async def _echo(arguments: dict) -> list[types.TextContent]:
+    message = arguments.get("message", "")
+    return [types.TextContent(type="text", text=f"Echo: {message}")]
 
-    if name == "echo":
-        message = arguments.get("message", "")
-        return [types.TextContent(
-            type="text",
-            text=f"Echo: {message}"
-        )]
 
-    elif name == "get_env_info":
-        tenant_id = os.getenv("TENANT_ID", "not set")
-        connector_id = os.getenv("CONNECTOR_ID", "not set")
-        sagemcp_mode = os.getenv("SAGEMCP_MODE", "not set")
+async def _get_env_info(arguments: dict) -> list[types.TextContent]:
+    return [types.TextContent(type="text", text=_ENV_INFO)]
 
-        info = f"""Runtime Environment Information:
-- Tenant ID: {tenant_id}
-- Connector ID: {connector_id}
-- SageMCP Mode: {sagemcp_mode}
-- Python Version: {os.sys.version}
-"""
-        return [types.TextContent(type="text", text=info)]
 
-    elif name == "check_oauth":
-        oauth_token = os.getenv("OAUTH_TOKEN", "")
-        access_token = os.getenv("ACCESS_TOKEN", "")
+async def _check_oauth(arguments: dict) -> list[types.TextContent]:
+    return [types.TextContent(type="text", text=_OAUTH_STATUS)]
 
-        if oauth_token:
-            masked_token = oauth_token[:8] + "..." + oauth_token[-4:]
-            status = f"✓ OAuth token available (OAUTH_TOKEN): {masked_token}"
-        elif access_token:
-            masked_token = access_token[:8] + "..." + access_token[-4:]
-            status = f"✓ OAuth token available (ACCESS_TOKEN): {masked_token}"
-        else:
-            status = "✗ No OAuth token found in environment"
 
-        return [types.TextContent(type="text", text=status)]
+_HANDLERS = {
+    "echo": _echo,
+    "get_env_info": _get_env_info,
+    "check_oauth": _check_oauth,
+}
 
-    else:
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+    """Execute a tool."""
+    handler = _HANDLERS.get(name)
+    if handler is None:
         return [types.TextContent(
             type="text",
             text=f"Unknown tool: {name}"
         )]
+    return await handler(arguments)
 
 
 @server.list_resources()
 async def list_resources() -> list[types.Resource]:
     """List available resources."""
-    return [
-        types.Resource(
-            uri="example://hello",
-            name="Hello Resource",
-            description="A simple example resource",
-            mimeType="text/plain"
-        )
-    ]
+    return _RESOURCES
 
 
 @server.read_resource()
@@ -132,15 +152,47 @@ async def read_resource(uri: str) -> str:
         raise ValueError(f"Unknown resource: {uri}")
 
 
+# Initialization options only depend on the handlers registered above,
+# so compute them once at import rather than when the first client connects.
+_INIT_OPTIONS = server.create_initialization_options()
+
+
+# Buffer size for the stdin/stdout pipes to SageMCP
+STDIO_BUFFER_SIZE = 65536
+
+
+def _buffered_stdio():
+    """Wrap the stdio file descriptors in large block buffers.
+
+    Large JSON-RPC messages are then read and written in a few syscalls
+    instead of 8 KiB chunks. The SDK still flushes after every message, so
+    responses are delivered as soon as they are complete.
+    """
+    import anyio
+
+    stdin = io.TextIOWrapper(
+        open(sys.stdin.fileno(), "rb", buffering=STDIO_BUFFER_SIZE, closefd=False),
+        encoding="utf-8",
+        errors="replace",
+    )
+    stdout = io.TextIOWrapper(
+        open(sys.stdout.fileno(), "wb", buffering=STDIO_BUFFER_SIZE, closefd=False),
+        encoding="utf-8",
+        write_through=False,
+    )
+    return anyio.wrap_file(stdin), anyio.wrap_file(stdout)
+
+
 async def main():
     """Run the MCP server."""
     from mcp.server.stdio import stdio_server
 
-    async with stdio_server() as (read_stream, write_stream):
+    stdin, stdout = _buffered_stdio()
+    async with stdio_server(stdin, stdout) as (read_stream, write_stream):
         await server.run(
             read_stream,
             write_stream,
-            server.create_initialization_options()
+            _INIT_OPTIONS
         )
 
 
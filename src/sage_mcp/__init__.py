@@ -5,10 +5,23 @@ A scalable platform for hosting MCP servers with multi-tenant support,
 OAuth integration, and connector plugins for various services.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Sage MCP Team"
 __email__ = "contact@example.com"
 
-from .config import Settings, get_settings
+if TYPE_CHECKING:
+    from .config import Settings, get_settings
 
 __all__ = ["Settings", "get_settings", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    # The server settings pull in pydantic-settings; load them on first use so
+    # the CLI (sage_mcp.cli) does not pay for it on every invocation.
+    if name in ("Settings", "get_settings"):
+        from . import config
+
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,9 @@ from uuid import UUID
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator
+from sqlalchemy import delete, not_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database.connection import get_db_session
@@ -16,8 +18,11 @@ from ..models.mcp_process import MCPProcess
 from ..models.tenant import Tenant
 from ..connectors.registry import connector_registry
 from ..runtime import process_manager
+from .mcp import invalidate_transports
+from .responses import ORJSONResponse
+from .tenant_cache import get_tenant_id, invalidate_tenant
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class TenantCreate(BaseModel):
@@ -27,6 +32,21 @@ class TenantCreate(BaseModel):
     contact_email: Optional[str] = None
 
 
+class TenantUpdate(BaseModel):
+    """Request model for partially updating a tenant."""
+    name: Optional[str] = None
+    description: Optional[str] = None
+    contact_email: Optional[str] = None
+
+    @field_validator("name")
+    @classmethod
+    def validate_name_not_null(cls, v):
+        # Omitting name leaves it unchanged; the column cannot be set to NULL
+        if v is None:
+            raise ValueError("name cannot be null")
+        return v
+
+
 class TenantResponse(BaseModel):
     id: UUID
     slug: str
@@ -37,8 +57,7 @@ class TenantResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ConnectorCreate(BaseModel):
@@ -53,6 +72,21 @@ class ConnectorCreate(BaseModel):
     package_path: Optional[str] = None
 
 
+class ConnectorUpdate(BaseModel):
+    """Request model for partially updating a connector."""
+    name: Optional[str] = None
+    description: Optional[str] = None
+    configuration: Optional[Dict[str, Any]] = None
+
+    @field_validator("name")
+    @classmethod
+    def validate_name_not_null(cls, v):
+        # Omitting name leaves it unchanged; the column cannot be set to NULL
+        if v is None:
+            raise ValueError("name cannot be null")
+        return v
+
+
 class ConnectorResponse(BaseModel):
     id: UUID
     connector_type: ConnectorType
@@ -69,8 +103,12 @@ class ConnectorResponse(BaseModel):
     runtime_env: Optional[Dict[str, Any]]
     package_path: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ConnectorListItem(ConnectorResponse):
+    """Connector list entry with optional related data requested via ``include``."""
+    process_status: Optional[str] = None
 
 
 class ToolStateResponse(BaseModel):
@@ -114,8 +152,21 @@ class ProcessStatusResponse(BaseModel):
     error_message: Optional[str]
     restart_count: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+def tenant_response(tenant: Tenant) -> TenantResponse:
+    """Build a TenantResponse from a loaded row, skipping re-validation."""
+    return TenantResponse.model_construct(
+        **{name: getattr(tenant, name) for name in TenantResponse.model_fields}
+    )
+
+
+def connector_response(connector: Connector) -> ConnectorResponse:
+    """Build a ConnectorResponse from a loaded row, skipping re-validation."""
+    return ConnectorResponse.model_construct(
+        **{name: getattr(connector, name) for name in ConnectorResponse.model_fields}
+    )
 
 
 async def populate_tools_for_connector(connector: Connector, session: AsyncSession):
@@ -166,10 +217,8 @@ async def create_tenant(
 ):
     """Create a new tenant."""
     # Check if tenant slug already exists
-    from sqlalchemy import select
-
     existing = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_data.slug)
+        select(Tenant.id).where(Tenant.slug == tenant_data.slug)
     )
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Tenant slug already exists")
@@ -186,7 +235,7 @@ async def create_tenant(
     await session.commit()
     await session.refresh(tenant)
 
-    return tenant
+    return tenant_response(tenant)
 
 
 @router.get("/tenants", response_model=List[TenantResponse])
@@ -194,12 +243,10 @@ async def list_tenants(
     session: AsyncSession = Depends(get_db_session)
 ):
     """List all tenants."""
-    from sqlalchemy import select
-
     result = await session.execute(select(Tenant))
     tenants = result.scalars().all()
 
-    return list(tenants)
+    return [tenant_response(tenant) for tenant in tenants]
 
 
 @router.get("/tenants/{tenant_slug}", response_model=TenantResponse)
@@ -208,8 +255,6 @@ async def get_tenant(
     session: AsyncSession = Depends(get_db_session)
 ):
     """Get a specific tenant."""
-    from sqlalchemy import select
-
     result = await session.execute(
         select(Tenant).where(Tenant.slug == tenant_slug)
     )
@@ -218,7 +263,7 @@ async def get_tenant(
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    return tenant
+    return tenant_response(tenant)
 
 
 @router.post("/tenants/{tenant_slug}/connectors", response_model=ConnectorResponse, status_code=201)
@@ -228,16 +273,10 @@ async def create_connector(
     session: AsyncSession = Depends(get_db_session)
 ):
     """Create a new connector for a tenant."""
-    from sqlalchemy import select
-    from sqlalchemy.exc import IntegrityError
-
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Check if connector of this type already exists for this tenant
@@ -245,7 +284,7 @@ async def create_connector(
     if connector_data.connector_type != ConnectorType.CUSTOM:
         existing_connector = await session.execute(
             select(Connector).where(
-                Connector.tenant_id == tenant.id,
+                Connector.tenant_id == tenant_id,
                 Connector.connector_type == connector_data.connector_type.value
             )
         )
@@ -257,7 +296,7 @@ async def create_connector(
 
     # Create connector
     connector = Connector(
-        tenant_id=tenant.id,
+        tenant_id=tenant_id,
         connector_type=connector_data.connector_type,
         name=connector_data.name,
         description=connector_data.description,
@@ -280,36 +319,62 @@ async def create_connector(
             detail=f"A {connector_data.connector_type.value} connector already exists for this tenant. Only one connector per type is allowed."
         )
 
+    # Build the response before tool population, which may roll back the session
+    response = connector_response(connector)
+
     # Auto-populate all tools for this connector (all enabled by default)
     await populate_tools_for_connector(connector, session)
 
-    return connector
+    return response
 
 
-@router.get("/tenants/{tenant_slug}/connectors", response_model=List[ConnectorResponse])
+@router.get("/tenants/{tenant_slug}/connectors", response_model=List[ConnectorListItem])
 async def list_connectors(
     tenant_slug: str,
+    include: Optional[str] = None,
     session: AsyncSession = Depends(get_db_session)
 ):
-    """List connectors for a tenant."""
-    from sqlalchemy import select
+    """List connectors for a tenant.
 
+    ``include`` is a comma-separated list of related data to embed. With
+    ``status``, the process status of external connectors is loaded in one
+    query instead of one process status request per connector.
+    """
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get connectors
     connector_result = await session.execute(
-        select(Connector).where(Connector.tenant_id == tenant.id)
+        select(Connector).where(Connector.tenant_id == tenant_id)
     )
     connectors = connector_result.scalars().all()
 
-    return list(connectors)
+    includes = set(include.split(",")) if include else set()
+
+    process_statuses = {}
+    if "status" in includes:
+        process_result = await session.execute(
+            select(MCPProcess.connector_id, MCPProcess.status)
+            .where(MCPProcess.tenant_id == tenant_id)
+        )
+        process_statuses = {
+            connector_id: status.value
+            for connector_id, status in process_result.all()
+        }
+
+    return [
+        ConnectorListItem.model_construct(
+            **{
+                name: getattr(connector, name)
+                for name in ConnectorResponse.model_fields
+            },
+            process_status=process_statuses.get(connector.id),
+        )
+        for connector in connectors
+    ]
 
 
 @router.delete("/tenants/{tenant_slug}")
@@ -318,28 +383,20 @@ async def delete_tenant(
     session: AsyncSession = Depends(get_db_session)
 ):
     """Delete a tenant and all its connectors."""
-    from sqlalchemy import select, delete
-
-    # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
+    # Dependent rows are removed by ON DELETE CASCADE foreign keys
+    result = await session.execute(
+        delete(Tenant)
+        .where(Tenant.slug == tenant_slug)
+        .returning(Tenant.id)
     )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = result.scalar_one_or_none()
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    # Delete all connectors for this tenant first
-    await session.execute(
-        delete(Connector).where(Connector.tenant_id == tenant.id)
-    )
-
-    # Delete the tenant
-    await session.execute(
-        delete(Tenant).where(Tenant.id == tenant.id)
-    )
-
     await session.commit()
+    invalidate_tenant(tenant_slug)
+    invalidate_transports(tenant_slug)
 
     return {
         "message": (
@@ -356,19 +413,8 @@ async def update_tenant(
     session: AsyncSession = Depends(get_db_session)
 ):
     """Update a tenant."""
-    from sqlalchemy import select, update
-
-    # Check if tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
-
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
-
-    # Update tenant
-    await session.execute(
+    # Update tenant and read back the new row in one statement
+    result = await session.execute(
         update(Tenant)
         .where(Tenant.slug == tenant_slug)
         .values(
@@ -376,40 +422,66 @@ async def update_tenant(
             description=tenant_data.description,
             contact_email=tenant_data.contact_email
         )
+        .returning(Tenant)
     )
+    tenant = result.scalar_one_or_none()
+
+    if not tenant:
+        raise HTTPException(status_code=404, detail="Tenant not found")
 
     await session.commit()
-    await session.refresh(tenant)
+    invalidate_tenant(tenant_slug)
+    invalidate_transports(tenant_slug)
 
-    return tenant
+    return tenant_response(tenant)
 
 
-@router.get(
-    "/tenants/{tenant_slug}/connectors/{connector_id}",
-    response_model=ConnectorResponse
-)
-async def get_connector(
+@router.patch("/tenants/{tenant_slug}", response_model=TenantResponse)
+async def patch_tenant(
     tenant_slug: str,
-    connector_id: str,
+    tenant_data: TenantUpdate,
     session: AsyncSession = Depends(get_db_session)
 ):
-    """Get a specific connector."""
-    from sqlalchemy import select
+    """Update only the given fields of a tenant."""
+    values = tenant_data.model_dump(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="No fields to update")
 
-    # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
+    result = await session.execute(
+        update(Tenant)
+        .where(Tenant.slug == tenant_slug)
+        .values(**values)
+        .returning(Tenant)
     )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant = result.scalar_one_or_none()
 
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    # Get connector
+    await session.commit()
+    invalidate_tenant(tenant_slug)
+    invalidate_transports(tenant_slug)
+
+    return tenant_response(tenant)
+
+
+@router.get(
+    "/tenants/{tenant_slug}/connectors/{connector_id}",
+    response_model=ConnectorResponse
+)
+async def get_connector(
+    tenant_slug: str,
+    connector_id: UUID,
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Get a specific connector."""
+    # Get connector scoped to the tenant in a single round trip
     connector_result = await session.execute(
-        select(Connector).where(
-            Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+        select(Connector)
+        .join(Tenant, Connector.tenant_id == Tenant.id)
+        .where(
+            Tenant.slug == tenant_slug,
+            Connector.id == connector_id
         )
     )
     connector = connector_result.scalar_one_or_none()
@@ -417,7 +489,7 @@ async def get_connector(
     if not connector:
         raise HTTPException(status_code=404, detail="Connector not found")
 
-    return connector
+    return connector_response(connector)
 
 
 @router.put(
@@ -426,91 +498,123 @@ async def get_connector(
 )
 async def update_connector(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     connector_data: ConnectorCreate,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Update a connector."""
-    from sqlalchemy import select, update
-
-    # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
-
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
-
-    # Get connector
-    connector_result = await session.execute(
-        select(Connector).where(
+    # Update connector scoped to the tenant and read back the new row
+    result = await session.execute(
+        update(Connector)
+        .where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id.in_(
+                select(Tenant.id).where(Tenant.slug == tenant_slug)
+            )
         )
-    )
-    connector = connector_result.scalar_one_or_none()
-
-    if not connector:
-        raise HTTPException(status_code=404, detail="Connector not found")
-
-    # Update connector
-    await session.execute(
-        update(Connector)
-        .where(Connector.id == connector_id)
         .values(
             connector_type=connector_data.connector_type,
             name=connector_data.name,
             description=connector_data.description,
             configuration=connector_data.configuration
         )
+        .returning(Connector)
     )
+    connector = result.scalar_one_or_none()
+
+    if not connector:
+        raise HTTPException(status_code=404, detail="Connector not found")
 
     await session.commit()
-    await session.refresh(connector)
+    invalidate_transports(tenant_slug, connector_id)
 
-    return connector
+    return connector_response(connector)
 
 
-@router.delete("/tenants/{tenant_slug}/connectors/{connector_id}")
-async def delete_connector(
+@router.patch(
+    "/tenants/{tenant_slug}/connectors/{connector_id}",
+    response_model=ConnectorResponse
+)
+async def patch_connector(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
+    connector_data: ConnectorUpdate,
     session: AsyncSession = Depends(get_db_session)
 ):
-    """Delete a connector."""
-    from sqlalchemy import select, delete
+    """Update only the given fields of a connector.
 
-    # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
+    Configuration keys are merged into the stored configuration, with null
+    values removing keys, so callers send only the keys that change instead
+    of fetching and re-sending the whole configuration.
+    """
+    values = connector_data.model_dump(exclude_unset=True)
+    if not values:
+        raise HTTPException(status_code=400, detail="No fields to update")
+
+    in_tenant = (
+        Connector.id == connector_id,
+        Connector.tenant_id.in_(
+            select(Tenant.id).where(Tenant.slug == tenant_slug)
+        )
     )
-    tenant = tenant_result.scalar_one_or_none()
 
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
-
-    # Get connector
-    connector_result = await session.execute(
-        select(Connector).where(
-            Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+    if values.get("configuration") is not None:
+        # Read-modify-write under a row lock within this transaction
+        current = await session.execute(
+            select(Connector.configuration).where(*in_tenant).with_for_update()
         )
+        row = current.first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Connector not found")
+
+        merged = {**(row.configuration or {}), **values["configuration"]}
+        values["configuration"] = {k: v for k, v in merged.items() if v is not None}
+
+    result = await session.execute(
+        update(Connector)
+        .where(*in_tenant)
+        .values(**values)
+        .returning(Connector)
     )
-    connector = connector_result.scalar_one_or_none()
+    connector = result.scalar_one_or_none()
 
     if not connector:
         raise HTTPException(status_code=404, detail="Connector not found")
 
-    # Delete connector
-    await session.execute(
-        delete(Connector).where(Connector.id == connector_id)
+    await session.commit()
+    invalidate_transports(tenant_slug, connector_id)
+
+    return connector_response(connector)
+
+
+@router.delete("/tenants/{tenant_slug}/connectors/{connector_id}")
+async def delete_connector(
+    tenant_slug: str,
+    connector_id: UUID,
+    session: AsyncSession = Depends(get_db_session)
+):
+    """Delete a connector."""
+    # Delete connector scoped to the tenant without a preliminary SELECT
+    result = await session.execute(
+        delete(Connector)
+        .where(
+            Connector.id == connector_id,
+            Connector.tenant_id.in_(
+                select(Tenant.id).where(Tenant.slug == tenant_slug)
+            )
+        )
+        .returning(Connector.name)
     )
+    connector_name = result.scalar_one_or_none()
+
+    if connector_name is None:
+        raise HTTPException(status_code=404, detail="Connector not found")
 
     await session.commit()
+    invalidate_transports(tenant_slug, connector_id)
 
     return {
-        "message": f"Connector '{connector.name}' has been deleted"
+        "message": f"Connector '{connector_name}' has been deleted"
     }
 
 
@@ -520,45 +624,31 @@ async def delete_connector(
 )
 async def toggle_connector(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Toggle connector enabled/disabled status."""
-    from sqlalchemy import select, update
-
-    # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
-
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
-
-    # Get connector
-    connector_result = await session.execute(
-        select(Connector).where(
+    # Flip the enabled flag in SQL and read back the new row
+    result = await session.execute(
+        update(Connector)
+        .where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id.in_(
+                select(Tenant.id).where(Tenant.slug == tenant_slug)
+            )
         )
+        .values(is_enabled=not_(Connector.is_enabled))
+        .returning(Connector)
     )
-    connector = connector_result.scalar_one_or_none()
+    connector = result.scalar_one_or_none()
 
     if not connector:
         raise HTTPException(status_code=404, detail="Connector not found")
 
-    # Toggle enabled status
-    new_status = not connector.is_enabled
-    await session.execute(
-        update(Connector)
-        .where(Connector.id == connector_id)
-        .values(is_enabled=new_status)
-    )
-
     await session.commit()
-    await session.refresh(connector)
+    invalidate_transports(tenant_slug, connector_id)
 
-    return connector
+    return connector_response(connector)
 
 
 # =====================================================
@@ -571,26 +661,21 @@ async def toggle_connector(
 )
 async def list_connector_tools(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """List all tools for a connector with their enabled/disabled state."""
-    from sqlalchemy import select
-
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id == tenant_id
         )
     )
     connector = connector_result.scalar_one_or_none()
@@ -651,28 +736,23 @@ async def list_connector_tools(
 )
 async def toggle_tool(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     tool_name: str,
     request: ToolToggleRequest,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Toggle a specific tool's enabled/disabled state."""
-    from sqlalchemy import select
-
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id == tenant_id
         )
     )
     connector = connector_result.scalar_one_or_none()
@@ -717,27 +797,22 @@ async def toggle_tool(
 )
 async def bulk_update_tools(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     request: BulkToolUpdatesRequest,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Bulk update multiple tools' enabled/disabled state."""
-    from sqlalchemy import select
-
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id == tenant_id
         )
     )
     connector = connector_result.scalar_one_or_none()
@@ -747,24 +822,24 @@ async def bulk_update_tools(
 
     # Process each update
     updated_count = 0
-    for update in request.updates:
+    for tool_update in request.updates:
         # Get or create tool state
         tool_state_result = await session.execute(
             select(ConnectorToolState).where(
                 ConnectorToolState.connector_id == connector.id,
-                ConnectorToolState.tool_name == update.tool_name
+                ConnectorToolState.tool_name == tool_update.tool_name
             )
         )
         tool_state = tool_state_result.scalar_one_or_none()
 
         if tool_state:
-            tool_state.is_enabled = update.is_enabled
+            tool_state.is_enabled = tool_update.is_enabled
         else:
             tool_state = ConnectorToolState(
                 id=uuid.uuid4(),
                 connector_id=connector.id,
-                tool_name=update.tool_name,
-                is_enabled=update.is_enabled
+                tool_name=tool_update.tool_name,
+                is_enabled=tool_update.is_enabled
             )
             session.add(tool_state)
 
@@ -785,26 +860,21 @@ async def bulk_update_tools(
 )
 async def enable_all_tools(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Enable all tools for a connector."""
-    from sqlalchemy import select, update
-
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id == tenant_id
         )
     )
     connector = connector_result.scalar_one_or_none()
@@ -834,26 +904,21 @@ async def enable_all_tools(
 )
 async def disable_all_tools(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Disable all tools for a connector."""
-    from sqlalchemy import select, update
-
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id == tenant_id
         )
     )
     connector = connector_result.scalar_one_or_none()
@@ -883,7 +948,7 @@ async def disable_all_tools(
 )
 async def sync_connector_tools(
     tenant_slug: str,
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Sync tools for a connector - detect new tools from code and remove orphaned tools.
@@ -895,22 +960,17 @@ async def sync_connector_tools(
     4. Removes orphaned tools (tools deleted from code)
     5. Returns a summary of changes
     """
-    from sqlalchemy import select, delete
-
     # Get tenant
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
+    tenant_id = await get_tenant_id(session, tenant_slug)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(
             Connector.id == connector_id,
-            Connector.tenant_id == tenant.id
+            Connector.tenant_id == tenant_id
         )
     )
     connector = connector_result.scalar_one_or_none()
@@ -991,12 +1051,10 @@ async def sync_connector_tools(
     response_model=Optional[ProcessStatusResponse]
 )
 async def get_process_status(
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Get the status of an external MCP server process."""
-    from sqlalchemy import select
-
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(Connector.id == connector_id)
@@ -1040,12 +1098,10 @@ async def get_process_status(
 
 @router.post("/connectors/{connector_id}/process/restart")
 async def restart_process(
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Restart an external MCP server process."""
-    from sqlalchemy import select
-
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(Connector.id == connector_id)
@@ -1078,12 +1134,10 @@ async def restart_process(
 
 @router.delete("/connectors/{connector_id}/process")
 async def terminate_process(
-    connector_id: str,
+    connector_id: UUID,
     session: AsyncSession = Depends(get_db_session)
 ):
     """Terminate an external MCP server process."""
-    from sqlalchemy import select
-
     # Get connector
     connector_result = await session.execute(
         select(Connector).where(Connector.id == connector_id)
@@ -1,21 +1,65 @@
 """MCP API routes for multi-tenant support."""
 
 import asyncio
-import json
-from typing import Dict
+from typing import Any, Dict, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request, WebSocket, Response
 from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.encoders import jsonable_encoder
 
+from ..mcp.pool import TransportPool
 from ..mcp.transport import MCPTransport
+from .responses import ORJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Simple in-memory message queues for routing responses to SSE streams
 # Key: f"{tenant_slug}:{connector_id}"
 _message_queues: Dict[str, asyncio.Queue] = {}
 
+# Pre-encoded SSE framing; payloads are serialized straight to bytes with orjson
+_SSE_MESSAGE = b"event: message\ndata: "
+_SSE_ERROR = b"event: error\ndata: "
+_SSE_HEARTBEAT = b"event: heartbeat\ndata: "
+_SSE_END = b"\n\n"
+_SSE_ENDPOINT_EVENT = (
+    b"event: endpoint\ndata: " + orjson.dumps({"type": "endpoint"}) + _SSE_END
+)
+_SSE_HEARTBEAT_COMMENT = b": heartbeat\n\n"
+
+# Static response headers for the Streamable HTTP GET stream and the legacy SSE endpoint
+_STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Cache-Control, Last-Event-ID",
+    "Access-Control-Expose-Headers": "Content-Type"
+}
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable nginx buffering
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Cache-Control"
+}
+
+# Capabilities advertised by the info endpoint
+_MCP_CAPABILITIES = {
+    "tools": {"listChanged": True},
+    "resources": {"subscribe": True, "listChanged": True},
+    "prompts": {"listChanged": True}
+}
+
+# Initialized transports shared across requests to the same connector
+transport_pool = TransportPool()
+
+
+def invalidate_transports(tenant_slug: str, connector_id: Optional[str] = None) -> None:
+    """Drop pooled transports after a tenant or connector has been modified."""
+    transport_pool.invalidate(tenant_slug, connector_id)
+
 
 @router.websocket("/{tenant_slug}/connectors/{connector_id}/mcp")
 async def mcp_websocket(websocket: WebSocket, tenant_slug: str, connector_id: str):
@@ -44,6 +88,60 @@ async def mcp_websocket(websocket: WebSocket, tenant_slug: str, connector_id: st
     await transport.handle_websocket(websocket)
 
 
+def _invalid_request(message_id: Any = None, detail: str = "") -> dict:
+    """Build a JSON-RPC 2.0 Invalid Request (-32600) error object."""
+    return {
+        "jsonrpc": "2.0",
+        "id": message_id,
+        "error": {"code": -32600, "message": f"Invalid Request{detail}"}
+    }
+
+
+async def _handle_batch(
+    tenant_slug: str, connector_id: str, messages: list, user_token: Optional[str]
+) -> Response:
+    """Process a JSON-RPC batch and return the responses to its requests.
+
+    Notifications and responses in the batch are acknowledged without a
+    reply, and entries that are not valid messages get an Invalid Request
+    error in their place. A batch with nothing to answer returns 202 Accepted.
+    """
+    # Each entry is either a request to process or a ready-made error object
+    entries = []
+    for message in messages:
+        if not isinstance(message, dict):
+            entries.append(_invalid_request(detail=": batch entry must be an object"))
+        elif message.get("method") is not None:
+            if message.get("id") is not None:
+                entries.append(message)
+        elif "result" not in message and "error" not in message:
+            entries.append(_invalid_request(
+                message.get("id"),
+                ": message must be a request, response, or notification"
+            ))
+
+    if not entries:
+        return Response(status_code=202)
+
+    responses = []
+    if any("method" in entry for entry in entries):
+        async with transport_pool.acquire(
+            tenant_slug, connector_id, user_token
+        ) as transport:
+            for entry in entries:
+                if "method" in entry:
+                    entry = await transport.handle_http_message(entry)
+                if entry is not None:
+                    responses.append(entry)
+    else:
+        responses = entries
+
+    return Response(
+        content=orjson.dumps(responses, default=jsonable_encoder),
+        media_type="application/json"
+    )
+
+
 @router.post("/{tenant_slug}/connectors/{connector_id}/mcp")
 async def mcp_http_post(tenant_slug: str, connector_id: str, request: Request):
     """HTTP POST endpoint for MCP protocol communication (Streamable HTTP transport).
@@ -52,6 +150,8 @@ async def mcp_http_post(tenant_slug: str, connector_id: str, request: Request):
     - For JSON-RPC notifications (no id): Returns 202 Accepted
     - For JSON-RPC responses (has id, is response): Returns 202 Accepted
     - For JSON-RPC requests (has id, is request): Returns application/json with response
+    - For JSON-RPC batches (array of messages): Returns an array with one response
+      per request
 
     Client MUST include Accept header with application/json and text/event-stream.
 
@@ -71,8 +171,8 @@ async def mcp_http_post(tenant_slug: str, connector_id: str, request: Request):
 
     try:
         # Parse the JSON-RPC message
-        message = await request.json()
-    except json.JSONDecodeError:
+        message = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
 
     # Extract user token from custom header if provided
@@ -85,6 +185,20 @@ async def mcp_http_post(tenant_slug: str, connector_id: str, request: Request):
         if auth_header.startswith('Bearer '):
             user_token = auth_header[7:]
 
+    # JSON-RPC batch: answer every request in the array with one transport
+    if isinstance(message, list):
+        if not message:
+            return JSONResponse(
+                content=_invalid_request(detail=": empty batch"), status_code=400
+            )
+        return await _handle_batch(tenant_slug, connector_id, message, user_token)
+
+    if not isinstance(message, dict):
+        return JSONResponse(
+            content=_invalid_request(detail=": message must be an object"),
+            status_code=400
+        )
+
     # Determine message type
     message_id = message.get("id")
     method = message.get("method")
@@ -100,11 +214,12 @@ async def mcp_http_post(tenant_slug: str, connector_id: str, request: Request):
 
     # Handle requests - process and return JSON response
     if is_request:
-        # Create transport for this specific connector with optional user token
-        transport = MCPTransport(tenant_slug, connector_id, user_token=user_token)
-
-        # Process the request
-        response = await transport.handle_http_message(message)
+        # Get transport for this specific connector with optional user token
+        async with transport_pool.acquire(
+            tenant_slug, connector_id, user_token
+        ) as transport:
+            # Process the request
+            response = await transport.handle_http_message(message)
 
         if response is None:
             # This shouldn't happen for requests, but handle gracefully
@@ -114,20 +229,15 @@ async def mcp_http_post(tenant_slug: str, connector_id: str, request: Request):
             )
 
         # Return JSON response directly
-        return JSONResponse(
-            content=jsonable_encoder(response),
+        return Response(
+            content=orjson.dumps(response, default=jsonable_encoder),
             media_type="application/json"
         )
 
     # Invalid message format
-    error_response = {
-        "jsonrpc": "2.0",
-        "id": message_id,
-        "error": {
-            "code": -32600,
-            "message": "Invalid Request: message must be a request, response, or notification"
-        }
-    }
+    error_response = _invalid_request(
+        message_id, ": message must be a request, response, or notification"
+    )
     return JSONResponse(content=error_response, status_code=400)
 
 
@@ -149,11 +259,11 @@ async def mcp_http_get(tenant_slug: str, connector_id: str):
     Client MUST include Accept: text/event-stream header.
     """
     async def event_stream():
-        # Create transport for this specific connector
-        transport = MCPTransport(tenant_slug, connector_id)
+        # Get transport for this specific connector and make sure it is initialized
+        async with transport_pool.acquire(tenant_slug, connector_id) as transport:
+            initialized = await transport.initialize()
 
-        # Initialize the transport
-        if not await transport.initialize():
+        if not initialized:
             error_msg = {
                 "jsonrpc": "2.0",
                 "error": {
@@ -161,7 +271,7 @@ async def mcp_http_get(tenant_slug: str, connector_id: str):
                     "message": "Tenant not found or inactive"
                 }
             }
-            yield f"event: message\ndata: {json.dumps(error_msg)}\n\n"
+            yield _SSE_MESSAGE + orjson.dumps(error_msg) + _SSE_END
             return
 
         # Get or create message queue for server-initiated messages
@@ -180,11 +290,11 @@ async def mcp_http_get(tenant_slug: str, connector_id: str):
 
                     # Send message as SSE event
                     # Per MCP spec: all messages use event type "message"
-                    yield f"event: message\ndata: {json.dumps(message)}\n\n"
+                    yield _SSE_MESSAGE + orjson.dumps(message) + _SSE_END
 
                 except asyncio.TimeoutError:
                     # Send heartbeat comment to keep connection alive
-                    yield ": heartbeat\n\n"
+                    yield _SSE_HEARTBEAT_COMMENT
 
         except asyncio.CancelledError:
             pass
@@ -196,19 +306,12 @@ async def mcp_http_get(tenant_slug: str, connector_id: str):
                     "message": f"SSE stream error: {str(e)}"
                 }
             }
-            yield f"event: message\ndata: {json.dumps(error_msg)}\n\n"
+            yield _SSE_MESSAGE + orjson.dumps(error_msg) + _SSE_END
 
     return StreamingResponse(
         event_stream(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control, Last-Event-ID",
-            "Access-Control-Expose-Headers": "Content-Type"
-        }
+        headers=_STREAM_HEADERS
     )
 
 
@@ -226,60 +329,55 @@ async def mcp_sse(tenant_slug: str, connector_id: str):
 
     async def event_stream():
         # Send endpoint event for backwards compatibility
-        yield f"event: endpoint\ndata: {json.dumps({'type': 'endpoint'})}\n\n"
+        yield _SSE_ENDPOINT_EVENT
 
-        # Create transport for this specific connector
-        transport = MCPTransport(tenant_slug, connector_id)
+        # Get transport for this specific connector and make sure it is initialized
+        async with transport_pool.acquire(tenant_slug, connector_id) as transport:
+            initialized = await transport.initialize()
 
-        # Initialize the transport
-        if not await transport.initialize():
-            yield f"event: error\ndata: {json.dumps({'error': 'Tenant not found or inactive', 'code': 4004})}\n\n"
+        if not initialized:
+            error = {"error": "Tenant not found or inactive", "code": 4004}
+            yield _SSE_ERROR + orjson.dumps(error) + _SSE_END
             return
 
         try:
             # Keep connection alive with periodic heartbeats
             while True:
                 await asyncio.sleep(15)
-                yield f"event: heartbeat\ndata: {json.dumps({'timestamp': asyncio.get_event_loop().time()})}\n\n"
+                heartbeat = {"timestamp": asyncio.get_event_loop().time()}
+                yield _SSE_HEARTBEAT + orjson.dumps(heartbeat) + _SSE_END
 
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e), 'code': 1011})}\n\n"
+            yield _SSE_ERROR + orjson.dumps({"error": str(e), "code": 1011}) + _SSE_END
 
     return StreamingResponse(
         event_stream(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control"
-        }
+        headers=_SSE_HEADERS
     )
 
 
 @router.get("/{tenant_slug}/connectors/{connector_id}/mcp/info")
 async def mcp_info(tenant_slug: str, connector_id: str):
     """Get MCP server information for a specific connector."""
-    # Create transport to check if connector exists
-    transport = MCPTransport(tenant_slug, connector_id)
+    # Get transport to check if connector exists
+    async with transport_pool.acquire(tenant_slug, connector_id) as transport:
+        if not await transport.initialize():
+            raise HTTPException(
+                status_code=404, detail="Connector not found or inactive"
+            )
 
-    if not await transport.initialize():
-        raise HTTPException(status_code=404, detail="Connector not found or inactive")
+        connector = transport.mcp_server.connector
 
     return {
         "tenant": tenant_slug,
         "connector_id": connector_id,
-        "connector_type": transport.mcp_server.connector.connector_type.value if transport.mcp_server.connector else None,
-        "connector_name": transport.mcp_server.connector.name if transport.mcp_server.connector else None,
+        "connector_type": connector.connector_type.value if connector else None,
+        "connector_name": connector.name if connector else None,
         "server_name": "sage-mcp",
         "server_version": "0.1.0",
         "protocol_version": "2024-11-05",
-        "capabilities": {
-            "tools": {"listChanged": True},
-            "resources": {"subscribe": True, "listChanged": True},
-            "prompts": {"listChanged": True}
-        }
+        "capabilities": _MCP_CAPABILITIES
     }
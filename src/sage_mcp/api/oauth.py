@@ -1,26 +1,44 @@
 """OAuth API routes for connector authentication."""
 
+import hashlib
+import logging
 import os
-import secrets
-import urllib.parse
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Annotated, List, Optional, Tuple
+from urllib.parse import quote_plus
 from uuid import UUID
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import RedirectResponse
-from pydantic import BaseModel, field_validator
-from sqlalchemy import select, delete
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
+from ..connectors.http_client import get_http_client
 from ..database.connection import get_db_session
 from ..models.oauth_credential import OAuthCredential
 from ..models.oauth_config import OAuthConfig
 from ..models.tenant import Tenant
+from ..utils.oauth_state import sign_state, verify_state
+from ..utils.secret_encryption import decrypt_secret, encrypt_secret
+from .tenant_cache import get_tenant_id
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+
+def _resolve(env_name: str, placeholder: str) -> Optional[str]:
+    """Read an OAuth setting from the environment, ignoring unset placeholders."""
+    value = os.getenv(env_name)
+    return value if value and value != placeholder else None
+
+
 # OAuth provider configurations
 # Only include providers that have implemented connectors
 OAUTH_PROVIDERS = {
@@ -30,18 +48,8 @@ OAUTH_PROVIDERS = {
         "token_url": "https://github.com/login/oauth/access_token",
         "user_url": "https://api.github.com/user",
         "scopes": ["repo", "user:email", "read:org"],
-        "client_id": (
-            os.getenv("GITHUB_CLIENT_ID")
-            if os.getenv("GITHUB_CLIENT_ID")
-            and os.getenv("GITHUB_CLIENT_ID") != "your-github-client-id"
-            else None
-        ),
-        "client_secret": (
-            os.getenv("GITHUB_CLIENT_SECRET")
-            if os.getenv("GITHUB_CLIENT_SECRET")
-            and os.getenv("GITHUB_CLIENT_SECRET") != "your-github-client-secret"
-            else None
-        ),
+        "client_id": _resolve("GITHUB_CLIENT_ID", "your-github-client-id"),
+        "client_secret": _resolve("GITHUB_CLIENT_SECRET", "your-github-client-secret"),
     },
     "slack": {
         "name": "Slack",
@@ -57,18 +65,8 @@ OAUTH_PROVIDERS = {
             "reactions:read",
             "reactions:write"
         ],
-        "client_id": (
-            os.getenv("SLACK_CLIENT_ID")
-            if os.getenv("SLACK_CLIENT_ID")
-            and os.getenv("SLACK_CLIENT_ID") != "your-slack-client-id"
-            else None
-        ),
-        "client_secret": (
-            os.getenv("SLACK_CLIENT_SECRET")
-            if os.getenv("SLACK_CLIENT_SECRET")
-            and os.getenv("SLACK_CLIENT_SECRET") != "your-slack-client-secret"
-            else None
-        ),
+        "client_id": _resolve("SLACK_CLIENT_ID", "your-slack-client-id"),
+        "client_secret": _resolve("SLACK_CLIENT_SECRET", "your-slack-client-secret"),
     },
     "google_docs": {
         "name": "Google Docs",
@@ -82,18 +80,8 @@ OAUTH_PROVIDERS = {
             "https://www.googleapis.com/auth/userinfo.email",
             "https://www.googleapis.com/auth/userinfo.profile"
         ],
-        "client_id": (
-            os.getenv("GOOGLE_CLIENT_ID")
-            if os.getenv("GOOGLE_CLIENT_ID")
-            and os.getenv("GOOGLE_CLIENT_ID") != "your-google-client-id"
-            else None
-        ),
-        "client_secret": (
-            os.getenv("GOOGLE_CLIENT_SECRET")
-            if os.getenv("GOOGLE_CLIENT_SECRET")
-            and os.getenv("GOOGLE_CLIENT_SECRET") != "your-google-client-secret"
-            else None
-        ),
+        "client_id": _resolve("GOOGLE_CLIENT_ID", "your-google-client-id"),
+        "client_secret": _resolve("GOOGLE_CLIENT_SECRET", "your-google-client-secret"),
     },
     "jira": {
         "name": "Jira",
@@ -106,18 +94,8 @@ OAUTH_PROVIDERS = {
             "read:jira-user",
             "offline_access"
         ],
-        "client_id": (
-            os.getenv("JIRA_CLIENT_ID")
-            if os.getenv("JIRA_CLIENT_ID")
-            and os.getenv("JIRA_CLIENT_ID") != "your-jira-client-id"
-            else None
-        ),
-        "client_secret": (
-            os.getenv("JIRA_CLIENT_SECRET")
-            if os.getenv("JIRA_CLIENT_SECRET")
-            and os.getenv("JIRA_CLIENT_SECRET") != "your-jira-client-secret"
-            else None
-        ),
+        "client_id": _resolve("JIRA_CLIENT_ID", "your-jira-client-id"),
+        "client_secret": _resolve("JIRA_CLIENT_SECRET", "your-jira-client-secret"),
     },
     "notion": {
         "name": "Notion",
@@ -125,18 +103,8 @@ OAUTH_PROVIDERS = {
         "token_url": "https://api.notion.com/v1/oauth/token",
         "user_url": "https://api.notion.com/v1/users/me",
         "scopes": [],  # Notion doesn't use scopes in the same way
-        "client_id": (
-            os.getenv("NOTION_CLIENT_ID")
-            if os.getenv("NOTION_CLIENT_ID")
-            and os.getenv("NOTION_CLIENT_ID") != "your-notion-client-id"
-            else None
-        ),
-        "client_secret": (
-            os.getenv("NOTION_CLIENT_SECRET")
-            if os.getenv("NOTION_CLIENT_SECRET")
-            and os.getenv("NOTION_CLIENT_SECRET") != "your-notion-client-secret"
-            else None
-        ),
+        "client_id": _resolve("NOTION_CLIENT_ID", "your-notion-client-id"),
+        "client_secret": _resolve("NOTION_CLIENT_SECRET", "your-notion-client-secret"),
     },
     "zoom": {
         "name": "Zoom",
@@ -149,24 +117,104 @@ OAUTH_PROVIDERS = {
             "recording:read",
             "user:read"
         ],
-        "client_id": (
-            os.getenv("ZOOM_CLIENT_ID")
-            if os.getenv("ZOOM_CLIENT_ID")
-            and os.getenv("ZOOM_CLIENT_ID") != "your-zoom-client-id"
-            else None
-        ),
-        "client_secret": (
-            os.getenv("ZOOM_CLIENT_SECRET")
-            if os.getenv("ZOOM_CLIENT_SECRET")
-            and os.getenv("ZOOM_CLIENT_SECRET") != "your-zoom-client-secret"
-            else None
-        ),
+        "client_id": _resolve("ZOOM_CLIENT_ID", "your-zoom-client-id"),
+        "client_secret": _resolve("ZOOM_CLIENT_SECRET", "your-zoom-client-secret"),
     }
 }
 
+# Scope parameter per provider, joined once at import
+# Slack expects comma-separated user scopes, the others space-separated scopes
+_SCOPE_STRINGS = {
+    provider: ("," if provider == "slack" else " ").join(config["scopes"])
+    for provider, config in OAUTH_PROVIDERS.items()
+}
+
+
+def _auth_url_template(provider: str, config: dict) -> str:
+    """Return a provider's authorization URL with its constant query parameters."""
+    params = "response_type=code"
+
+    # Slack uses different parameter names and format
+    if provider == "slack":
+        params += f"&user_scope={quote_plus(_SCOPE_STRINGS[provider])}"
+    elif provider == "notion":
+        # Notion doesn't use traditional scopes parameter
+        pass
+    else:
+        params += f"&scope={quote_plus(_SCOPE_STRINGS[provider])}"
+
+    # Add Google-specific parameters
+    if provider in ["google", "google_docs"]:
+        # Request refresh token and force consent screen to get one
+        params += "&access_type=offline&prompt=consent"
+
+    return (
+        f"{config['auth_url']}?{params}"
+        "&client_id={client_id}&redirect_uri={redirect_uri}&state={state}"
+    )
+
+
+# Authorization URL per provider; client_id, redirect_uri and state are
+# filled in per request
+_AUTH_URL_TEMPLATES = {
+    provider: _auth_url_template(provider, config)
+    for provider, config in OAUTH_PROVIDERS.items()
+}
+
+# Public provider listing, pre-encoded; the configuration is fixed after process start
+_PROVIDERS_PUBLIC = [
+    {
+        "id": provider_id,
+        "name": config["name"],
+        "scopes": config["scopes"],
+        "configured": bool(config["client_id"] and config["client_secret"]),
+        "auth_url": config["auth_url"]
+    }
+    for provider_id, config in OAUTH_PROVIDERS.items()
+]
+_PROVIDERS_PUBLIC_JSON = orjson.dumps(_PROVIDERS_PUBLIC)
+_PROVIDERS_PUBLIC_ETAG = f'"{hashlib.sha256(_PROVIDERS_PUBLIC_JSON).hexdigest()[:32]}"'
+
+
+# Columns returned by the list endpoints; tokens, secrets and provider_data
+# are never loaded for listings, and relationships raise instead of lazy
+# loading one row at a time
+_CREDENTIAL_LIST_COLUMNS = (
+    OAuthCredential.id,
+    OAuthCredential.provider,
+    OAuthCredential.provider_user_id,
+    OAuthCredential.provider_username,
+    OAuthCredential.token_type,
+    OAuthCredential.scopes,
+    OAuthCredential.is_active,
+    OAuthCredential.expires_at,
+    OAuthCredential.created_at,
+)
+_CONFIG_LIST_COLUMNS = (
+    OAuthConfig.id,
+    OAuthConfig.provider,
+    OAuthConfig.client_id,
+    OAuthConfig.is_active,
+    OAuthConfig.created_at,
+)
+
+# Frontend base URL used in local development
+_LOCALHOST_DEV_BASE = "http://localhost:3001"
+
+# Provider callback URL, relative to the public base URL
+_CALLBACK_PATH = "{base_url}/api/v1/oauth/{tenant_slug}/callback/{provider}"
+
+
+# UUID primary keys are exposed as strings in OAuth responses
+UUIDStr = Annotated[
+    str, BeforeValidator(lambda v: str(v) if isinstance(v, UUID) else v)
+]
+
 
 class OAuthCredentialResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUIDStr
     provider: str
     provider_user_id: str
     provider_username: Optional[str]
@@ -176,16 +224,6 @@ class OAuthCredentialResponse(BaseModel):
     expires_at: Optional[datetime]
     created_at: datetime
 
-    @field_validator('id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
-    class Config:
-        from_attributes = True
-
 
 class OAuthConfigCreate(BaseModel):
     """Request model for creating OAuth configuration."""
@@ -196,21 +234,109 @@ class OAuthConfigCreate(BaseModel):
 
 class OAuthConfigResponse(BaseModel):
     """Response model for OAuth configuration."""
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUIDStr
     provider: str
     client_id: str
     is_active: bool
     created_at: datetime
 
-    @field_validator('id', mode='before')
-    @classmethod
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
 
-    class Config:
-        from_attributes = True
+def _compute_base_urls(request: Request) -> Tuple[str, str]:
+    """Return the base URLs for OAuth redirect URIs and for the frontend.
+
+    PUBLIC_URL (useful for ngrok/tunnels) takes precedence. Otherwise local
+    development requests go to the frontend on localhost:3001, and production
+    requests use the forwarded host headers. Both URLs are identical except
+    for the final fallback, where the frontend is assumed to run on port 3001
+    of the same host as the backend's port 8000.
+    """
+    public_url = os.getenv('PUBLIC_URL')
+    if public_url:
+        base_url = public_url.rstrip('/')
+        return base_url, base_url
+
+    base_url_str = str(request.base_url)
+    if 'localhost' in base_url_str and ':3001' not in base_url_str:
+        # Development mode - frontend is on localhost:3001
+        return _LOCALHOST_DEV_BASE, _LOCALHOST_DEV_BASE
+
+    # Check for forwarded headers (for production)
+    forwarded_host = request.headers.get('x-forwarded-host')
+    if forwarded_host:
+        forwarded_proto = request.headers.get('x-forwarded-proto', 'http')
+        base_url = f"{forwarded_proto}://{forwarded_host}"
+        return base_url, base_url
+
+    # Fallback to request base URL
+    base_url = base_url_str.rstrip('/')
+    return base_url, base_url.replace(':8000', ':3001')
+
+
+def _insert(session: AsyncSession, model):
+    """Return an INSERT supporting ON CONFLICT for the session's database dialect."""
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(model)
+    return pg_insert(model)
+
+
+async def _get_oauth_client(
+    session: AsyncSession, tenant_slug: str, provider: str
+) -> Tuple[UUID, str, str]:
+    """Resolve the tenant ID and OAuth client credentials for a provider.
+
+    The tenant's own active OAuth configuration is used if it has one,
+    otherwise the global provider configuration. Only the needed columns are
+    selected, in a single query.
+
+    Raises a 404 if the tenant does not exist and a 500 if no OAuth client is
+    configured for the provider.
+    """
+    result = await session.execute(
+        select(Tenant.id, OAuthConfig.client_id, OAuthConfig.client_secret)
+        .outerjoin(
+            OAuthConfig,
+            and_(
+                OAuthConfig.tenant_id == Tenant.id,
+                OAuthConfig.provider == provider,
+                OAuthConfig.is_active.is_(True)
+            )
+        )
+        .where(Tenant.slug == tenant_slug)
+    )
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Tenant not found")
+
+    tenant_id, client_id, client_secret = row
+
+    # Use tenant config if available, otherwise fall back to global config
+    if client_id is None:
+        provider_config = OAUTH_PROVIDERS[provider]
+        client_id = provider_config["client_id"]
+        client_secret = provider_config["client_secret"]
+    else:
+        client_secret = decrypt_secret(client_secret)
+        if client_secret is None:
+            raise HTTPException(
+                status_code=500,
+                detail=(
+                    f"OAuth client secret for {provider} could not be decrypted. "
+                    "Please configure OAuth credentials for this tenant again."
+                )
+            )
+
+    if not client_id or not client_secret:
+        raise HTTPException(
+            status_code=500,
+            detail=(
+                f"OAuth not configured for {provider}. "
+                "Please configure OAuth credentials for this tenant."
+            )
+        )
+
+    return tenant_id, client_id, client_secret
 
 
 @router.get("/{tenant_slug}/auth/{provider}")
@@ -238,46 +364,12 @@ async def initiate_oauth(
             detail=f"Unsupported provider: {provider}"
         )
 
-    # Verify tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
-
-    provider_config = OAUTH_PROVIDERS[provider]
-
-    # Check for tenant-specific OAuth configuration first
-    tenant_config_result = await session.execute(
-        select(OAuthConfig).where(
-            OAuthConfig.tenant_id == tenant.id,
-            OAuthConfig.provider == provider,
-            OAuthConfig.is_active.is_(True)
-        )
-    )
-    tenant_oauth_config = tenant_config_result.scalar_one_or_none()
-
-    # Use tenant config if available, otherwise fall back to global config
-    if tenant_oauth_config:
-        client_id = tenant_oauth_config.client_id
-        client_secret = tenant_oauth_config.client_secret
-    else:
-        client_id = provider_config["client_id"]
-        client_secret = provider_config["client_secret"]
-
-    if not client_id or not client_secret:
-        raise HTTPException(
-            status_code=500,
-            detail=(
-                f"OAuth not configured for {provider}. "
-                "Please configure OAuth credentials for this tenant."
-            )
-        )
+    # Verify tenant exists and resolve its OAuth client in one query
+    _, client_id, _ = await _get_oauth_client(session, tenant_slug, provider)
 
-    # Generate state parameter for CSRF protection
-    # Use custom state if provided (for CLI flows), otherwise generate new one
-    state = custom_state if custom_state else secrets.token_urlsafe(32)
+    # Generate a signed state parameter for CSRF protection
+    # Embed custom state if provided (for CLI flows), otherwise a random token
+    state = sign_state(tenant_slug, provider, custom_state)
 
     # Build redirect URI
     # Use custom redirect URI if provided (for CLI flows)
@@ -292,63 +384,20 @@ async def initiate_oauth(
         redirect_uri = custom_redirect_uri
     else:
         # Standard web flow redirect URI
-        # Check if PUBLIC_URL is set in environment (useful for ngrok/tunnels)
-        public_url = os.getenv('PUBLIC_URL')
-
-        if public_url:
-            base_url = public_url.rstrip('/')
-        else:
-            # For development, use localhost:3001 directly since we know the
-            # frontend port. In production, this would come from environment
-            # variables or proper proxy headers
-            base_url_str = str(request.base_url)
-            if 'localhost' in base_url_str and ':3001' not in base_url_str:
-                # Development mode - frontend is on localhost:3001
-                base_url = "http://localhost:3001"
-            else:
-                # Check for forwarded headers (for production)
-                forwarded_host = request.headers.get('x-forwarded-host')
-                forwarded_proto = request.headers.get('x-forwarded-proto', 'http')
-
-                if forwarded_host:
-                    base_url = f"{forwarded_proto}://{forwarded_host}"
-                else:
-                    # Fallback to request base URL
-                    base_url = str(request.base_url).rstrip('/')
-
-        redirect_uri = (
-            f"{base_url}/api/v1/oauth/{tenant_slug}/callback/{provider}"
+        base_url, _ = _compute_base_urls(request)
+        redirect_uri = _CALLBACK_PATH.format(
+            base_url=base_url, tenant_slug=tenant_slug, provider=provider
         )
 
-    print(f"DEBUG: Final redirect_uri = {redirect_uri}")
+    logger.debug("Final redirect_uri = %s", redirect_uri)
 
-    # Build authorization URL
-    params = {
-        "client_id": client_id,
-        "redirect_uri": redirect_uri,
-        "state": state,
-        "response_type": "code"
-    }
-
-    # Slack uses different parameter names and format
-    if provider == "slack":
-        params["user_scope"] = ",".join(provider_config["scopes"])  # Comma-separated for Slack
-    elif provider == "notion":
-        # Notion doesn't use traditional scopes parameter
-        pass
-    else:
-        params["scope"] = " ".join(provider_config["scopes"])  # Space-separated for others
-
-    # Add Google-specific parameters
-    if provider in ["google", "google_docs"]:
-        params["access_type"] = "offline"  # Request refresh token
-        params["prompt"] = "consent"  # Force consent screen to get refresh token
-
-    auth_url = (
-        f"{provider_config['auth_url']}?{urllib.parse.urlencode(params)}"
+    # Build authorization URL; only the per-request values need quoting
+    auth_url = _AUTH_URL_TEMPLATES[provider].format(
+        client_id=quote_plus(client_id),
+        redirect_uri=quote_plus(redirect_uri),
+        state=quote_plus(state)
     )
 
-    # Store state in session or cache (for now, we'll include it in the redirect)
     return RedirectResponse(url=auth_url)
 
 
@@ -366,13 +415,17 @@ async def oauth_callback(
             detail=f"Unsupported provider: {provider}"
         )
 
-    # Verify tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
+    # Verify the signed state before touching the database
+    state_param = verify_state(
+        request.query_params.get("state", ""), tenant_slug, provider
+    )
+    if state_param is None:
+        raise HTTPException(status_code=400, detail="Invalid or expired OAuth state")
+
+    # Verify tenant exists and resolve its OAuth client in one query
+    tenant_id, client_id, client_secret = await _get_oauth_client(
+        session, tenant_slug, provider
     )
-    tenant = tenant_result.scalar_one_or_none()
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Get query parameters
     params = dict(request.query_params)
@@ -399,60 +452,10 @@ async def oauth_callback(
     auth_code = params["code"]
     provider_config = OAUTH_PROVIDERS[provider]
 
-    # Check for tenant-specific OAuth configuration first
-    tenant_config_result = await session.execute(
-        select(OAuthConfig).where(
-            OAuthConfig.tenant_id == tenant.id,
-            OAuthConfig.provider == provider,
-            OAuthConfig.is_active.is_(True)
-        )
-    )
-    tenant_oauth_config = tenant_config_result.scalar_one_or_none()
-
-    # Use tenant config if available, otherwise fall back to global config
-    if tenant_oauth_config:
-        client_id = tenant_oauth_config.client_id
-        client_secret = tenant_oauth_config.client_secret
-    else:
-        client_id = provider_config["client_id"]
-        client_secret = provider_config["client_secret"]
-
-    if not client_id or not client_secret:
-        raise HTTPException(
-            status_code=500,
-            detail=(
-                f"OAuth not configured for {provider}. "
-                "Please configure OAuth credentials for this tenant."
-            )
-        )
-
     # Build redirect URI (must match the one used in initiate_oauth)
-    # Check if PUBLIC_URL is set in environment (useful for ngrok/tunnels)
-    public_url = os.getenv('PUBLIC_URL')
-
-    if public_url:
-        base_url = public_url.rstrip('/')
-    else:
-        # For development, use localhost:3001 directly since we know the
-        # frontend port. In production, this would come from environment
-        # variables or proper proxy headers
-        base_url_str = str(request.base_url)
-        if 'localhost' in base_url_str and ':3001' not in base_url_str:
-            # Development mode - frontend is on localhost:3001
-            base_url = "http://localhost:3001"
-        else:
-            # Check for forwarded headers (for production)
-            forwarded_host = request.headers.get('x-forwarded-host')
-            forwarded_proto = request.headers.get('x-forwarded-proto', 'http')
-
-            if forwarded_host:
-                base_url = f"{forwarded_proto}://{forwarded_host}"
-            else:
-                # Fallback to request base URL
-                base_url = str(request.base_url).rstrip('/')
-
-    redirect_uri = (
-        f"{base_url}/api/v1/oauth/{tenant_slug}/callback/{provider}"
+    base_url, frontend_url = _compute_base_urls(request)
+    redirect_uri = _CALLBACK_PATH.format(
+        base_url=base_url, tenant_slug=tenant_slug, provider=provider
     )
 
     # Exchange authorization code for access token
@@ -469,23 +472,26 @@ async def oauth_callback(
 
     headers = {"Accept": "application/json"}
 
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
-            provider_config["token_url"],
-            data=token_data,
-            headers=headers
-        )
+    # Reuse the shared, pooled client so provider connections are kept alive
+    client = get_http_client()
+    token_response = await client.post(
+        provider_config["token_url"],
+        data=token_data,
+        headers=headers
+    )
 
-        if token_response.status_code != 200:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    "Failed to exchange authorization code: "
-                    f"{token_response.text}"
-                )
+    try:
+        token_response.raise_for_status()
+    except httpx.HTTPStatusError:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Failed to exchange authorization code: "
+                f"{token_response.text}"
             )
+        )
 
-        token_info = token_response.json()
+    token_info = orjson.loads(token_response.content)
 
     access_token = token_info.get("access_token")
     if not access_token:
@@ -494,21 +500,22 @@ async def oauth_callback(
     # Get user information from provider
     user_headers = {"Authorization": f"Bearer {access_token}"}
 
-    async with httpx.AsyncClient() as client:
-        user_response = await client.get(
-            provider_config["user_url"],
-            headers=user_headers
-        )
+    user_response = await client.get(
+        provider_config["user_url"],
+        headers=user_headers
+    )
 
-        if user_response.status_code != 200:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    f"Failed to get user info: {user_response.text}"
-                )
+    try:
+        user_response.raise_for_status()
+    except httpx.HTTPStatusError:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Failed to get user info: {user_response.text}"
             )
+        )
 
-        user_info = user_response.json()
+    user_info = orjson.loads(user_response.content)
 
     # Extract user data based on provider
     if provider == "github":
@@ -548,52 +555,43 @@ async def oauth_callback(
             seconds=int(token_info["expires_in"])
         )
 
-    # Check if credential already exists for this tenant/provider/user
-    existing_cred = await session.execute(
-        select(OAuthCredential).where(
-            OAuthCredential.tenant_id == tenant.id,
-            OAuthCredential.provider == provider,
-            OAuthCredential.provider_user_id == provider_user_id
-        )
+    # Insert the credential, or refresh it if this account is already linked
+    stmt = _insert(session, OAuthCredential).values(
+        tenant_id=tenant_id,
+        provider=provider,
+        provider_user_id=provider_user_id,
+        provider_username=provider_username,
+        access_token=access_token,
+        refresh_token=token_info.get("refresh_token"),
+        token_type=token_info.get("token_type", "bearer"),
+        expires_at=expires_at,
+        scopes=token_info.get("scope"),
+        provider_data=user_info,
+        is_active=True
     )
-    existing = existing_cred.scalar_one_or_none()
-
-    if existing:
-        # Update existing credential
-        existing.access_token = access_token
-        existing.refresh_token = token_info.get("refresh_token")
-        existing.token_type = token_info.get("token_type", "bearer")
-        existing.expires_at = expires_at
-        existing.scopes = token_info.get("scope")
-        existing.provider_data = str(user_info)
-        existing.is_active = True
-        existing.updated_at = datetime.now(timezone.utc)
-    else:
-        # Create new credential
-        oauth_cred = OAuthCredential(
-            tenant_id=tenant.id,
-            provider=provider,
-            provider_user_id=provider_user_id,
-            provider_username=provider_username,
-            access_token=access_token,
-            refresh_token=token_info.get("refresh_token"),
-            token_type=token_info.get("token_type", "bearer"),
-            expires_at=expires_at,
-            scopes=token_info.get("scope"),
-            provider_data=str(user_info),
-            is_active=True
-        )
-        session.add(oauth_cred)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["tenant_id", "provider", "provider_user_id"],
+        set_={
+            "access_token": stmt.excluded.access_token,
+            "refresh_token": stmt.excluded.refresh_token,
+            "token_type": stmt.excluded.token_type,
+            "expires_at": stmt.excluded.expires_at,
+            "scopes": stmt.excluded.scopes,
+            "provider_data": stmt.excluded.provider_data,
+            "is_active": True,
+            "updated_at": func.now()
+        }
+    )
+    await session.execute(stmt)
 
     await session.commit()
 
     # Check if this is a CLI session by examining the state parameter
     # CLI sessions include a cli_session parameter in the state
-    state_param = params.get("state", "")
     cli_session_id = None
 
-    print(f"DEBUG: Callback received state parameter: '{state_param}'")
-    print(f"DEBUG: Full query params: {params}")
+    logger.debug("Callback received state parameter: %r", state_param)
+    logger.debug("Full query params: %s", params)
 
     # Try to extract cli_session from state parameter
     # State could be JSON encoded or contain cli_session directly
@@ -606,24 +604,29 @@ async def oauth_callback(
                 decoded = base64.urlsafe_b64decode(state_param + "==").decode()
                 state_data = json.loads(decoded)
                 cli_session_id = state_data.get("cli_session")
-                print(f"DEBUG: Extracted cli_session from JSON: {cli_session_id}")
+                logger.debug("Extracted cli_session from JSON: %s", cli_session_id)
             except Exception as e:
                 # Not base64/JSON, check if state itself contains cli-session prefix
-                print(f"DEBUG: Not base64/JSON (error: {e}), checking for cli-session prefix")
+                logger.debug(
+                    "Not base64/JSON (error: %s), checking for cli-session prefix", e
+                )
                 if state_param.startswith("cli-session-"):
                     cli_session_id = state_param
-                    print(f"DEBUG: Found CLI session ID: {cli_session_id}")
+                    logger.debug("Found CLI session ID: %s", cli_session_id)
                 else:
-                    print(f"DEBUG: State does not start with 'cli-session-': '{state_param[:50]}'")
+                    logger.debug(
+                        "State does not start with 'cli-session-': %r",
+                        state_param[:50],
+                    )
         except Exception as e:
-            print(f"DEBUG: Outer exception: {e}")
+            logger.debug("Outer exception: %s", e)
             pass
 
     # If this is a CLI session, store the result for polling
     if cli_session_id:
         from sage_mcp.utils.cli_session_storage import cli_session_storage
 
-        print(f"DEBUG: Storing CLI session result for session ID: {cli_session_id}")
+        logger.debug("Storing CLI session result for session ID: %s", cli_session_id)
 
         # Store successful OAuth result
         session_data = {
@@ -637,7 +640,7 @@ async def oauth_callback(
             "tenant_slug": tenant_slug
         }
         cli_session_storage.store(cli_session_id, session_data)
-        print(f"DEBUG: Successfully stored session data: {session_data}")
+        logger.debug("Successfully stored session data: %s", session_data)
 
         # For CLI sessions, return simple success page instead of redirecting to frontend
         html = f"""
@@ -664,35 +667,14 @@ async def oauth_callback(
         from fastapi.responses import HTMLResponse
         return HTMLResponse(content=html)
     else:
-        print("DEBUG: Not a CLI session (cli_session_id is None)")
+        logger.debug("Not a CLI session (cli_session_id is None)")
 
     # Standard web flow: Redirect to frontend with success message
-    # Use same logic as redirect URI generation for consistency
-    public_url = os.getenv('PUBLIC_URL')
-
-    if public_url:
-        frontend_url = public_url.rstrip('/')
-    else:
-        base_url_str = str(request.base_url)
-        if 'localhost' in base_url_str and ':3001' not in base_url_str:
-            # Development mode - frontend is on localhost:3001
-            frontend_url = "http://localhost:3001"
-        else:
-            # Check for forwarded headers (for production)
-            forwarded_host = request.headers.get('x-forwarded-host')
-            forwarded_proto = request.headers.get('x-forwarded-proto', 'http')
-
-            if forwarded_host:
-                frontend_url = f"{forwarded_proto}://{forwarded_host}"
-            else:
-                # Fallback to request base URL, try to replace 8000 with 3001
-                frontend_url = base_url_str.rstrip('/').replace(':8000', ':3001')
-
     success_url = (
         f"{frontend_url}/oauth/success?provider={provider}&"
         f"tenant={tenant_slug}"
     )
-    print(f"DEBUG: OAuth success redirect URL = {success_url}")
+    logger.debug("OAuth success redirect URL = %s", success_url)
 
     return RedirectResponse(url=success_url)
 
@@ -705,24 +687,24 @@ async def revoke_oauth(
 ):
     """Revoke OAuth credentials for a provider."""
     # Verify tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
-    if not tenant:
+    tenant_id = await get_tenant_id(session, tenant_slug)
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Delete OAuth credentials for this tenant and provider
     result = await session.execute(
-        delete(OAuthCredential).where(
-            OAuthCredential.tenant_id == tenant.id,
+        delete(OAuthCredential)
+        .where(
+            OAuthCredential.tenant_id == tenant_id,
             OAuthCredential.provider == provider
         )
+        .returning(OAuthCredential.id)
     )
+    revoked_ids = result.scalars().all()
 
     await session.commit()
 
-    if result.rowcount == 0:
+    if not revoked_ids:
         raise HTTPException(
             status_code=404,
             detail=f"No OAuth credentials found for {provider}"
@@ -732,7 +714,7 @@ async def revoke_oauth(
         "message": f"OAuth credentials revoked for {provider}",
         "tenant": tenant_slug,
         "provider": provider,
-        "revoked_count": result.rowcount
+        "revoked_count": len(revoked_ids)
     }
 
 
@@ -745,65 +727,58 @@ async def list_oauth_credentials(
     session: AsyncSession = Depends(get_db_session)
 ):
     """List OAuth credentials for a tenant."""
-    # Verify tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
+    # Get OAuth credentials together with the tenant existence check
+    result = await session.execute(
+        select(Tenant.id, OAuthCredential)
+        .outerjoin(OAuthCredential, OAuthCredential.tenant_id == Tenant.id)
+        .options(load_only(*_CREDENTIAL_LIST_COLUMNS), raiseload("*"))
+        .where(Tenant.slug == tenant_slug)
     )
-    tenant = tenant_result.scalar_one_or_none()
-    if not tenant:
+    rows = result.all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    # Get OAuth credentials for this tenant
-    credentials_result = await session.execute(
-        select(OAuthCredential).where(
-            OAuthCredential.tenant_id == tenant.id
-        )
-    )
-    credentials = credentials_result.scalars().all()
-
-    return list(credentials)
+    return [credential for _, credential in rows if credential is not None]
 
 
 @router.get("/providers")
-async def list_oauth_providers():
+async def list_oauth_providers(request: Request):
     """List available OAuth providers and their configuration status."""
-    providers = []
-    for provider_id, config in OAUTH_PROVIDERS.items():
-        providers.append({
-            "id": provider_id,
-            "name": config["name"],
-            "scopes": config["scopes"],
-            "configured": bool(config["client_id"] and config["client_secret"]),
-            "auth_url": config["auth_url"]
-        })
-
-    return providers
+    headers = {"ETag": _PROVIDERS_PUBLIC_ETAG}
+    if request.headers.get("if-none-match") == _PROVIDERS_PUBLIC_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=_PROVIDERS_PUBLIC_JSON, media_type="application/json", headers=headers
+    )
 
 
-@router.get("/{tenant_slug}/config")
+@router.get(
+    "/{tenant_slug}/config",
+    response_model=List[OAuthConfigResponse]
+)
 async def list_oauth_configs(
     tenant_slug: str,
     session: AsyncSession = Depends(get_db_session)
 ):
     """List OAuth configurations for a tenant."""
-    # Verify tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
+    # Get OAuth configurations together with the tenant existence check
+    result = await session.execute(
+        select(Tenant.id, OAuthConfig)
+        .outerjoin(OAuthConfig, OAuthConfig.tenant_id == Tenant.id)
+        .options(load_only(*_CONFIG_LIST_COLUMNS), raiseload("*"))
+        .where(Tenant.slug == tenant_slug)
     )
-    tenant = tenant_result.scalar_one_or_none()
-    if not tenant:
+    rows = result.all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    # Get OAuth configurations
-    configs_result = await session.execute(
-        select(OAuthConfig).where(OAuthConfig.tenant_id == tenant.id)
-    )
-    configs = configs_result.scalars().all()
-
-    return list(configs)
+    return [config for _, config in rows if config is not None]
 
 
-@router.post("/{tenant_slug}/config")
+@router.post(
+    "/{tenant_slug}/config",
+    response_model=OAuthConfigResponse
+)
 async def create_oauth_config(
     tenant_slug: str,
     config_data: OAuthConfigCreate,
@@ -811,11 +786,8 @@ async def create_oauth_config(
 ):
     """Create or update OAuth configuration for a tenant."""
     # Verify tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
-    if not tenant:
+    tenant_id = await get_tenant_id(session, tenant_slug)
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Validate provider
@@ -825,35 +797,30 @@ async def create_oauth_config(
             detail=f"Unsupported provider: {config_data.provider}"
         )
 
-    # Check if configuration already exists
-    existing_config = await session.execute(
-        select(OAuthConfig).where(
-            OAuthConfig.tenant_id == tenant.id,
-            OAuthConfig.provider == config_data.provider
-        )
+    # Create the configuration, or replace the existing one for this provider
+    stmt = _insert(session, OAuthConfig).values(
+        tenant_id=tenant_id,
+        provider=config_data.provider,
+        client_id=config_data.client_id,
+        client_secret=encrypt_secret(config_data.client_secret),
+        is_active=True
     )
-    existing = existing_config.scalar_one_or_none()
-
-    if existing:
-        # Update existing configuration
-        existing.client_id = config_data.client_id
-        existing.client_secret = config_data.client_secret
-        existing.is_active = True
-        await session.commit()
-        await session.refresh(existing)
-        return existing
-    else:
-        # Create new configuration
-        new_config = OAuthConfig(
-            tenant_id=tenant.id,
-            provider=config_data.provider,
-            client_id=config_data.client_id,
-            client_secret=config_data.client_secret
-        )
-        session.add(new_config)
-        await session.commit()
-        await session.refresh(new_config)
-        return new_config
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["tenant_id", "provider"],
+        set_={
+            "client_id": stmt.excluded.client_id,
+            "client_secret": stmt.excluded.client_secret,
+            "is_active": True,
+            "updated_at": func.now()
+        }
+    ).returning(OAuthConfig)
+
+    result = await session.execute(
+        stmt, execution_options={"populate_existing": True}
+    )
+    config = result.scalar_one()
+    await session.commit()
+    return config
 
 
 @router.delete("/{tenant_slug}/config/{provider}")
@@ -864,29 +831,27 @@ async def delete_oauth_config(
 ):
     """Delete OAuth configuration for a tenant and provider."""
     # Verify tenant exists
-    tenant_result = await session.execute(
-        select(Tenant).where(Tenant.slug == tenant_slug)
-    )
-    tenant = tenant_result.scalar_one_or_none()
-    if not tenant:
+    tenant_id = await get_tenant_id(session, tenant_slug)
+    if not tenant_id:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
-    # Find and delete configuration
-    config_result = await session.execute(
-        select(OAuthConfig).where(
-            OAuthConfig.tenant_id == tenant.id,
+    # Delete the configuration in a single statement
+    result = await session.execute(
+        delete(OAuthConfig)
+        .where(
+            OAuthConfig.tenant_id == tenant_id,
             OAuthConfig.provider == provider
         )
+        .returning(OAuthConfig.id)
     )
-    config = config_result.scalar_one_or_none()
+    deleted_id = result.scalar_one_or_none()
 
-    if not config:
+    if not deleted_id:
         raise HTTPException(
             status_code=404,
             detail="OAuth configuration not found"
         )
 
-    await session.delete(config)
     await session.commit()
 
     return {
@@ -915,20 +880,20 @@ async def get_cli_session_result(session_id: str):
     """
     from sage_mcp.utils.cli_session_storage import cli_session_storage
 
-    print(f"DEBUG: Polling for CLI session ID: {session_id}")
+    logger.debug("Polling for CLI session ID: %s", session_id)
 
     # Get storage stats for debugging
-    stats = cli_session_storage.get_stats()
-    print(f"DEBUG: Session storage stats: {stats}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Session storage stats: %s", cli_session_storage.get_stats())
 
     result = cli_session_storage.get(session_id, delete_after_read=True)
 
     if not result:
-        print(f"DEBUG: Session not found or expired: {session_id}")
+        logger.debug("Session not found or expired: %s", session_id)
         raise HTTPException(
             status_code=404,
             detail="Session not found or expired. It may have already been retrieved or timed out after 5 minutes."
         )
 
-    print(f"DEBUG: Found session result: {result}")
+    logger.debug("Found session result: %s", result)
     return result
@@ -10,6 +10,9 @@ from .oauth import router as oauth_router
 router = APIRouter()
 
 # Include sub-routers
+# Starlette matches routes in registration order, so the MCP routes (the hot
+# path) go first. Their paths always end in /mcp, /mcp/sse or /mcp/info and
+# cannot shadow the /admin and /oauth routes registered after them.
+router.include_router(mcp_router, prefix="", tags=["mcp"])  # MCP routes at root level
 router.include_router(admin_router, prefix="/admin", tags=["admin"])
 router.include_router(oauth_router, prefix="/oauth", tags=["oauth"])
-router.include_router(mcp_router, prefix="", tags=["mcp"])  # MCP routes at root level
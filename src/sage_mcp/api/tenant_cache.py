@@ -0,0 +1,55 @@
+"""In-process cache mapping tenant slugs to tenant IDs.
+
+Most admin endpoints only need ``tenant.id`` to scope their queries, so the
+slug lookup is cached for a short time instead of re-selecting the tenant on
+every request. Entries are dropped when a tenant is updated or deleted.
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.tenant import Tenant
+
+TENANT_ID_TTL_SECONDS = 60.0
+MAX_CACHED_TENANTS = 1024
+
+# slug -> (tenant_id, expires_at)
+_tenant_ids: Dict[str, Tuple[UUID, float]] = {}
+
+
+async def get_tenant_id(session: AsyncSession, tenant_slug: str) -> Optional[UUID]:
+    """Resolve a tenant slug to its ID, or ``None`` if the tenant does not exist."""
+    now = time.monotonic()
+    entry = _tenant_ids.get(tenant_slug)
+    if entry and entry[1] > now:
+        return entry[0]
+
+    result = await session.execute(
+        select(Tenant.id).where(Tenant.slug == tenant_slug)
+    )
+    tenant_id = result.scalar_one_or_none()
+
+    if tenant_id is None:
+        _tenant_ids.pop(tenant_slug, None)
+        return None
+
+    if tenant_slug not in _tenant_ids and len(_tenant_ids) >= MAX_CACHED_TENANTS:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _tenant_ids.pop(next(iter(_tenant_ids)))
+    _tenant_ids[tenant_slug] = (tenant_id, now + TENANT_ID_TTL_SECONDS)
+
+    return tenant_id
+
+
+def invalidate_tenant(tenant_slug: str) -> None:
+    """Drop the cached ID for a tenant after it has been modified or deleted."""
+    _tenant_ids.pop(tenant_slug, None)
+
+
+def clear_tenant_cache() -> None:
+    """Drop all cached tenant IDs."""
+    _tenant_ids.clear()
@@ -1,14 +1,34 @@
 """HTTP client for SageMCP API."""
 
-import sys
-from typing import Any, Dict, List, Optional
+import atexit
+import hashlib
+import io
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-import httpx
-from rich.console import Console
+import orjson
 
-from sage_mcp.cli.config import ProfileConfig
+from sage_mcp.cli.config import ProfileConfig, config_manager
+from sage_mcp.cli.utils.cache import response_cache
 
-console = Console()
+# httpx and ijson are imported where they are first used, so commands that
+# never reach the API (e.g. ``sagemcp config list``) don't pay for them
+if TYPE_CHECKING:
+    import httpx
+
+# Connection pool limits of the sync and async clients (httpx.Limits kwargs)
+HTTP_LIMITS = {"max_keepalive_connections": 10, "max_connections": 20}
+ASYNC_HTTP_LIMITS = {"max_keepalive_connections": 20, "max_connections": 50}
+
+# Seconds cached responses are used without contacting the server
+DETAIL_CACHE_TTL = 60
+PROVIDERS_CACHE_TTL = 300
+CREDENTIALS_CACHE_TTL = 30
+
+
+# Exit codes of CLI commands failing with an API error
+EXIT_CLIENT_ERROR = 3
+EXIT_SERVER_ERROR = 4
 
 
 class APIError(Exception):
@@ -17,11 +37,78 @@ class APIError(Exception):
     def __init__(self, message: str, status_code: Optional[int] = None):
         self.message = message
         self.status_code = status_code
+        # Errors without a status (e.g. connection failures) count as server errors
+        self.cli_exit_code = (
+            EXIT_CLIENT_ERROR
+            if status_code and status_code < 500
+            else EXIT_SERVER_ERROR
+        )
         super().__init__(message)
 
 
-class SageMCPClient:
-    """HTTP client for SageMCP API."""
+class _ChunkReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _jsonrpc_request(
+    method: str, params: Optional[Dict[str, Any]] = None, request_id: int = 1
+) -> Dict[str, Any]:
+    """Build a JSON-RPC 2.0 request envelope.
+
+    ``params`` is always present (empty when not given), which MCP servers
+    accept, so the envelope is a single literal with no conditional insert.
+    """
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": method,
+        "params": params or {},
+    }
+
+
+def _first_resource_text(stream: io.RawIOBase) -> str:
+    """Extract the text of the first content item from a resources/read response.
+
+    Parsing stops as soon as the first content item has been read.
+
+    Raises:
+        APIError: If the response carries a JSON-RPC error
+    """
+    import ijson
+
+    error_message = None
+    for prefix, event, value in ijson.parse(stream):
+        if prefix == "result.contents.item.text" and event == "string":
+            return value
+        if prefix == "result.contents.item" and event == "end_map":
+            return ""
+        if prefix == "error.message" and event == "string":
+            error_message = value
+        elif prefix == "error" and event == "end_map":
+            raise APIError(error_message or "Resource read failed")
+    return ""
+
+
+class _BaseClient:
+    """Configuration and response handling shared by the sync and async clients."""
 
     def __init__(self, config: ProfileConfig):
         """Initialize API client.
@@ -34,18 +121,23 @@ class SageMCPClient:
         self.timeout = config.timeout
         self.api_key = config.api_key
 
+        # Request headers depend only on the profile, so build them once
+        self._headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+
+        # Profiles with different API keys must not share cached responses
+        self._cache_scope = hashlib.sha256((self.api_key or "").encode()).hexdigest()
+
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers.
 
         Returns:
             Dictionary of headers
         """
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
+        return self._headers
 
-    def _handle_response(self, response: httpx.Response) -> Any:
+    def _handle_response(self, response: "httpx.Response") -> Any:
         """Handle API response.
 
         Args:
@@ -57,14 +149,16 @@ class SageMCPClient:
         Raises:
             APIError: On API errors
         """
+        import httpx
+
         try:
             response.raise_for_status()
             if response.status_code == 204:
                 return None
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             try:
-                error_data = e.response.json()
+                error_data = orjson.loads(e.response.content)
                 message = error_data.get("detail", str(e))
             except Exception:
                 message = str(e)
@@ -72,23 +166,101 @@ class SageMCPClient:
         except Exception as e:
             raise APIError(f"Request failed: {e}")
 
+
+class SageMCPClient(_BaseClient):
+    """HTTP client for SageMCP API."""
+
+    def __init__(self, config: ProfileConfig):
+        """Initialize API client.
+
+        Args:
+            config: Profile configuration
+        """
+        super().__init__(config)
+        self._client: Optional["httpx.Client"] = None
+        self._ping_result: Optional[bool] = None
+
+    @property
+    def _http(self) -> "httpx.Client":
+        """Pooled HTTP client, created on first use and reused for all requests."""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.Client(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                headers=self._get_headers(),
+                limits=httpx.Limits(**HTTP_LIMITS),
+            )
+            # Release the pool when one-shot CLI commands exit
+            atexit.register(self.close)
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> "SageMCPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _cached_get(self, path: str, ttl: float) -> Any:
+        """GET a read-mostly resource through the on-disk response cache.
+
+        Fresh entries are returned without a request. Expired entries are
+        revalidated with their ETag, and a 304 response renews them.
+
+        Args:
+            path: Request path
+            ttl: Seconds a response stays fresh
+
+        Returns:
+            Response data
+        """
+        key = f"{self.base_url}{path}"
+        entry = response_cache.get(key, self._cache_scope)
+        if entry and response_cache.is_fresh(entry):
+            return entry["data"]
+
+        headers = None
+        if entry and entry.get("etag"):
+            headers = {"If-None-Match": entry["etag"]}
+        response = self._http.get(path, headers=headers)
+
+        if entry and response.status_code == 304:
+            response_cache.set(
+                key, entry["data"], ttl, entry["etag"], self._cache_scope
+            )
+            return entry["data"]
+
+        data = self._handle_response(response)
+        etag = response.headers.get("etag")
+        response_cache.set(key, data, ttl, etag, self._cache_scope)
+        return data
+
+    def _invalidate(self, path: str) -> None:
+        """Drop cached responses for a resource and everything below it.
+
+        Entries of all profiles are dropped, since they see the same server state.
+        """
+        response_cache.invalidate(f"{self.base_url}{path}")
+
     # Tenant operations
     def list_tenants(self) -> List[Dict[str, Any]]:
         """List all tenants."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/admin/tenants", headers=self._get_headers()
-            )
-            return self._handle_response(response)
+        response = self._http.get("/api/v1/admin/tenants")
+        return self._handle_response(response)
 
     def get_tenant(self, tenant_slug: str) -> Dict[str, Any]:
         """Get tenant details."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        return self._cached_get(
+            f"/api/v1/admin/tenants/{tenant_slug}", DETAIL_CACHE_TTL
+        )
 
     def create_tenant(
         self,
@@ -104,13 +276,10 @@ class SageMCPClient:
         if contact_email:
             data["contact_email"] = contact_email
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                f"{self.base_url}/api/v1/admin/tenants",
-                json=data,
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.post(
+            "/api/v1/admin/tenants", content=orjson.dumps(data)
+        )
+        return self._handle_response(response)
 
     def update_tenant(
         self,
@@ -119,54 +288,49 @@ class SageMCPClient:
         description: Optional[str] = None,
         contact_email: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Update tenant."""
-        # Get current tenant data
-        current = self.get_tenant(tenant_slug)
-
-        data = {
-            "slug": current["slug"],
-            "name": name or current["name"],
-        }
+        """Update tenant, sending only the fields that change."""
+        data = {}
+        if name:
+            data["name"] = name
         if description is not None:
             data["description"] = description
         if contact_email is not None:
             data["contact_email"] = contact_email
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.put(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}",
-                json=data,
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.patch(
+            f"/api/v1/admin/tenants/{tenant_slug}", content=orjson.dumps(data)
+        )
+        self._invalidate(f"/api/v1/admin/tenants/{tenant_slug}")
+        return self._handle_response(response)
 
     def delete_tenant(self, tenant_slug: str) -> Dict[str, Any]:
         """Delete tenant."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.delete(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.delete(f"/api/v1/admin/tenants/{tenant_slug}")
+        self._invalidate(f"/api/v1/admin/tenants/{tenant_slug}")
+        return self._handle_response(response)
 
     # Connector operations
-    def list_connectors(self, tenant_slug: str) -> List[Dict[str, Any]]:
-        """List connectors for a tenant."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}/connectors",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+    def list_connectors(
+        self, tenant_slug: str, include: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """List connectors for a tenant.
+
+        Args:
+            tenant_slug: Tenant slug
+            include: Related data to embed in each connector (e.g. ``["status"]``)
+        """
+        params = {"include": ",".join(include)} if include else None
+        response = self._http.get(
+            f"/api/v1/admin/tenants/{tenant_slug}/connectors", params=params
+        )
+        return self._handle_response(response)
 
     def get_connector(self, tenant_slug: str, connector_id: str) -> Dict[str, Any]:
         """Get connector details."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        return self._cached_get(
+            f"/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}",
+            DETAIL_CACHE_TTL,
+        )
 
     def create_connector(
         self,
@@ -183,13 +347,11 @@ class SageMCPClient:
         if configuration:
             data["configuration"] = configuration
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}/connectors",
-                json=data,
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.post(
+            f"/api/v1/admin/tenants/{tenant_slug}/connectors",
+            content=orjson.dumps(data),
+        )
+        return self._handle_response(response)
 
     def update_connector(
         self,
@@ -199,44 +361,37 @@ class SageMCPClient:
         description: Optional[str] = None,
         configuration: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Update connector."""
-        # Get current connector data
-        current = self.get_connector(tenant_slug, connector_id)
+        """Update connector, sending only the fields that change.
 
-        data = {
-            "connector_type": current["connector_type"],
-            "name": name or current["name"],
-        }
+        Configuration keys are merged into the stored configuration by the
+        server; a None value removes a key.
+        """
+        data = {}
+        if name:
+            data["name"] = name
         if description is not None:
             data["description"] = description
         if configuration is not None:
             data["configuration"] = configuration
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.put(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}",
-                json=data,
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        path = f"/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}"
+        response = self._http.patch(path, content=orjson.dumps(data))
+        self._invalidate(path)
+        return self._handle_response(response)
 
     def delete_connector(self, tenant_slug: str, connector_id: str) -> Dict[str, Any]:
         """Delete connector."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.delete(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        path = f"/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}"
+        response = self._http.delete(path)
+        self._invalidate(path)
+        return self._handle_response(response)
 
     def toggle_connector(self, tenant_slug: str, connector_id: str) -> Dict[str, Any]:
         """Toggle connector enabled status."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.patch(
-                f"{self.base_url}/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}/toggle",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        path = f"/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}"
+        response = self._http.patch(f"{path}/toggle")
+        self._invalidate(path)
+        return self._handle_response(response)
 
     def get_available_connector_types(self) -> List[str]:
         """Get list of available connector types.
@@ -249,31 +404,40 @@ class SageMCPClient:
         return [p["id"] for p in providers]
 
     # OAuth operations
-    def list_oauth_providers(self) -> List[Dict[str, Any]]:
-        """List available OAuth providers."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/oauth/providers", headers=self._get_headers()
-            )
-            return self._handle_response(response)
+    def list_oauth_providers(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """List available OAuth providers.
 
-    def list_oauth_credentials(self, tenant_slug: str) -> List[Dict[str, Any]]:
-        """List OAuth credentials for a tenant."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/oauth/{tenant_slug}/auth",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        Args:
+            refresh: Bypass the response cache
+        """
+        path = "/api/v1/oauth/providers"
+        if refresh:
+            self._invalidate(path)
+        return self._cached_get(path, PROVIDERS_CACHE_TTL)
+
+    def list_oauth_credentials(
+        self, tenant_slug: str, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List OAuth credentials for a tenant.
+
+        Args:
+            tenant_slug: Tenant slug
+            refresh: Bypass the response cache
+        """
+        path = f"/api/v1/oauth/{tenant_slug}/auth"
+        if refresh:
+            self._invalidate(path)
+        return self._cached_get(path, CREDENTIALS_CACHE_TTL)
+
+    def invalidate_oauth_credentials(self, tenant_slug: str) -> None:
+        """Drop cached OAuth credentials of a tenant after they changed."""
+        self._invalidate(f"/api/v1/oauth/{tenant_slug}/auth")
 
     def revoke_oauth_credential(self, tenant_slug: str, provider: str) -> Dict[str, Any]:
         """Revoke OAuth credentials."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.delete(
-                f"{self.base_url}/api/v1/oauth/{tenant_slug}/auth/{provider}",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.delete(f"/api/v1/oauth/{tenant_slug}/auth/{provider}")
+        self.invalidate_oauth_credentials(tenant_slug)
+        return self._handle_response(response)
 
     def list_oauth_configs(self, tenant_slug: str) -> List[Dict[str, Any]]:
         """List OAuth configurations for a tenant.
@@ -284,12 +448,8 @@ class SageMCPClient:
         Returns:
             List of OAuth configurations
         """
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/oauth/{tenant_slug}/config",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.get(f"/api/v1/oauth/{tenant_slug}/config")
+        return self._handle_response(response)
 
     def create_oauth_config(
         self,
@@ -315,13 +475,10 @@ class SageMCPClient:
             "client_secret": client_secret
         }
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                f"{self.base_url}/api/v1/oauth/{tenant_slug}/config",
-                json=data,
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.post(
+            f"/api/v1/oauth/{tenant_slug}/config", content=orjson.dumps(data)
+        )
+        return self._handle_response(response)
 
     def delete_oauth_config(self, tenant_slug: str, provider: str) -> Dict[str, Any]:
         """Delete OAuth configuration for a tenant.
@@ -333,12 +490,8 @@ class SageMCPClient:
         Returns:
             Deletion confirmation
         """
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.delete(
-                f"{self.base_url}/api/v1/oauth/{tenant_slug}/config/{provider}",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.delete(f"/api/v1/oauth/{tenant_slug}/config/{provider}")
+        return self._handle_response(response)
 
     def get_oauth_auth_url(
         self,
@@ -372,60 +525,6 @@ class SageMCPClient:
 
         return url
 
-    def exchange_oauth_code(
-        self,
-        tenant_slug: str,
-        provider: str,
-        code: str,
-        redirect_uri: str
-    ) -> Dict[str, Any]:
-        """Exchange OAuth authorization code for access token.
-
-        This method directly calls the OAuth callback endpoint to complete
-        the token exchange process.
-
-        Args:
-            tenant_slug: Tenant slug
-            provider: OAuth provider
-            code: Authorization code from OAuth callback
-            redirect_uri: Redirect URI used in the initial request
-
-        Returns:
-            OAuth credential data
-
-        Raises:
-            APIError: On API errors
-        """
-        # Call the callback endpoint with the code
-        url = f"{self.base_url}/api/v1/oauth/{tenant_slug}/callback/{provider}"
-
-        # Build query parameters as they would come from OAuth provider
-        params = {
-            "code": code,
-            "state": "cli-flow"  # We'll validate this on the server side if needed
-        }
-
-        with httpx.Client(timeout=self.timeout, follow_redirects=False) as client:
-            response = client.get(
-                url,
-                params=params,
-                headers=self._get_headers()
-            )
-
-            # The callback endpoint returns a redirect, but we want to check
-            # that it succeeded (status 302 or 200)
-            if response.status_code in [200, 302, 303, 307, 308]:
-                # OAuth flow completed successfully
-                # Now fetch the credential to return to user
-                return self.get_oauth_credential(tenant_slug, provider)
-            else:
-                try:
-                    error_data = response.json()
-                    message = error_data.get("detail", str(response.text))
-                except Exception:
-                    message = f"OAuth exchange failed: {response.text}"
-                raise APIError(message, response.status_code)
-
     def get_oauth_credential(self, tenant_slug: str, provider: str) -> Dict[str, Any]:
         """Get OAuth credential for a specific provider.
 
@@ -439,22 +538,18 @@ class SageMCPClient:
         Raises:
             APIError: On API errors
         """
-        with httpx.Client(timeout=self.timeout) as client:
-            # List all credentials and filter by provider
-            response = client.get(
-                f"{self.base_url}/api/v1/oauth/{tenant_slug}/auth",
-                headers=self._get_headers()
-            )
-
-            if response.status_code == 200:
-                credentials = response.json()
-                # Find credential for this provider
-                for cred in credentials:
-                    if cred.get("provider") == provider:
-                        return cred
-                raise APIError(f"No OAuth credential found for provider: {provider}", 404)
-            else:
-                return self._handle_response(response)
+        # List all credentials and filter by provider
+        response = self._http.get(f"/api/v1/oauth/{tenant_slug}/auth")
+
+        if response.status_code == 200:
+            credentials = orjson.loads(response.content)
+            # Find credential for this provider
+            for cred in credentials:
+                if cred.get("provider") == provider:
+                    return cred
+            raise APIError(f"No OAuth credential found for provider: {provider}", 404)
+        else:
+            return self._handle_response(response)
 
     def get_cli_session_result(self, session_id: str) -> Dict[str, Any]:
         """Get CLI OAuth session result.
@@ -470,22 +565,16 @@ class SageMCPClient:
         Raises:
             APIError: On API errors (404 if session not found/ready)
         """
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/oauth/cli-sessions/{session_id}",
-                headers=self._get_headers()
-            )
-            return self._handle_response(response)
+        response = self._http.get(f"/api/v1/oauth/cli-sessions/{session_id}")
+        return self._handle_response(response)
 
     # MCP operations
     def get_mcp_info(self, tenant_slug: str, connector_id: str) -> Dict[str, Any]:
         """Get MCP server info."""
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(
-                f"{self.base_url}/api/v1/{tenant_slug}/connectors/{connector_id}/mcp/info",
-                headers=self._get_headers(),
-            )
-            return self._handle_response(response)
+        response = self._http.get(
+            f"/api/v1/{tenant_slug}/connectors/{connector_id}/mcp/info"
+        )
+        return self._handle_response(response)
 
     def mcp_request(
         self,
@@ -496,20 +585,58 @@ class SageMCPClient:
         request_id: int = 1,
     ) -> Dict[str, Any]:
         """Send MCP JSON-RPC request."""
-        data = {"jsonrpc": "2.0", "id": request_id, "method": method}
-        if params:
-            data["params"] = params
+        data = _jsonrpc_request(method, params, request_id)
 
-        headers = self._get_headers()
-        headers["Accept"] = "application/json"
+        response = self._http.post(
+            f"/api/v1/{tenant_slug}/connectors/{connector_id}/mcp",
+            content=orjson.dumps(data),
+            headers={"Accept": "application/json"},
+        )
+        return self._handle_response(response)
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                f"{self.base_url}/api/v1/{tenant_slug}/connectors/{connector_id}/mcp",
-                json=data,
-                headers=headers,
-            )
-            return self._handle_response(response)
+    def mcp_batch(
+        self,
+        tenant_slug: str,
+        connector_id: str,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """Send several MCP JSON-RPC requests in one batch.
+
+        Args:
+            tenant_slug: Tenant slug
+            connector_id: Connector ID
+            calls: Method and optional params of each request
+
+        Returns:
+            Responses in the order of ``calls``
+        """
+        batch = [
+            _jsonrpc_request(method, params, request_id)
+            for request_id, (method, params) in enumerate(calls, start=1)
+        ]
+
+        response = self._http.post(
+            f"/api/v1/{tenant_slug}/connectors/{connector_id}/mcp",
+            content=orjson.dumps(batch),
+            headers={"Accept": "application/json"},
+        )
+        by_id = {item.get("id"): item for item in self._handle_response(response)}
+        return [by_id.get(request_id, {}) for request_id in range(1, len(calls) + 1)]
+
+    def list_mcp_catalog(
+        self, tenant_slug: str, connector_id: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """List MCP tools and resources with a single batch request.
+
+        Returns:
+            Tuple of tools and resources
+        """
+        tools_response, resources_response = self.mcp_batch(
+            tenant_slug, connector_id, [("tools/list", None), ("resources/list", None)]
+        )
+        tools = tools_response.get("result", {}).get("tools", [])
+        resources = resources_response.get("result", {}).get("resources", [])
+        return tools, resources
 
     def list_mcp_tools(self, tenant_slug: str, connector_id: str) -> List[Dict[str, Any]]:
         """List MCP tools."""
@@ -543,23 +670,193 @@ class SageMCPClient:
     def read_mcp_resource(
         self, tenant_slug: str, connector_id: str, uri: str
     ) -> str:
-        """Read MCP resource."""
-        response = self.mcp_request(
-            tenant_slug, connector_id, "resources/read", {"uri": uri}
+        """Read MCP resource.
+
+        The response is parsed incrementally and only the text of the first
+        content item is kept, so large resources are never decoded in full.
+        """
+        data = _jsonrpc_request("resources/read", {"uri": uri})
+
+        with self._http.stream(
+            "POST",
+            f"/api/v1/{tenant_slug}/connectors/{connector_id}/mcp",
+            content=orjson.dumps(data),
+            headers={"Accept": "application/json"},
+        ) as response:
+            if response.is_error:
+                response.read()
+                return self._handle_response(response)
+
+            import ijson
+
+            try:
+                return _first_resource_text(_ChunkReader(response.iter_bytes()))
+            except ijson.JSONError as e:
+                raise APIError(f"Request failed: {e}")
+
+    def ping(self, timeout: float = 5) -> bool:
+        """Ping the server to check connectivity.
+
+        The result is cached for the lifetime of the client, so repeated
+        checks within one command cost no extra round trips.
+
+        Args:
+            timeout: Seconds to wait for the health check
+        """
+        if self._ping_result is None:
+            try:
+                response = self._http.get("/health", timeout=timeout)
+                self._ping_result = response.status_code == 200
+            except Exception:
+                self._ping_result = False
+        return self._ping_result
+
+
+@lru_cache(maxsize=8)
+def get_profile_client(profile: Optional[str] = None) -> SageMCPClient:
+    """Get the API client for a profile.
+
+    Clients are cached per profile name, so repeated lookups (e.g. in the
+    interactive session) reuse the loaded profile and its connection pool.
+
+    Args:
+        profile: Profile name. If None, uses default profile.
+
+    Raises:
+        ValueError: If profile not found
+    """
+    return SageMCPClient(config_manager.get_profile(profile))
+
+
+class AsyncSageMCPClient(_BaseClient):
+    """Async HTTP client for SageMCP API.
+
+    Used by commands that issue several independent requests, so they can
+    run concurrently with ``asyncio.gather`` instead of one after another.
+    """
+
+    def __init__(self, config: ProfileConfig):
+        """Initialize API client.
+
+        Args:
+            config: Profile configuration
+        """
+        super().__init__(config)
+        import httpx
+
+        # HTTP/2 multiplexes concurrent requests over one connection when the
+        # server negotiates it over TLS; plain HTTP stays on HTTP/1.1
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers=self._get_headers(),
+            limits=httpx.Limits(**ASYNC_HTTP_LIMITS),
+            http2=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncSageMCPClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _cached_get(self, path: str, ttl: float) -> Any:
+        """GET a read-mostly resource through the on-disk response cache.
+
+        Shares its entries with ``SageMCPClient._cached_get``.
+
+        Args:
+            path: Request path
+            ttl: Seconds a response stays fresh
+
+        Returns:
+            Response data
+        """
+        key = f"{self.base_url}{path}"
+        entry = response_cache.get(key, self._cache_scope)
+        if entry and response_cache.is_fresh(entry):
+            return entry["data"]
+
+        headers = None
+        if entry and entry.get("etag"):
+            headers = {"If-None-Match": entry["etag"]}
+        response = await self._client.get(path, headers=headers)
+
+        if entry and response.status_code == 304:
+            response_cache.set(
+                key, entry["data"], ttl, entry["etag"], self._cache_scope
+            )
+            return entry["data"]
+
+        data = self._handle_response(response)
+        etag = response.headers.get("etag")
+        response_cache.set(key, data, ttl, etag, self._cache_scope)
+        return data
+
+    # Connector operations
+    async def list_connectors(
+        self, tenant_slug: str, include: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """List connectors for a tenant."""
+        params = {"include": ",".join(include)} if include else None
+        response = await self._client.get(
+            f"/api/v1/admin/tenants/{tenant_slug}/connectors", params=params
         )
+        return self._handle_response(response)
+
+    async def get_connector(
+        self, tenant_slug: str, connector_id: str
+    ) -> Dict[str, Any]:
+        """Get connector details."""
+        return await self._cached_get(
+            f"/api/v1/admin/tenants/{tenant_slug}/connectors/{connector_id}",
+            DETAIL_CACHE_TTL,
+        )
+
+    # MCP operations
+    async def get_mcp_info(self, tenant_slug: str, connector_id: str) -> Dict[str, Any]:
+        """Get MCP server info."""
+        response = await self._client.get(
+            f"/api/v1/{tenant_slug}/connectors/{connector_id}/mcp/info"
+        )
+        return self._handle_response(response)
+
+    async def mcp_request(
+        self,
+        tenant_slug: str,
+        connector_id: str,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        request_id: int = 1,
+    ) -> Dict[str, Any]:
+        """Send MCP JSON-RPC request."""
+        data = _jsonrpc_request(method, params, request_id)
+
+        response = await self._client.post(
+            f"/api/v1/{tenant_slug}/connectors/{connector_id}/mcp",
+            content=orjson.dumps(data),
+            headers={"Accept": "application/json"},
+        )
+        return self._handle_response(response)
+
+    async def list_mcp_tools(
+        self, tenant_slug: str, connector_id: str
+    ) -> List[Dict[str, Any]]:
+        """List MCP tools."""
+        response = await self.mcp_request(tenant_slug, connector_id, "tools/list")
         if "result" in response:
-            contents = response["result"].get("contents", [])
-            if contents:
-                return contents[0].get("text", "")
-        elif "error" in response:
-            raise APIError(response["error"].get("message", "Resource read failed"))
-        return ""
+            return response["result"].get("tools", [])
+        return []
 
-    def ping(self) -> bool:
-        """Ping the server to check connectivity."""
-        try:
-            with httpx.Client(timeout=5) as client:
-                response = client.get(f"{self.base_url}/health")
-                return response.status_code == 200
-        except Exception:
-            return False
+    async def list_mcp_resources(
+        self, tenant_slug: str, connector_id: str
+    ) -> List[Dict[str, Any]]:
+        """List MCP resources."""
+        response = await self.mcp_request(tenant_slug, connector_id, "resources/list")
+        if "result" in response:
+            return response["result"].get("resources", [])
+        return []
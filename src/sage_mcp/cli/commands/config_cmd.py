@@ -5,16 +5,22 @@ from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from sage_mcp.cli.config import config_manager
-from sage_mcp.cli.utils.output import print_error, print_success
-from sage_mcp.cli.utils.prompts import confirm, prompt_profile_create
+from sage_mcp.cli.utils.output import new_table, print_error, print_success
+from sage_mcp.cli.utils.prompts import confirm, confirm_or_exit, prompt_profile_create
 
 app = typer.Typer(help="Configuration management commands")
 console = Console()
 
 
+def _mask(api_key: str) -> str:
+    """Mask an API key for display, keeping only its first and last 4 characters."""
+    if len(api_key) > 8:
+        return f"{api_key[:4]}...{api_key[-4:]}"
+    return "****"
+
+
 @app.command("init")
 def init_config(
     interactive: bool = typer.Option(True, help="Interactive mode"),
@@ -68,7 +74,7 @@ def list_profiles(
             console.print("[yellow]No profiles found. Run 'sagemcp config init' to create one.[/yellow]")
             return
 
-        table = Table(title="CLI Profiles")
+        table = new_table("CLI Profiles")
         table.add_column("Profile", style="cyan")
         table.add_column("Base URL", style="green")
         table.add_column("API Key", style="yellow")
@@ -80,10 +86,9 @@ def list_profiles(
             # Mask API key unless show_secrets is True
             api_key_display = "-"
             if profile.api_key:
-                if show_secrets:
-                    api_key_display = profile.api_key
-                else:
-                    api_key_display = f"{profile.api_key[:4]}...{profile.api_key[-4:]}" if len(profile.api_key) > 8 else "****"
+                api_key_display = (
+                    profile.api_key if show_secrets else _mask(profile.api_key)
+                )
 
             table.add_row(name, profile.base_url, api_key_display, is_default)
 
@@ -111,7 +116,7 @@ def show_profile(
 
         prof = config.profiles[profile]
 
-        table = Table(title=f"Profile: {profile}")
+        table = new_table(f"Profile: {profile}")
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="green")
 
@@ -179,9 +184,7 @@ def delete_profile(
     """Delete a profile."""
     try:
         if not force:
-            if not confirm(f"Are you sure you want to delete profile '{profile}'?"):
-                print_error("Cancelled")
-                sys.exit(0)
+            confirm_or_exit(f"Are you sure you want to delete profile '{profile}'?")
 
         config_manager.delete_profile(profile)
         print_success(f"Deleted profile: {profile}")
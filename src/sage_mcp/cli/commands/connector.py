@@ -5,257 +5,206 @@ from typing import Optional
 
 import typer
 
-from sage_mcp.cli.client import APIError, SageMCPClient
-from sage_mcp.cli.config import config_manager
+from sage_mcp.cli.client import SageMCPClient, get_profile_client
+from sage_mcp.cli.utils.errors import handle_api_errors
+from sage_mcp.cli.utils.options import (
+    CONNECTOR_ARGUMENT,
+    FORMAT_OPTION,
+    PROFILE_OPTION,
+    TENANT_ARGUMENT,
+)
 from sage_mcp.cli.utils.output import (
     output_data,
     output_table_connector,
+    output_table_connector_types,
     output_table_connectors,
     print_error,
     print_info,
     print_success,
 )
-from sage_mcp.cli.utils.prompts import confirm, prompt_connector_create
+from sage_mcp.cli.utils.prompts import confirm_or_exit, prompt_connector_create
 
 app = typer.Typer(help="Connector management commands")
 
+# Connector types and their display names
+CONNECTOR_TYPES = (
+    ("github", "GitHub"),
+    ("gitlab", "GitLab"),
+    ("slack", "Slack"),
+    ("jira", "Jira"),
+    ("google_docs", "Google Docs"),
+    ("notion", "Notion"),
+    ("confluence", "Confluence"),
+    ("linear", "Linear"),
+    ("teams", "Microsoft Teams"),
+    ("discord", "Discord"),
+    ("zoom", "Zoom"),
+)
+
 
 def get_client(profile: Optional[str] = None) -> SageMCPClient:
     """Get API client for profile."""
     try:
-        profile_config = config_manager.get_profile(profile)
-        return SageMCPClient(profile_config)
+        return get_profile_client(profile)
     except ValueError as e:
         print_error(str(e))
         sys.exit(1)
 
 
 @app.command("list")
+@handle_api_errors("Failed to list connectors")
 def list_connectors(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """List connectors for a tenant."""
-    try:
-        client = get_client(profile)
-        connectors = client.list_connectors(tenant_slug)
+    client = get_client(profile)
 
-        if format == "table":
-            output_table_connectors(connectors, tenant_slug)
-        else:
-            output_data(connectors, format)
-
-    except APIError as e:
-        print_error(f"Failed to list connectors: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    if format == "table":
+        # The table shows process status, embedded in the same response
+        connectors = client.list_connectors(tenant_slug, include=["status"])
+        output_table_connectors(connectors, tenant_slug)
+    else:
+        connectors = client.list_connectors(tenant_slug)
+        output_data(connectors, format)
 
 
 @app.command("show")
+@handle_api_errors("Failed to get connector")
 def show_connector(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """Show connector details."""
-    try:
-        client = get_client(profile)
-        connector = client.get_connector(tenant_slug, connector_id)
+    client = get_client(profile)
+    connector = client.get_connector(tenant_slug, connector_id)
 
-        if format == "table":
-            output_table_connector(connector)
-        else:
-            output_data(connector, format)
-
-    except APIError as e:
-        print_error(f"Failed to get connector: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    output_data(connector, format, output_table_connector)
 
 
 @app.command("create")
+@handle_api_errors("Failed to create connector")
 def create_connector(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
+    tenant_slug: str = TENANT_ARGUMENT,
     connector_type: Optional[str] = typer.Option(None, "--type", help="Connector type"),
     name: Optional[str] = typer.Option(None, help="Display name"),
     description: Optional[str] = typer.Option(None, help="Description"),
     interactive: bool = typer.Option(True, help="Interactive mode"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """Create a new connector for a tenant.
 
     Example:
         sagemcp connector create my-tenant --type github --name "GitHub Production"
     """
+    client = get_client(profile)
+
+    # Get available connector types for validation
     try:
-        client = get_client(profile)
-
-        # Get available connector types for validation
-        try:
-            available_types = client.get_available_connector_types()
-        except Exception as e:
-            print_error(f"Warning: Could not fetch available connector types: {e}")
-            available_types = []
-
-        # Interactive mode if no type/name provided
-        if interactive and (not connector_type or not name):
-            data = prompt_connector_create(available_types)
-        else:
-            if not connector_type or not name:
-                print_error("--type and --name are required in non-interactive mode")
-                sys.exit(2)
-
-            # Validate connector type
-            if available_types and connector_type not in available_types:
-                print_error(f"Invalid connector type: '{connector_type}'")
-                print_error(f"Available types: {', '.join(available_types)}")
-                print_info("Run: sagemcp connector types  # to see all available types")
-                sys.exit(2)
-
-            data = {"connector_type": connector_type, "name": name}
-            if description:
-                data["description"] = description
-
-        connector = client.create_connector(tenant_slug, **data)
-
-        print_success(f"Created connector: {connector['name']} ({connector['id']})")
-
-        if format == "table":
-            output_table_connector(connector)
-        else:
-            output_data(connector, format)
-
-    except APIError as e:
-        print_error(f"Failed to create connector: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
+        available_types = client.get_available_connector_types()
     except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+        print_error(f"Warning: Could not fetch available connector types: {e}")
+        available_types = []
+
+    # Interactive mode if no type/name provided
+    if interactive and (not connector_type or not name):
+        data = prompt_connector_create(available_types)
+    else:
+        if not connector_type or not name:
+            print_error("--type and --name are required in non-interactive mode")
+            sys.exit(2)
+
+        # Validate connector type
+        if available_types and connector_type not in available_types:
+            print_error(f"Invalid connector type: '{connector_type}'")
+            print_error(f"Available types: {', '.join(available_types)}")
+            print_info("Run: sagemcp connector types  # to see all available types")
+            sys.exit(2)
+
+        data = {"connector_type": connector_type, "name": name}
+        if description:
+            data["description"] = description
+
+    connector = client.create_connector(tenant_slug, **data)
+
+    print_success(f"Created connector: {connector['name']} ({connector['id']})")
+
+    output_data(connector, format, output_table_connector)
 
 
 @app.command("update")
+@handle_api_errors("Failed to update connector")
 def update_connector(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
     name: Optional[str] = typer.Option(None, help="New display name"),
     description: Optional[str] = typer.Option(None, help="New description"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """Update connector."""
-    try:
-        if not name and not description:
-            print_error("At least one field must be specified to update")
-            sys.exit(2)
+    if not name and not description:
+        print_error("At least one field must be specified to update")
+        sys.exit(2)
 
-        client = get_client(profile)
-        connector = client.update_connector(
-            tenant_slug, connector_id, name=name, description=description
-        )
+    client = get_client(profile)
+    connector = client.update_connector(
+        tenant_slug, connector_id, name=name, description=description
+    )
 
-        print_success(f"Updated connector: {connector['name']}")
+    print_success(f"Updated connector: {connector['name']}")
 
-        if format == "table":
-            output_table_connector(connector)
-        else:
-            output_data(connector, format)
-
-    except APIError as e:
-        print_error(f"Failed to update connector: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    output_data(connector, format, output_table_connector)
 
 
 @app.command("delete")
+@handle_api_errors("Failed to delete connector")
 def delete_connector(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
     force: bool = typer.Option(False, help="Skip confirmation"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Delete connector."""
-    try:
-        if not force:
-            if not confirm(f"Are you sure you want to delete connector '{connector_id}'?"):
-                print_error("Cancelled")
-                sys.exit(0)
+    if not force:
+        confirm_or_exit(f"Are you sure you want to delete connector '{connector_id}'?")
 
-        client = get_client(profile)
-        client.delete_connector(tenant_slug, connector_id)
+    client = get_client(profile)
+    client.delete_connector(tenant_slug, connector_id)
 
-        print_success(f"Deleted connector: {connector_id}")
-
-    except APIError as e:
-        print_error(f"Failed to delete connector: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    print_success(f"Deleted connector: {connector_id}")
 
 
 @app.command("toggle")
+@handle_api_errors("Failed to toggle connector")
 def toggle_connector(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """Toggle connector enabled status."""
-    try:
-        client = get_client(profile)
-        connector = client.toggle_connector(tenant_slug, connector_id)
+    client = get_client(profile)
+    connector = client.toggle_connector(tenant_slug, connector_id)
 
-        status = "enabled" if connector.get("is_enabled") else "disabled"
-        print_success(f"Connector {connector['name']} is now {status}")
+    status = "enabled" if connector.get("is_enabled") else "disabled"
+    print_success(f"Connector {connector['name']} is now {status}")
 
-        if format == "table":
-            output_table_connector(connector)
-        else:
-            output_data(connector, format)
-
-    except APIError as e:
-        print_error(f"Failed to toggle connector: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    output_data(connector, format, output_table_connector)
 
 
 @app.command("types")
-def list_connector_types() -> None:
+def list_connector_types(
+    format: str = FORMAT_OPTION,
+) -> None:
     """List available connector types."""
-    from rich.console import Console
-    from rich.table import Table
-
-    console = Console()
-    table = Table(title="Available Connector Types")
-    table.add_column("Type", style="cyan")
-    table.add_column("Name", style="green")
-
-    types = [
-        ("github", "GitHub"),
-        ("gitlab", "GitLab"),
-        ("slack", "Slack"),
-        ("jira", "Jira"),
-        ("google_docs", "Google Docs"),
-        ("notion", "Notion"),
-        ("confluence", "Confluence"),
-        ("linear", "Linear"),
-        ("teams", "Microsoft Teams"),
-        ("discord", "Discord"),
-        ("zoom", "Zoom"),
-    ]
-
-    for type_id, name in types:
-        table.add_row(type_id, name)
-
-    console.print(table)
+    if format == "table":
+        output_table_connector_types(CONNECTOR_TYPES)
+    else:
+        output_data(
+            [{"id": type_id, "name": name} for type_id, name in CONNECTOR_TYPES], format
+        )
@@ -1,356 +1,579 @@
 """MCP testing and interaction commands."""
 
+import asyncio
 import json
+import re
 import sys
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import orjson
 import typer
-from rich.console import Console
-from rich.syntax import Syntax
-
-from sage_mcp.cli.client import APIError, SageMCPClient
+from rich.console import Console, Group
+from rich.text import Text
+
+from sage_mcp.cli.client import (
+    APIError,
+    AsyncSageMCPClient,
+    SageMCPClient,
+    get_profile_client,
+)
 from sage_mcp.cli.config import config_manager
+from sage_mcp.cli.utils.errors import handle_api_errors
+from sage_mcp.cli.utils.options import (
+    CONNECTOR_ARGUMENT,
+    FORMAT_OPTION,
+    PROFILE_OPTION,
+    TENANT_ARGUMENT,
+)
 from sage_mcp.cli.utils.output import (
     output_data,
     output_table_mcp_resources,
     output_table_mcp_tools,
     print_error,
     print_info,
+    print_raw,
     print_success,
 )
 
+if TYPE_CHECKING:
+    from rich.syntax import Syntax
+
 app = typer.Typer(help="MCP testing and interaction commands")
 console = Console()
 
+# Help text of the interactive session, rendered with a single print
+INTERACTIVE_HELP = "\n".join([
+    "\n[bold]Available commands:[/bold]",
+    "  [cyan]tools[/cyan]                    - List available tools",
+    "  [cyan]resources[/cyan]                - List available resources",
+    "  [cyan]call[/cyan] <tool> [args...]    - Call a tool with arguments",
+    "  [cyan]read[/cyan] <uri>               - Read a resource",
+    "  [cyan]info[/cyan]                     - Show MCP server info",
+    "  [cyan]help[/cyan]                     - Show this help",
+    "  [cyan]exit[/cyan]                     - Exit interactive session\n",
+])
+
 
 def get_client(profile: Optional[str] = None) -> SageMCPClient:
     """Get API client for profile."""
+    try:
+        return get_profile_client(profile)
+    except ValueError as e:
+        print_error(str(e))
+        sys.exit(1)
+
+
+def format_json(data: Any) -> str:
+    """Pretty-print JSON for display with two-space indentation."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+@lru_cache(maxsize=1)
+def json_syntax_style() -> Tuple[Any, Any]:
+    """JSON lexer and theme for highlighting, built once and reused."""
+    from pygments.lexers.data import JsonLexer
+    from rich.syntax import Syntax
+
+    return JsonLexer(), Syntax.get_theme("monokai")
+
+
+def json_syntax(data: Any) -> "Syntax":
+    """Build a highlighted JSON renderable.
+
+    rich.syntax (and Pygments behind it) is imported here rather than at
+    module level, so commands that never print JSON don't load it.
+    """
+    from rich.syntax import Syntax
+
+    lexer, theme = json_syntax_style()
+    return Syntax(format_json(data), lexer, theme=theme)
+
+
+def print_json(data: Any) -> None:
+    """Print data as highlighted JSON."""
+    console.print(json_syntax(data))
+
+
+# Bare (unquoted) argument words run up to the next whitespace
+ARGUMENT_WORD = re.compile(r"\S*")
+
+JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_argument_value(text: str, start: int) -> Tuple[Any, int]:
+    """Parse one ``key=value`` value starting at ``start``.
+
+    Double-quoted strings, arrays and objects are read as JSON, so quotes
+    inside them are kept. Single-quoted values are taken literally. Bare
+    words are decoded as JSON when possible (numbers, booleans) and kept as
+    strings otherwise, including ones with apostrophes like ``it's``.
+
+    Returns:
+        The value and the index just past it
+    """
+    first = text[start : start + 1]
+    if first in ('"', "[", "{"):
+        try:
+            return JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            if first == '"':
+                raise ValueError(
+                    "Invalid arguments: unterminated or invalid quoted value"
+                )
+    elif first == "'":
+        close = text.find("'", start + 1)
+        if close == -1:
+            raise ValueError("Invalid arguments: unterminated quoted value")
+        return text[start + 1 : close], close + 1
+
+    end = ARGUMENT_WORD.match(text, start).end()
+    word = text[start:end]
+    try:
+        return json.loads(word), end
+    except json.JSONDecodeError:
+        return word, end
+
+
+def parse_tool_arguments(args_input: str) -> Dict[str, Any]:
+    """Parse tool arguments typed in the interactive session.
+
+    Accepts a JSON object or ``key=value`` pairs, where quoted values may
+    contain spaces and JSON arrays/objects may be given inline, e.g.
+    ``title="a b" labels=["bug","p1"]``.
+
+    Raises:
+        ValueError: If the arguments cannot be parsed
+    """
+    args_input = args_input.strip()
+    if not args_input:
+        return {}
+
+    if args_input.startswith("{"):
+        try:
+            return json.loads(args_input)
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON arguments")
+
+    arguments = {}
+    pos = 0
+    while pos < len(args_input):
+        if args_input[pos].isspace():
+            pos += 1
+            continue
+
+        word_end = ARGUMENT_WORD.match(args_input, pos).end()
+        key, sep, _ = args_input[pos:word_end].partition("=")
+        if not sep:
+            # Not a key=value pair; skip the word
+            pos = word_end
+            continue
+
+        arguments[key], pos = _parse_argument_value(args_input, pos + len(key) + 1)
+    return arguments
+
+
+def make_interactive_prompt() -> Callable[[], str]:
+    """Build the input function of the interactive session.
+
+    Uses prompt_toolkit, with in-session history and command completion, when
+    it is installed and stdin is a terminal. Falls back to ``console.input``.
+    """
+    if sys.stdin.isatty():
+        try:
+            from prompt_toolkit import PromptSession
+            from prompt_toolkit.completion import WordCompleter
+            from prompt_toolkit.formatted_text import ANSI
+        except ImportError:
+            pass
+        else:
+            session = PromptSession(
+                message=ANSI("\x1b[1;33mmcp>\x1b[0m "),
+                completer=WordCompleter(INTERACTIVE_COMMANDS),
+            )
+            return session.prompt
+
+    return lambda: console.input("[bold yellow]mcp>[/bold yellow] ")
+
+
+async def fetch_with_connector_name(
+    profile: Optional[str],
+    tenant_slug: str,
+    connector_id: str,
+    fetch: Callable[[AsyncSageMCPClient], Awaitable[List[Dict[str, Any]]]],
+) -> Tuple[List[Dict[str, Any]], str]:
+    """Run an MCP listing and the connector lookup for its display name concurrently.
+
+    When output is not a terminal the header is decorative only, so the lookup
+    is skipped and the connector ID is shown instead.
+
+    Args:
+        profile: Profile to use
+        tenant_slug: Tenant slug
+        connector_id: Connector ID
+        fetch: Listing to run against the async client
+
+    Returns:
+        Tuple of the listed items and the connector display name
+    """
     try:
         profile_config = config_manager.get_profile(profile)
-        return SageMCPClient(profile_config)
     except ValueError as e:
         print_error(str(e))
         sys.exit(1)
 
+    async with AsyncSageMCPClient(profile_config) as client:
+        if not console.is_terminal:
+            return await fetch(client), f"{tenant_slug}/{connector_id}"
+
+        items, connector = await asyncio.gather(
+            fetch(client),
+            client.get_connector(tenant_slug, connector_id),
+            return_exceptions=True,
+        )
+
+    if isinstance(items, BaseException):
+        raise items
+
+    # Fall back to the ID if the connector name cannot be fetched
+    if isinstance(connector, BaseException):
+        connector_name = f"{tenant_slug}/{connector_id}"
+    else:
+        connector_name = f"{tenant_slug}/{connector['name']}"
+
+    return items, connector_name
+
 
 @app.command("info")
+@handle_api_errors("Failed to get MCP info")
 def get_info(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """Get MCP server info."""
-    try:
-        client = get_client(profile)
-        info = client.get_mcp_info(tenant_slug, connector_id)
+    client = get_client(profile)
+    info = client.get_mcp_info(tenant_slug, connector_id)
 
-        output_data(info, format)
-
-    except APIError as e:
-        print_error(f"Failed to get MCP info: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    output_data(info, format)
 
 
 @app.command("tools")
+@handle_api_errors("Failed to list tools")
 def list_tools(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
     detailed: bool = typer.Option(False, help="Show detailed tool schemas"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
-    """List available MCP tools."""
-    try:
-        client = get_client(profile)
-        tools = client.list_mcp_tools(tenant_slug, connector_id)
-
-        if format == "table":
-            # Get connector name for display
-            try:
-                connector = client.get_connector(tenant_slug, connector_id)
-                connector_name = f"{tenant_slug}/{connector['name']}"
-            except Exception:
-                connector_name = f"{tenant_slug}/{connector_id}"
-
-            output_table_mcp_tools(tools, connector_name)
-
-            if detailed and tools:
-                console.print("\n[bold]Tool Schemas:[/bold]\n")
-                for tool in tools:
-                    console.print(f"[cyan]{tool.get('name')}[/cyan]")
-                    if tool.get("inputSchema"):
-                        syntax = Syntax(
-                            json.dumps(tool["inputSchema"], indent=2),
-                            "json",
-                            theme="monokai",
-                        )
-                        console.print(syntax)
-                    console.print()
-        else:
-            output_data(tools, format)
-
-    except APIError as e:
-        print_error(f"Failed to list tools: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    """List available MCP tools.
+
+    Piped table output names the connector by ID, saving the name lookup.
+    """
+    if format == "table":
+        # Get connector name for display alongside the tools
+        tools, connector_name = asyncio.run(
+            fetch_with_connector_name(
+                profile,
+                tenant_slug,
+                connector_id,
+                lambda client: client.list_mcp_tools(tenant_slug, connector_id),
+            )
+        )
+
+        output_table_mcp_tools(tools, connector_name)
+
+        if detailed and tools:
+            # Render all schemas in one pass
+            renderables: List[Any] = [
+                Text.from_markup("\n[bold]Tool Schemas:[/bold]\n")
+            ]
+            for tool in tools:
+                renderables.append(Text(str(tool.get("name")), style="cyan"))
+                if tool.get("inputSchema"):
+                    renderables.append(json_syntax(tool["inputSchema"]))
+                renderables.append(Text())
+            console.print(Group(*renderables))
+    else:
+        tools = get_client(profile).list_mcp_tools(tenant_slug, connector_id)
+        output_data(tools, format)
 
 
 @app.command("resources")
+@handle_api_errors("Failed to list resources")
 def list_resources(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
-    """List available MCP resources."""
-    try:
-        client = get_client(profile)
-        resources = client.list_mcp_resources(tenant_slug, connector_id)
-
-        if format == "table":
-            # Get connector name for display
-            try:
-                connector = client.get_connector(tenant_slug, connector_id)
-                connector_name = f"{tenant_slug}/{connector['name']}"
-            except Exception:
-                connector_name = f"{tenant_slug}/{connector_id}"
-
-            output_table_mcp_resources(resources, connector_name)
-        else:
-            output_data(resources, format)
-
-    except APIError as e:
-        print_error(f"Failed to list resources: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    """List available MCP resources.
+
+    Piped table output names the connector by ID, saving the name lookup.
+    """
+    if format == "table":
+        # Get connector name for display alongside the resources
+        resources, connector_name = asyncio.run(
+            fetch_with_connector_name(
+                profile,
+                tenant_slug,
+                connector_id,
+                lambda client: client.list_mcp_resources(tenant_slug, connector_id),
+            )
+        )
+
+        output_table_mcp_resources(resources, connector_name)
+    else:
+        resources = get_client(profile).list_mcp_resources(tenant_slug, connector_id)
+        output_data(resources, format)
 
 
 @app.command("call")
+@handle_api_errors("Failed to call tool")
 def call_tool(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
     tool_name: str = typer.Argument(..., help="Tool name"),
     args_json: Optional[str] = typer.Option(None, "--args", help="Arguments as JSON string"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Call an MCP tool."""
-    try:
-        # Parse arguments
-        arguments = {}
-        if args_json:
-            try:
-                arguments = json.loads(args_json)
-            except json.JSONDecodeError as e:
-                print_error(f"Invalid JSON arguments: {e}")
-                sys.exit(2)
-
-        client = get_client(profile)
-        result = client.call_mcp_tool(tenant_slug, connector_id, tool_name, arguments)
-
-        print_success(f"Tool '{tool_name}' executed successfully")
-        console.print("\n[bold]Result:[/bold]\n")
-
-        # Pretty print result
-        syntax = Syntax(json.dumps(result, indent=2), "json", theme="monokai")
-        console.print(syntax)
-
-    except APIError as e:
-        print_error(f"Failed to call tool: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    # Parse arguments
+    arguments = {}
+    if args_json:
+        try:
+            arguments = json.loads(args_json)
+        except json.JSONDecodeError as e:
+            print_error(f"Invalid JSON arguments: {e}")
+            sys.exit(2)
+
+    client = get_client(profile)
+    result = client.call_mcp_tool(tenant_slug, connector_id, tool_name, arguments)
+
+    print_success(f"Tool '{tool_name}' executed successfully")
+    console.print("\n[bold]Result:[/bold]\n")
+
+    # Pretty print result
+    print_json(result)
 
 
 @app.command("read")
+@handle_api_errors("Failed to read resource")
 def read_resource(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
     uri: str = typer.Argument(..., help="Resource URI"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Read an MCP resource."""
+    client = get_client(profile)
+    content = client.read_mcp_resource(tenant_slug, connector_id, uri)
+
+    print_success(f"Resource '{uri}' read successfully")
+    console.print("\n[bold]Content:[/bold]\n")
+    print_raw(content)
+
+
+class InteractiveSession:
+    """State of an interactive session.
+
+    Tool and resource listings are kept between commands and dropped after a
+    tool call, which may change them.
+    """
+
+    def __init__(self, client: SageMCPClient, tenant_slug: str, connector_id: str):
+        self.client = client
+        self.tenant_slug = tenant_slug
+        self.connector_id = connector_id
+        self.tools: Optional[List[Dict[str, Any]]] = None
+        self.resources: Optional[List[Dict[str, Any]]] = None
+
+    def get_tools(self) -> List[Dict[str, Any]]:
+        """Get MCP tools, listing them if not known yet."""
+        if self.tools is None:
+            self.tools = self.client.list_mcp_tools(self.tenant_slug, self.connector_id)
+        return self.tools
+
+    def get_resources(self) -> List[Dict[str, Any]]:
+        """Get MCP resources, listing them if not known yet."""
+        if self.resources is None:
+            self.resources = self.client.list_mcp_resources(
+                self.tenant_slug, self.connector_id
+            )
+        return self.resources
+
+
+# Interactive session commands. Handlers take the session and the rest of
+# the input line.
+def _cmd_help(session: InteractiveSession, rest: str) -> None:
+    console.print(INTERACTIVE_HELP)
+
+
+def _cmd_tools(session: InteractiveSession, rest: str) -> None:
+    lines = ["\n[bold]Available tools:[/bold]"]
+    lines.extend(
+        f"  - [cyan]{tool.get('name')}[/cyan]: {tool.get('description', '')}"
+        for tool in session.get_tools()
+    )
+    console.print("\n".join(lines) + "\n")
+
+
+def _cmd_resources(session: InteractiveSession, rest: str) -> None:
+    lines = ["\n[bold]Available resources:[/bold]"]
+    lines.extend(
+        f"  - [cyan]{resource.get('uri')}[/cyan]: {resource.get('name', '')}"
+        for resource in session.get_resources()
+    )
+    console.print("\n".join(lines) + "\n")
+
+
+def _cmd_info(session: InteractiveSession, rest: str) -> None:
+    print_json(session.client.get_mcp_info(session.tenant_slug, session.connector_id))
+
+
+def _cmd_call(session: InteractiveSession, rest: str) -> None:
+    if not rest.strip():
+        print_error("Usage: call <tool_name> [args...]")
+        return
+
+    # Parse tool name and arguments
+    tool_name, _, args_input = rest.strip().partition(" ")
     try:
-        client = get_client(profile)
-        content = client.read_mcp_resource(tenant_slug, connector_id, uri)
-
-        print_success(f"Resource '{uri}' read successfully")
-        console.print("\n[bold]Content:[/bold]\n")
-        console.print(content)
-
-    except APIError as e:
-        print_error(f"Failed to read resource: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+        arguments = parse_tool_arguments(args_input)
+    except ValueError as e:
+        print_error(str(e))
+        return
+
+    # The call may change what the connector lists
+    session.tools = session.resources = None
+    result = session.client.call_mcp_tool(
+        session.tenant_slug, session.connector_id, tool_name, arguments
+    )
+    print_json(result)
+
+
+def _cmd_read(session: InteractiveSession, rest: str) -> None:
+    uri = rest.strip()
+    if not uri:
+        print_error("Usage: read <uri>")
+        return
+
+    content = session.client.read_mcp_resource(
+        session.tenant_slug, session.connector_id, uri
+    )
+    console.print()
+    print_raw(content)
+    console.print()
+
+
+INTERACTIVE_HANDLERS: Dict[str, Callable[[InteractiveSession, str], None]] = {
+    "tools": _cmd_tools,
+    "resources": _cmd_resources,
+    "call": _cmd_call,
+    "read": _cmd_read,
+    "info": _cmd_info,
+    "help": _cmd_help,
+}
+EXIT_COMMANDS = {"exit", "quit", "q"}
+
+# Commands offered for completion in the interactive session
+INTERACTIVE_COMMANDS = [*INTERACTIVE_HANDLERS, "exit"]
 
 
 @app.command("interactive")
+@handle_api_errors("Failed to start interactive session")
 def interactive_session(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Start an interactive MCP REPL session."""
+    client = get_client(profile)
+    session = InteractiveSession(client, tenant_slug, connector_id)
+
+    # Get connector info and prefetch the tool and resource listings together
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        connector_future = pool.submit(client.get_connector, tenant_slug, connector_id)
+        catalog_future = pool.submit(client.list_mcp_catalog, tenant_slug, connector_id)
+
     try:
-        client = get_client(profile)
+        connector = connector_future.result()
+        connector_name = connector["name"]
+        connector_type = connector["connector_type"]
+    except Exception:
+        connector_name = connector_id
+        connector_type = "unknown"
 
-        # Get connector info
+    try:
+        session.tools, session.resources = catalog_future.result()
+    except Exception:
+        # Listed on demand instead
+        pass
+
+    # Print welcome message
+    console.print("\n[bold green]SageMCP Interactive Session[/bold green]")
+    console.print(
+        f"Tenant: [cyan]{tenant_slug}[/cyan] | "
+        f"Connector: [cyan]{connector_name}[/cyan] "
+        f"([magenta]{connector_type}[/magenta])"
+    )
+    console.print("Type 'help' for commands, 'exit' to quit\n")
+
+    read_line = make_interactive_prompt()
+
+    # REPL loop
+    while True:
         try:
-            connector = client.get_connector(tenant_slug, connector_id)
-            connector_name = connector["name"]
-            connector_type = connector["connector_type"]
-        except Exception:
-            connector_name = connector_id
-            connector_type = "unknown"
-
-        # Print welcome message
-        console.print("\n[bold green]SageMCP Interactive Session[/bold green]")
-        console.print(f"Tenant: [cyan]{tenant_slug}[/cyan] | Connector: [cyan]{connector_name}[/cyan] ([magenta]{connector_type}[/magenta])")
-        console.print("Type 'help' for commands, 'exit' to quit\n")
-
-        # REPL loop
-        while True:
-            try:
-                # Get input
-                line = console.input("[bold yellow]mcp>[/bold yellow] ").strip()
-
-                if not line:
-                    continue
-
-                # Parse command
-                parts = line.split(None, 1)
-                command = parts[0].lower()
-
-                # Handle commands
-                if command in ["exit", "quit", "q"]:
-                    console.print("[bold]Goodbye![/bold]")
-                    break
-
-                elif command == "help":
-                    console.print("\n[bold]Available commands:[/bold]")
-                    console.print("  [cyan]tools[/cyan]                    - List available tools")
-                    console.print("  [cyan]resources[/cyan]                - List available resources")
-                    console.print("  [cyan]call[/cyan] <tool> [args...]    - Call a tool with arguments")
-                    console.print("  [cyan]read[/cyan] <uri>               - Read a resource")
-                    console.print("  [cyan]info[/cyan]                     - Show MCP server info")
-                    console.print("  [cyan]help[/cyan]                     - Show this help")
-                    console.print("  [cyan]exit[/cyan]                     - Exit interactive session\n")
-
-                elif command == "tools":
-                    tools = client.list_mcp_tools(tenant_slug, connector_id)
-                    console.print("\n[bold]Available tools:[/bold]")
-                    for tool in tools:
-                        console.print(f"  - [cyan]{tool.get('name')}[/cyan]: {tool.get('description', '')}")
-                    console.print()
-
-                elif command == "resources":
-                    resources = client.list_mcp_resources(tenant_slug, connector_id)
-                    console.print("\n[bold]Available resources:[/bold]")
-                    for resource in resources:
-                        console.print(f"  - [cyan]{resource.get('uri')}[/cyan]: {resource.get('name', '')}")
-                    console.print()
-
-                elif command == "info":
-                    info = client.get_mcp_info(tenant_slug, connector_id)
-                    syntax = Syntax(json.dumps(info, indent=2), "json", theme="monokai")
-                    console.print(syntax)
-
-                elif command == "call":
-                    if len(parts) < 2:
-                        print_error("Usage: call <tool_name> [args...]")
-                        continue
-
-                    # Parse tool name and arguments
-                    args_str = parts[1].strip()
-                    tool_parts = args_str.split(None, 1)
-                    tool_name = tool_parts[0]
-
-                    # Parse arguments (key=value format or JSON)
-                    arguments = {}
-                    if len(tool_parts) > 1:
-                        args_input = tool_parts[1].strip()
-
-                        # Try JSON first
-                        if args_input.startswith("{"):
-                            try:
-                                arguments = json.loads(args_input)
-                            except json.JSONDecodeError:
-                                print_error("Invalid JSON arguments")
-                                continue
-                        else:
-                            # Parse key=value pairs
-                            for arg in args_input.split():
-                                if "=" in arg:
-                                    key, value = arg.split("=", 1)
-                                    # Try to parse as JSON value
-                                    try:
-                                        arguments[key] = json.loads(value)
-                                    except json.JSONDecodeError:
-                                        arguments[key] = value
-
-                    # Call tool
-                    result = client.call_mcp_tool(tenant_slug, connector_id, tool_name, arguments)
-                    syntax = Syntax(json.dumps(result, indent=2), "json", theme="monokai")
-                    console.print(syntax)
-
-                elif command == "read":
-                    if len(parts) < 2:
-                        print_error("Usage: read <uri>")
-                        continue
-
-                    uri = parts[1].strip()
-                    content = client.read_mcp_resource(tenant_slug, connector_id, uri)
-                    console.print(f"\n{content}\n")
-
-                else:
-                    print_error(f"Unknown command: {command}. Type 'help' for available commands.")
-
-            except APIError as e:
-                print_error(f"API Error: {e.message}")
-            except KeyboardInterrupt:
-                console.print("\n[bold]Use 'exit' to quit[/bold]")
-            except EOFError:
-                console.print("\n[bold]Goodbye![/bold]")
+            # Get input
+            line = read_line().strip()
+
+            if not line:
+                continue
+
+            # Parse command
+            parts = line.split(None, 1)
+            command = parts[0].lower()
+
+            if command in EXIT_COMMANDS:
+                console.print("[bold]Goodbye![/bold]")
                 break
-            except Exception as e:
-                print_error(f"Error: {e}")
-
-    except APIError as e:
-        print_error(f"Failed to start interactive session: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+
+            handler = INTERACTIVE_HANDLERS.get(command)
+            if handler:
+                handler(session, parts[1] if len(parts) > 1 else "")
+            else:
+                print_error(
+                    f"Unknown command: {command}. Type 'help' for available commands."
+                )
+
+        except APIError as e:
+            print_error(f"API Error: {e.message}")
+        except KeyboardInterrupt:
+            console.print("\n[bold]Use 'exit' to quit[/bold]")
+        except EOFError:
+            console.print("\n[bold]Goodbye![/bold]")
+            break
+        except Exception as e:
+            print_error(f"Error: {e}")
 
 
 @app.command("ping")
+@handle_api_errors("MCP server is not reachable")
 def ping_server(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    connector_id: str = typer.Argument(..., help="Connector ID"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    connector_id: str = CONNECTOR_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Test MCP server connection."""
-    try:
-        client = get_client(profile)
-        info = client.get_mcp_info(tenant_slug, connector_id)
-
-        print_success("MCP server is reachable")
-        console.print(f"Server: [cyan]{info.get('server_name')}[/cyan] v{info.get('server_version')}")
-        console.print(f"Protocol: [cyan]{info.get('protocol_version')}[/cyan]")
-
-    except APIError as e:
-        print_error(f"MCP server is not reachable: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    client = get_client(profile)
+    info = client.get_mcp_info(tenant_slug, connector_id)
+
+    print_success("MCP server is reachable")
+    console.print(
+        f"Server: [cyan]{info.get('server_name')}[/cyan] "
+        f"v{info.get('server_version')}"
+    )
+    console.print(f"Protocol: [cyan]{info.get('protocol_version')}[/cyan]")
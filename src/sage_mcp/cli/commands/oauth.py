@@ -1,89 +1,86 @@
 """OAuth management commands."""
 
 import sys
-import webbrowser
+from functools import partial
 from typing import Optional
 
 import typer
 
-from sage_mcp.cli.client import APIError, SageMCPClient
-from sage_mcp.cli.config import config_manager
+from sage_mcp.cli.client import APIError, SageMCPClient, get_profile_client
+from sage_mcp.cli.utils.errors import handle_api_errors
+from sage_mcp.cli.utils.options import FORMAT_OPTION, PROFILE_OPTION, TENANT_ARGUMENT
 from sage_mcp.cli.utils.output import (
     output_data,
+    output_table_oauth_configs,
     output_table_oauth_credentials,
     output_table_oauth_providers,
     print_error,
     print_info,
     print_success,
 )
-from sage_mcp.cli.utils.prompts import confirm
+from sage_mcp.cli.utils.prompts import confirm_or_exit
 
 app = typer.Typer(help="OAuth management commands")
 
+# Polling for an authorization result starts fast and backs off to the cap,
+# so flows completed within seconds are picked up almost immediately
+AUTHORIZE_TIMEOUT = 300  # seconds
+FIRST_POLL_INTERVAL = 0.25  # seconds
+MAX_POLL_INTERVAL = 5.0  # seconds
+POLL_BACKOFF = 1.5
+
+# Progress lines shown while polling for an authorization, by number of dots
+WAITING_PROGRESS = tuple(f"Still waiting{'.' * dots:<3}    \r" for dots in range(4))
+
 
 def get_client(profile: Optional[str] = None) -> SageMCPClient:
     """Get API client for profile."""
     try:
-        profile_config = config_manager.get_profile(profile)
-        return SageMCPClient(profile_config)
+        return get_profile_client(profile)
     except ValueError as e:
         print_error(str(e))
         sys.exit(1)
 
 
 @app.command("providers")
+@handle_api_errors("Failed to list providers")
 def list_providers(
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass cached responses"),
 ) -> None:
     """List available OAuth providers."""
-    try:
-        client = get_client(profile)
-        providers = client.list_oauth_providers()
-
-        if format == "table":
-            output_table_oauth_providers(providers)
-        else:
-            output_data(providers, format)
+    client = get_client(profile)
+    providers = client.list_oauth_providers(refresh=no_cache)
 
-    except APIError as e:
-        print_error(f"Failed to list providers: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    output_data(providers, format, output_table_oauth_providers)
 
 
 @app.command("list")
+@handle_api_errors("Failed to list OAuth credentials")
 def list_credentials(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass cached responses"),
 ) -> None:
     """List OAuth credentials for a tenant."""
-    try:
-        client = get_client(profile)
-        credentials = client.list_oauth_credentials(tenant_slug)
+    client = get_client(profile)
+    credentials = client.list_oauth_credentials(tenant_slug, refresh=no_cache)
 
-        if format == "table":
-            output_table_oauth_credentials(credentials, tenant_slug)
-        else:
-            output_data(credentials, format)
-
-    except APIError as e:
-        print_error(f"Failed to list OAuth credentials: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    output_data(
+        credentials,
+        format,
+        partial(output_table_oauth_credentials, tenant_slug=tenant_slug),
+    )
 
 
 @app.command("authorize")
 def authorize(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
+    tenant_slug: str = TENANT_ARGUMENT,
     provider: str = typer.Argument(..., help="OAuth provider"),
     browser: bool = typer.Option(True, help="Open browser automatically"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Start OAuth authorization flow.
 
@@ -91,13 +88,14 @@ def authorize(
     The backend handles the OAuth callback and the CLI polls for the result.
     """
     try:
-        import uuid
+        import secrets
         import time
+        import webbrowser
 
         client = get_client(profile)
 
-        # Generate unique CLI session ID
-        session_id = f"cli-session-{uuid.uuid4()}"
+        # Generate unique CLI session ID (URL-safe, 128 bits of randomness)
+        session_id = "cli-session-" + secrets.token_urlsafe(16)
 
         print_info(f"Starting OAuth authorization for {provider}...")
         print_info(f"Session ID: {session_id}\n")
@@ -123,17 +121,20 @@ def authorize(
         print_info("\nWaiting for authorization (timeout: 5 minutes)...")
         print_info("Please complete the authorization in your browser.\n")
 
-        # Poll for result
-        max_attempts = 60  # 5 minutes (60 * 5 seconds)
-        poll_interval = 5  # seconds
+        # Poll for result until the deadline
+        started = time.monotonic()
+        deadline = started + AUTHORIZE_TIMEOUT
+        poll_interval = FIRST_POLL_INTERVAL
+        shown_progress = None
 
-        for attempt in range(max_attempts):
+        while time.monotonic() < deadline:
             try:
                 # Try to get the session result
                 result = client.get_cli_session_result(session_id)
 
                 # Success!
                 if result.get("status") == "success":
+                    client.invalidate_oauth_credentials(tenant_slug)
                     print_success(f"\n✓ Successfully authorized {provider} for tenant '{tenant_slug}'")
                     print_info(f"Provider User: {result.get('provider_username', 'N/A')}")
                     print_info(f"Provider User ID: {result.get('provider_user_id', 'N/A')}")
@@ -154,10 +155,14 @@ def authorize(
             except APIError as e:
                 # 404 means session not ready yet, keep polling
                 if e.status_code == 404:
-                    if attempt % 6 == 0:  # Print progress every 30 seconds
-                        dots = "." * (attempt // 6 % 4)
-                        print(f"Still waiting{dots}    ", end="\r", flush=True)
+                    # Progress advances every 30 seconds; write only on change
+                    progress = int((time.monotonic() - started) // 30) % 4
+                    if progress != shown_progress:
+                        sys.stdout.write(WAITING_PROGRESS[progress])
+                        sys.stdout.flush()
+                        shown_progress = progress
                     time.sleep(poll_interval)
+                    poll_interval = min(MAX_POLL_INTERVAL, poll_interval * POLL_BACKOFF)
                     continue
                 else:
                     # Other errors are real problems
@@ -174,7 +179,7 @@ def authorize(
 
     except APIError as e:
         print_error(f"Failed to authorize: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
+        sys.exit(e.cli_exit_code)
     except KeyboardInterrupt:
         print_error("\n\nAuthorization cancelled by user")
         sys.exit(0)
@@ -186,103 +191,95 @@ def authorize(
 
 
 @app.command("status")
+@handle_api_errors("Failed to check OAuth status")
 def oauth_status(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
+    tenant_slug: str = TENANT_ARGUMENT,
     provider: Optional[str] = typer.Argument(None, help="OAuth provider (optional)"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass cached responses"),
 ) -> None:
     """Check OAuth authorization status for a tenant.
 
     If provider is specified, shows status for that provider only.
     Otherwise, shows status for all providers.
     """
-    try:
-        client = get_client(profile)
-
-        if provider:
-            # Check status for specific provider
-            try:
-                credential = client.get_oauth_credential(tenant_slug, provider)
-                print_success(f"✓ {provider} is authorized for tenant '{tenant_slug}'")
-                print_info(f"Provider User: {credential.get('provider_username', 'N/A')}")
-                print_info(f"Provider User ID: {credential.get('provider_user_id', 'N/A')}")
-                print_info(f"Active: {credential.get('is_active', False)}")
-
-                if credential.get('expires_at'):
-                    print_info(f"Expires: {credential['expires_at']}")
-
-                if format != "table":
-                    output_data(credential, format)
-
-            except APIError as e:
-                if e.status_code == 404:
-                    print_error(f"✗ {provider} is NOT authorized for tenant '{tenant_slug}'")
-                    print_info(f"Run: sagemcp oauth authorize {tenant_slug} {provider}")
-                    sys.exit(1)
-                else:
-                    raise
-
-        else:
-            # Check status for all providers
-            credentials = client.list_oauth_credentials(tenant_slug)
-
-            if format == "table":
-                output_table_oauth_credentials(credentials, tenant_slug)
+    client = get_client(profile)
+
+    if provider:
+        # Check status for specific provider
+        try:
+            credential = client.get_oauth_credential(tenant_slug, provider)
+            print_success(f"✓ {provider} is authorized for tenant '{tenant_slug}'")
+            print_info(f"Provider User: {credential.get('provider_username', 'N/A')}")
+            print_info(f"Provider User ID: {credential.get('provider_user_id', 'N/A')}")
+            print_info(f"Active: {credential.get('is_active', False)}")
+
+            if credential.get('expires_at'):
+                print_info(f"Expires: {credential['expires_at']}")
+
+            if format != "table":
+                output_data(credential, format)
+
+        except APIError as e:
+            if e.status_code == 404:
+                print_error(
+                    f"✗ {provider} is NOT authorized for tenant '{tenant_slug}'"
+                )
+                print_info(f"Run: sagemcp oauth authorize {tenant_slug} {provider}")
+                sys.exit(1)
             else:
-                output_data(credentials, format)
+                raise
 
-            if not credentials:
-                print_info(f"\nNo OAuth providers authorized for tenant '{tenant_slug}'")
-                print_info("Run: sagemcp oauth providers  # to see available providers")
-                print_info("Run: sagemcp oauth authorize <tenant> <provider>  # to authorize")
+    else:
+        # Check status for all providers
+        credentials = client.list_oauth_credentials(tenant_slug, refresh=no_cache)
 
-    except APIError as e:
-        print_error(f"Failed to check OAuth status: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+        output_data(
+            credentials,
+            format,
+            partial(output_table_oauth_credentials, tenant_slug=tenant_slug),
+        )
+
+        if not credentials:
+            print_info(f"\nNo OAuth providers authorized for tenant '{tenant_slug}'")
+            print_info("Run: sagemcp oauth providers  # to see available providers")
+            print_info(
+                "Run: sagemcp oauth authorize <tenant> <provider>  # to authorize"
+            )
 
 
 @app.command("revoke")
+@handle_api_errors("Failed to revoke credentials")
 def revoke_credentials(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
+    tenant_slug: str = TENANT_ARGUMENT,
     provider: str = typer.Argument(..., help="OAuth provider"),
     force: bool = typer.Option(False, help="Skip confirmation"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Revoke OAuth credentials."""
-    try:
-        if not force:
-            if not confirm(
-                f"Are you sure you want to revoke {provider} credentials for tenant '{tenant_slug}'?"
-            ):
-                print_error("Cancelled")
-                sys.exit(0)
-
-        client = get_client(profile)
-        result = client.revoke_oauth_credential(tenant_slug, provider)
+    if not force:
+        confirm_or_exit(
+            f"Are you sure you want to revoke {provider} credentials "
+            f"for tenant '{tenant_slug}'?"
+        )
 
-        print_success(f"Revoked {provider} credentials")
-        print_info(result.get("message", ""))
+    client = get_client(profile)
+    result = client.revoke_oauth_credential(tenant_slug, provider)
 
-    except APIError as e:
-        print_error(f"Failed to revoke credentials: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    print_success(f"Revoked {provider} credentials")
+    print_info(result.get("message", ""))
 
 
 @app.command("config-set")
+@handle_api_errors("Failed to set OAuth config")
 def config_set(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
+    tenant_slug: str = TENANT_ARGUMENT,
     provider: str = typer.Argument(..., help="OAuth provider (github, slack, etc.)"),
     client_id: str = typer.Option(..., help="OAuth client ID"),
     client_secret: str = typer.Option(..., help="OAuth client secret"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """Set OAuth configuration for a tenant.
 
@@ -294,115 +291,75 @@ def config_set(
             --client-id Iv1.abc123 \\
             --client-secret 1234567890abcdef
     """
-    try:
-        client = get_client(profile)
+    client = get_client(profile)
 
-        print_info(f"Setting OAuth config for {provider}...")
+    print_info(f"Setting OAuth config for {provider}...")
 
-        config = client.create_oauth_config(
-            tenant_slug,
-            provider,
-            client_id,
-            client_secret
-        )
+    config = client.create_oauth_config(
+        tenant_slug,
+        provider,
+        client_id,
+        client_secret
+    )
 
-        print_success(f"✓ OAuth configuration set for {provider}")
-        print_info(f"Provider: {config.get('provider')}")
-        print_info(f"Client ID: {config.get('client_id')}")
-        print_info(f"Active: {config.get('is_active', True)}")
+    print_success(f"✓ OAuth configuration set for {provider}")
+    print_info(f"Provider: {config.get('provider')}")
+    print_info(f"Client ID: {config.get('client_id')}")
+    print_info(f"Active: {config.get('is_active', True)}")
 
-        if format != "table":
-            output_data(config, format)
+    if format != "table":
+        output_data(config, format)
 
-        print_info(f"\nYou can now authorize: sagemcp oauth authorize {tenant_slug} {provider}")
-
-    except APIError as e:
-        print_error(f"Failed to set OAuth config: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    print_info(
+        f"\nYou can now authorize: sagemcp oauth authorize {tenant_slug} {provider}"
+    )
 
 
 @app.command("config-list")
+@handle_api_errors("Failed to list OAuth configs")
 def config_list(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
-    format: str = typer.Option("table", help="Output format (table, json, yaml)"),
+    tenant_slug: str = TENANT_ARGUMENT,
+    profile: Optional[str] = PROFILE_OPTION,
+    format: str = FORMAT_OPTION,
 ) -> None:
     """List OAuth configurations for a tenant.
 
     Shows tenant-specific OAuth app configurations.
     """
-    try:
-        client = get_client(profile)
-        configs = client.list_oauth_configs(tenant_slug)
-
-        if format == "table":
-            from rich.console import Console
-            from rich.table import Table
-
-            console = Console()
-            table = Table(title=f"OAuth Configurations for '{tenant_slug}'")
-            table.add_column("Provider", style="cyan")
-            table.add_column("Client ID", style="green")
-            table.add_column("Active", style="yellow")
-            table.add_column("Created", style="blue")
-
-            for config in configs:
-                table.add_row(
-                    config.get('provider', 'N/A'),
-                    config.get('client_id', 'N/A'),
-                    "✓" if config.get('is_active', True) else "✗",
-                    config.get('created_at', 'N/A')[:10] if config.get('created_at') else 'N/A'
-                )
+    client = get_client(profile)
+    configs = client.list_oauth_configs(tenant_slug)
 
-            console.print(table)
-        else:
-            output_data(configs, format)
+    output_data(
+        configs, format, partial(output_table_oauth_configs, tenant_slug=tenant_slug)
+    )
 
-        if not configs:
-            print_info(f"\nNo OAuth configurations found for tenant '{tenant_slug}'")
-            print_info("Using global environment variables instead (if configured)")
-
-    except APIError as e:
-        print_error(f"Failed to list OAuth configs: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    if not configs:
+        print_info(f"\nNo OAuth configurations found for tenant '{tenant_slug}'")
+        print_info("Using global environment variables instead (if configured)")
 
 
 @app.command("config-delete")
+@handle_api_errors("Failed to delete OAuth config")
 def config_delete(
-    tenant_slug: str = typer.Argument(..., help="Tenant slug"),
+    tenant_slug: str = TENANT_ARGUMENT,
     provider: str = typer.Argument(..., help="OAuth provider"),
     force: bool = typer.Option(False, help="Skip confirmation"),
-    profile: Optional[str] = typer.Option(None, help="Profile to use"),
+    profile: Optional[str] = PROFILE_OPTION,
 ) -> None:
     """Delete OAuth configuration for a tenant.
 
     This removes the tenant-specific OAuth configuration.
     The system will fall back to global environment variables if configured.
     """
-    try:
-        if not force:
-            if not confirm(
-                f"Are you sure you want to delete {provider} OAuth config for tenant '{tenant_slug}'?"
-            ):
-                print_error("Cancelled")
-                sys.exit(0)
-
-        client = get_client(profile)
-        result = client.delete_oauth_config(tenant_slug, provider)
+    if not force:
+        confirm_or_exit(
+            f"Are you sure you want to delete {provider} OAuth config "
+            f"for tenant '{tenant_slug}'?"
+        )
 
-        print_success(f"✓ Deleted {provider} OAuth configuration")
-        print_info(result.get("message", ""))
-        print_info("\nSystem will now use global environment variables (if configured)")
+    client = get_client(profile)
+    result = client.delete_oauth_config(tenant_slug, provider)
 
-    except APIError as e:
-        print_error(f"Failed to delete OAuth config: {e.message}")
-        sys.exit(3 if e.status_code and e.status_code < 500 else 4)
-    except Exception as e:
-        print_error(f"Unexpected error: {e}")
-        sys.exit(1)
+    print_success(f"✓ Deleted {provider} OAuth configuration")
+    print_info(result.get("message", ""))
+    print_info("\nSystem will now use global environment variables (if configured)")
@@ -1,35 +1,102 @@
 """Configuration management for SageMCP CLI."""
 
 import os
+import pickle
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import toml
-from pydantic import BaseModel, Field
+# Bump when the config classes change shape so older pickles are ignored
+CONFIG_CACHE_FORMAT = 2
 
 
-class ProfileConfig(BaseModel):
+def _known_fields(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop keys that are not fields of the dataclass, as pydantic used to."""
+    names = {f.name for f in fields(cls)}
+    return {key: value for key, value in data.items() if key in names}
+
+
+def _without_none(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Build a dict from dataclass items, leaving out unset (None) values."""
+    return {key: value for key, value in items if value is not None}
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Write a file readable only by the owner, swapping it in with one rename.
+
+    The temporary file gets a unique name (and mode 0600) so concurrent CLI
+    processes never write into each other's, and a crash mid-write never
+    leaves a truncated file behind.
+    """
+    import tempfile
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+@dataclass(slots=True)
+class ProfileConfig:
     """Configuration for a single profile."""
 
-    base_url: str = Field(default="http://localhost:8000", description="API base URL")
-    api_key: Optional[str] = Field(default=None, description="API key for authentication")
-    output_format: str = Field(default="table", description="Default output format")
-    timeout: int = Field(default=30, description="Request timeout in seconds")
+    base_url: str = "http://localhost:8000"  # API base URL
+    api_key: Optional[str] = None  # API key for authentication
+    output_format: str = "table"  # Default output format
+    timeout: int = 30  # Request timeout in seconds
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.base_url, str):
+            raise ValueError(f"base_url must be a string, got {self.base_url!r}")
+        self.timeout = int(self.timeout)
 
-class CLISettings(BaseModel):
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProfileConfig":
+        """Build a profile from its TOML table."""
+        return cls(**_known_fields(cls, data))
+
+
+@dataclass(slots=True)
+class CLISettings:
     """Global CLI settings."""
 
-    default_profile: str = Field(default="default", description="Default profile name")
-    auto_update: bool = Field(default=True, description="Auto-update check")
-    log_level: str = Field(default="INFO", description="Logging level")
+    default_profile: str = "default"  # Default profile name
+    auto_update: bool = True  # Auto-update check
+    log_level: str = "INFO"  # Logging level
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CLISettings":
+        """Build settings from the [settings] TOML table."""
+        return cls(**_known_fields(cls, data))
 
-class CLIConfig(BaseModel):
+
+@dataclass(slots=True)
+class CLIConfig:
     """Main CLI configuration."""
 
-    profiles: Dict[str, ProfileConfig] = Field(default_factory=dict)
-    settings: CLISettings = Field(default_factory=CLISettings)
+    profiles: Dict[str, ProfileConfig] = field(default_factory=dict)
+    settings: CLISettings = field(default_factory=CLISettings)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CLIConfig":
+        """Build the configuration from parsed TOML data."""
+        return cls(
+            profiles={
+                name: ProfileConfig.from_dict(profile)
+                for name, profile in data.get("profiles", {}).items()
+            },
+            settings=CLISettings.from_dict(data.get("settings", {})),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the configuration to plain data for TOML, which has no null."""
+        return asdict(self, dict_factory=_without_none)
 
 
 class ConfigManager:
@@ -43,46 +110,112 @@ class ConfigManager:
         """
         self.config_dir = config_dir or Path.home() / ".sage-mcp"
         self.config_file = self.config_dir / "config.toml"
+        self.cache_file = self.config_dir / "config.cache.pkl"
         self._config: Optional[CLIConfig] = None
 
     def ensure_config_dir(self) -> None:
         """Ensure configuration directory exists."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
+    def _config_stamp(self) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) of the config file, or None if missing."""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_cached(self, stamp: Tuple[int, int]) -> Optional[CLIConfig]:
+        """Load the parsed configuration pickled for the given file stamp.
+
+        The cache is only unpickled if it belongs to the current user and
+        nobody else can write to it.
+
+        Returns:
+            Cached CLIConfig, or None if the cache is missing, stale, unreadable
+            or untrusted
+        """
+        try:
+            with open(self.cache_file, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+                    return None
+                if stat.st_mode & 0o022:
+                    return None
+                cache_format, cached_stamp, config = pickle.load(f)
+        except Exception:
+            return None
+        if cache_format != CONFIG_CACHE_FORMAT or cached_stamp != stamp:
+            return None
+        return config
+
+    def _store_cached(self, config: CLIConfig) -> None:
+        """Pickle the parsed configuration next to the config file.
+
+        The cache holds API keys too, so it is written owner-only like
+        config.toml. Failures to write are ignored; the cache only saves parsing.
+        """
+        stamp = self._config_stamp()
+        if stamp is None:
+            return
+        try:
+            payload = pickle.dumps(
+                (CONFIG_CACHE_FORMAT, stamp, config), protocol=pickle.HIGHEST_PROTOCOL
+            )
+            _write_private(self.cache_file, payload)
+        except (OSError, pickle.PicklingError):
+            self.cache_file.unlink(missing_ok=True)
+
     def load(self) -> CLIConfig:
         """Load configuration from file.
 
+        The parsed configuration is pickled to ``config.cache.pkl`` and reused
+        by later processes as long as the config file's mtime and size match.
+
         Returns:
             CLIConfig instance
         """
         if self._config:
             return self._config
 
-        if not self.config_file.exists():
+        stamp = self._config_stamp()
+        if stamp is None:
             self._config = CLIConfig()
             return self._config
 
+        cached = self._load_cached(stamp)
+        if cached is not None:
+            self._config = cached
+            return self._config
+
+        import tomllib
+
         try:
-            with open(self.config_file, "r") as f:
-                data = toml.load(f)
-                self._config = CLIConfig(**data)
-                return self._config
+            with open(self.config_file, "rb") as f:
+                data = tomllib.load(f)
+                self._config = CLIConfig.from_dict(data)
         except Exception as e:
             raise ValueError(f"Failed to load configuration: {e}")
 
+        self._store_cached(self._config)
+        return self._config
+
     def save(self, config: Optional[CLIConfig] = None) -> None:
         """Save configuration to file.
 
         Args:
             config: Configuration to save. If None, saves current config.
         """
+        import tomli_w
+
         self.ensure_config_dir()
         cfg = config or self._config or CLIConfig()
 
-        with open(self.config_file, "w") as f:
-            toml.dump(cfg.model_dump(), f)
+        # The file holds API keys, so it is (re)written owner-only
+        _write_private(self.config_file, tomli_w.dumps(cfg.to_dict()).encode())
 
         self._config = cfg
+        self._store_cached(cfg)
 
     def get_profile(self, profile_name: Optional[str] = None) -> ProfileConfig:
         """Get profile configuration.
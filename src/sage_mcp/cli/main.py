@@ -1,32 +1,55 @@
 """SageMCP CLI main entry point."""
 
+import importlib
 import sys
+from typing import List, Optional
 
+import click
 import typer
 from rich.console import Console
+from typer.core import TyperGroup
 
 from sage_mcp.cli import __version__
-from sage_mcp.cli.client import SageMCPClient
-from sage_mcp.cli.commands import config_cmd, connector, mcp, oauth, tenant
-from sage_mcp.cli.config import config_manager
+from sage_mcp.cli.client import get_profile_client
 from sage_mcp.cli.utils.output import print_error, print_info
 
+# Command groups and the modules defining them. A module is imported only
+# when its group is invoked (or listed by --help), so a command doesn't pay
+# for loading every other group.
+COMMAND_GROUPS = {
+    "config": "sage_mcp.cli.commands.config_cmd",
+    "tenant": "sage_mcp.cli.commands.tenant",
+    "connector": "sage_mcp.cli.commands.connector",
+    "oauth": "sage_mcp.cli.commands.oauth",
+    "mcp": "sage_mcp.cli.commands.mcp",
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that loads command groups on demand."""
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return [*COMMAND_GROUPS, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in COMMAND_GROUPS:
+            module = importlib.import_module(COMMAND_GROUPS[cmd_name])
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            return command
+        return super().get_command(ctx, cmd_name)
+
+
 # Create main app
 app = typer.Typer(
     name="sagemcp",
     help="SageMCP CLI - Command-line interface for SageMCP platform",
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
 console = Console()
 
-# Add command groups
-app.add_typer(config_cmd.app, name="config")
-app.add_typer(tenant.app, name="tenant")
-app.add_typer(connector.app, name="connector")
-app.add_typer(oauth.app, name="oauth")
-app.add_typer(mcp.app, name="mcp")
-
 
 @app.command()
 def version(
@@ -40,12 +63,12 @@ def version(
 
         # Try to get server info
         try:
-            profile_config = config_manager.get_profile()
-            client = SageMCPClient(profile_config)
+            client = get_profile_client()
 
-            console.print(f"API URL: [cyan]{profile_config.base_url}[/cyan]")
+            console.print(f"API URL: [cyan]{client.base_url}[/cyan]")
 
-            if client.ping():
+            # Short timeout: an unreachable server shouldn't stall `version`
+            if client.ping(timeout=2):
                 console.print("Server: [green]reachable ✓[/green]")
             else:
                 console.print("Server: [red]not reachable ✗[/red]")
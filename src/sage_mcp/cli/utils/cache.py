@@ -0,0 +1,118 @@
+"""Short-lived on-disk cache for read-mostly API responses.
+
+CLI invocations are separate processes, so responses that rarely change
+(provider listings, tenant and connector details) are kept as JSON files
+under the configuration directory. Each entry stores the response ETag so
+an expired entry can be revalidated with ``If-None-Match`` instead of
+downloaded again.
+
+Entries are scoped to the credentials they were fetched with, and the
+directory and files are readable only by the owner since connector
+configurations can hold secrets.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sage_mcp.cli.config import config_manager
+
+
+class ResponseCache:
+    """File-backed response cache keyed by request URL."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Cache directory path. Defaults to <config dir>/cache
+        """
+        self.cache_dir = cache_dir or config_manager.config_dir / "cache"
+
+    def _path(self, key: str, scope: str) -> Path:
+        digest = hashlib.sha256(f"{scope}\n{key}".encode()).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key: str, scope: str = "") -> Optional[Dict[str, Any]]:
+        """Get a cache entry, fresh or expired.
+
+        Args:
+            key: Cache key
+            scope: Credentials scope the entry was stored under
+
+        Returns:
+            Entry with ``data``, ``etag`` and ``expires_at``, or None if missing
+        """
+        try:
+            with open(self._path(key, scope), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Check whether an entry can be used without contacting the server."""
+        return entry.get("expires_at", 0) > time.time()
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: float,
+        etag: Optional[str] = None,
+        scope: str = "",
+    ) -> None:
+        """Store a response.
+
+        Failures to write are ignored; the cache only saves requests.
+
+        Args:
+            key: Cache key
+            data: Response data
+            ttl: Seconds the entry stays fresh
+            etag: Optional ETag to revalidate the entry with
+            scope: Credentials scope to store the entry under
+        """
+        expires_at = time.time() + ttl
+        entry = {"key": key, "data": data, "etag": etag, "expires_at": expires_at}
+        try:
+            content = json.dumps(entry)
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            os.chmod(self.cache_dir, 0o700)
+            fd = os.open(
+                self._path(key, scope), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def invalidate(self, key: str) -> None:
+        """Remove an entry and all entries below it (``key/...``) in every scope.
+
+        Args:
+            key: Cache key
+        """
+        if not self.cache_dir.is_dir():
+            return
+        prefix = f"{key}/"
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, "r") as f:
+                    stored_key = json.load(f).get("key", "")
+            except (OSError, ValueError):
+                continue
+            if stored_key == key or stored_key.startswith(prefix):
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+# Global response cache instance
+response_cache = ResponseCache()
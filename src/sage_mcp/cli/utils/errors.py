@@ -0,0 +1,37 @@
+"""Error handling for CLI commands."""
+
+import sys
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+from sage_mcp.cli.client import APIError
+from sage_mcp.cli.utils.output import print_error
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def handle_api_errors(message: str) -> Callable[[F], F]:
+    """Report command failures and exit with the matching status code.
+
+    API errors exit with 3 for client errors and 4 for server errors, any
+    other exception with 1. ``sys.exit`` calls inside the command pass through.
+
+    Args:
+        message: Prefix of the API error message, e.g. "Failed to list providers"
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except APIError as e:
+                print_error(f"{message}: {e.message}")
+                sys.exit(e.cli_exit_code)
+            except Exception as e:
+                print_error(f"Unexpected error: {e}")
+                sys.exit(1)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
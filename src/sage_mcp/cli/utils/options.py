@@ -0,0 +1,12 @@
+"""Command parameters shared across CLI command groups.
+
+Typer parameter defaults are plain objects, so the ones most commands
+repeat are created once here and reused instead of rebuilt per command.
+"""
+
+import typer
+
+PROFILE_OPTION = typer.Option(None, help="Profile to use")
+FORMAT_OPTION = typer.Option("table", help="Output format (table, json, yaml)")
+TENANT_ARGUMENT = typer.Argument(..., help="Tenant slug")
+CONNECTOR_ARGUMENT = typer.Argument(..., help="Connector ID")
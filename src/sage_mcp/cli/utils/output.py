@@ -3,15 +3,48 @@
 import json
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-import yaml
+import orjson
 from rich.console import Console
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.table import Table
 
 console = Console()
 
 
+def new_table(title: str) -> "Table":
+    """Create a Rich table, importing rich.table only when a table is rendered.
+
+    Args:
+        title: Table title
+
+    Returns:
+        Empty Table instance
+    """
+    from rich.table import Table
+
+    return Table(title=title)
+
+
+@lru_cache(maxsize=1024)
+def parse_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, memoized as the same timestamps recur across rows.
+
+    Args:
+        value: ISO 8601 string, e.g. "2024-01-02T03:04:05Z"
+
+    Returns:
+        Parsed datetime, or None if the string is not a timestamp
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def format_datetime(dt: Any) -> str:
     """Format datetime for display.
 
@@ -22,10 +55,10 @@ def format_datetime(dt: Any) -> str:
         Formatted datetime string
     """
     if isinstance(dt, str):
-        try:
-            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-        except Exception:
+        parsed = parse_datetime(dt)
+        if parsed is None:
             return dt
+        dt = parsed
 
     if isinstance(dt, datetime):
         return dt.strftime("%Y-%m-%d %H:%M")
@@ -48,10 +81,21 @@ def format_boolean(value: bool) -> str:
 def output_json(data: Any) -> None:
     """Output data as JSON.
 
+    Highlighted by Rich on a terminal. When piped, the JSON is serialized once
+    with orjson and written straight to stdout, as scripts consuming it gain
+    nothing from Rich's rendering.
+
     Args:
         data: Data to output
     """
-    console.print_json(json.dumps(data, indent=2, default=str))
+    if console.is_terminal:
+        console.print_json(data=data, default=str)
+        return
+
+    text = orjson.dumps(
+        data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+    print_raw(text)
 
 
 def output_yaml(data: Any) -> None:
@@ -60,7 +104,18 @@ def output_yaml(data: Any) -> None:
     Args:
         data: Data to output
     """
-    print(yaml.dump(data, default_flow_style=False, sort_keys=False))
+    import yaml
+
+    # libyaml's C emitter when PyYAML was built with it
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    print(yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False))
+
+
+# Formatters of the formats that don't depend on the data type
+OUTPUT_FORMATTERS: Dict[str, Callable[[Any], None]] = {
+    "json": output_json,
+    "yaml": output_yaml,
+}
 
 
 def output_table_tenants(tenants: List[Dict[str, Any]]) -> None:
@@ -69,7 +124,7 @@ def output_table_tenants(tenants: List[Dict[str, Any]]) -> None:
     Args:
         tenants: List of tenant dictionaries
     """
-    table = Table(title="Tenants")
+    table = new_table("Tenants")
     table.add_column("Slug", style="cyan")
     table.add_column("Name", style="green")
     table.add_column("Active", style="yellow")
@@ -94,7 +149,7 @@ def output_table_tenant(tenant: Dict[str, Any]) -> None:
     Args:
         tenant: Tenant dictionary
     """
-    table = Table(title=f"Tenant: {tenant['slug']}")
+    table = new_table(f"Tenant: {tenant['slug']}")
     table.add_column("Field", style="cyan")
     table.add_column("Value", style="green")
 
@@ -116,11 +171,12 @@ def output_table_connectors(connectors: List[Dict[str, Any]], tenant_slug: str)
         connectors: List of connector dictionaries
         tenant_slug: Tenant slug
     """
-    table = Table(title=f"Connectors for tenant: {tenant_slug}")
+    table = new_table(f"Connectors for tenant: {tenant_slug}")
     table.add_column("ID", style="cyan")
     table.add_column("Type", style="magenta")
     table.add_column("Name", style="green")
     table.add_column("Enabled", style="yellow")
+    table.add_column("Status", style="blue")
     table.add_column("Created")
 
     for connector in connectors:
@@ -133,6 +189,7 @@ def output_table_connectors(connectors: List[Dict[str, Any]], tenant_slug: str)
             connector["connector_type"],
             connector["name"],
             format_boolean(connector.get("is_enabled", True)),
+            connector.get("process_status") or "-",
             format_datetime(connector.get("created_at", "")),
         )
 
@@ -145,7 +202,7 @@ def output_table_connector(connector: Dict[str, Any]) -> None:
     Args:
         connector: Connector dictionary
     """
-    table = Table(title=f"Connector: {connector['name']}")
+    table = new_table(f"Connector: {connector['name']}")
     table.add_column("Field", style="cyan")
     table.add_column("Value", style="green")
 
@@ -163,6 +220,22 @@ def output_table_connector(connector: Dict[str, Any]) -> None:
     console.print(table)
 
 
+def output_table_connector_types(connector_types: Sequence[Tuple[str, str]]) -> None:
+    """Output connector types as a table.
+
+    Args:
+        connector_types: Pairs of connector type ID and display name
+    """
+    table = new_table("Available Connector Types")
+    table.add_column("Type", style="cyan")
+    table.add_column("Name", style="green")
+
+    for type_id, name in connector_types:
+        table.add_row(type_id, name)
+
+    console.print(table)
+
+
 def output_table_oauth_credentials(
     credentials: List[Dict[str, Any]], tenant_slug: str
 ) -> None:
@@ -172,7 +245,7 @@ def output_table_oauth_credentials(
         credentials: List of credential dictionaries
         tenant_slug: Tenant slug
     """
-    table = Table(title=f"OAuth Credentials for tenant: {tenant_slug}")
+    table = new_table(f"OAuth Credentials for tenant: {tenant_slug}")
     table.add_column("Provider", style="cyan")
     table.add_column("User ID", style="green")
     table.add_column("Username", style="green")
@@ -181,15 +254,14 @@ def output_table_oauth_credentials(
     table.add_column("Expires")
 
     for cred in credentials:
-        # Determine status
-        status = "✓" if cred.get("is_active") else "✗"
-        if cred.get("expires_at"):
-            try:
-                expires = datetime.fromisoformat(cred["expires_at"].replace("Z", "+00:00"))
-                if expires < datetime.now(expires.tzinfo):
-                    status = "⚠ Expired"
-            except Exception:
-                pass
+        # Parse the expiry once for both the status and the display value
+        raw_expires = cred.get("expires_at")
+        expires = parse_datetime(raw_expires) if raw_expires else None
+
+        if expires and expires < datetime.now(expires.tzinfo):
+            status = "⚠ Expired"
+        else:
+            status = format_boolean(cred.get("is_active"))
 
         table.add_row(
             cred["provider"],
@@ -197,7 +269,7 @@ def output_table_oauth_credentials(
             cred.get("provider_username") or "-",
             cred.get("scopes") or "-",
             status,
-            format_datetime(cred.get("expires_at", "")) if cred.get("expires_at") else "Never",
+            format_datetime(expires or raw_expires) if raw_expires else "Never",
         )
 
     console.print(table)
@@ -209,7 +281,7 @@ def output_table_oauth_providers(providers: List[Dict[str, Any]]) -> None:
     Args:
         providers: List of provider dictionaries
     """
-    table = Table(title="Available OAuth Providers")
+    table = new_table("Available OAuth Providers")
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="green")
     table.add_column("Configured", style="yellow")
@@ -226,6 +298,34 @@ def output_table_oauth_providers(providers: List[Dict[str, Any]]) -> None:
     console.print(table)
 
 
+def output_table_oauth_configs(configs: List[Dict[str, Any]], tenant_slug: str) -> None:
+    """Output tenant OAuth configurations as a table.
+
+    Args:
+        configs: List of OAuth configuration dictionaries
+        tenant_slug: Tenant slug
+    """
+    table = new_table(f"OAuth Configurations for '{tenant_slug}'")
+    table.add_column("Provider", style="cyan")
+    table.add_column("Client ID", style="green")
+    table.add_column("Active", style="yellow")
+    table.add_column("Created", style="blue")
+
+    rows = [
+        (
+            config.get("provider", "N/A"),
+            config.get("client_id", "N/A"),
+            "✓" if config.get("is_active", True) else "✗",
+            (config.get("created_at") or "N/A")[:10],
+        )
+        for config in configs
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
+
+
 def output_table_mcp_tools(tools: List[Dict[str, Any]], connector_name: str) -> None:
     """Output MCP tools as a table.
 
@@ -233,7 +333,7 @@ def output_table_mcp_tools(tools: List[Dict[str, Any]], connector_name: str) ->
         tools: List of tool dictionaries
         connector_name: Connector name
     """
-    table = Table(title=f"MCP Tools for: {connector_name}")
+    table = new_table(f"MCP Tools for: {connector_name}")
     table.add_column("Tool Name", style="cyan")
     table.add_column("Description", style="green")
 
@@ -256,7 +356,7 @@ def output_table_mcp_resources(
         resources: List of resource dictionaries
         connector_name: Connector name
     """
-    table = Table(title=f"MCP Resources for: {connector_name}")
+    table = new_table(f"MCP Resources for: {connector_name}")
     table.add_column("URI", style="cyan")
     table.add_column("Name", style="green")
     table.add_column("Description")
@@ -273,7 +373,9 @@ def output_table_mcp_resources(
 
 
 def output_data(
-    data: Any, format_type: str = "table", table_func: Optional[callable] = None
+    data: Any,
+    format_type: str = "table",
+    table_func: Optional[Callable[[Any], None]] = None,
 ) -> None:
     """Output data in specified format.
 
@@ -282,15 +384,11 @@ def output_data(
         format_type: Output format (table, json, yaml)
         table_func: Optional function to format as table
     """
-    if format_type == "json":
-        output_json(data)
-    elif format_type == "yaml":
-        output_yaml(data)
-    elif format_type == "table" and table_func:
-        table_func(data)
-    else:
-        # Fallback to JSON
-        output_json(data)
+    formatter = OUTPUT_FORMATTERS.get(format_type)
+    if formatter is None:
+        # Tables need a table function; anything else falls back to JSON
+        formatter = table_func if format_type == "table" and table_func else output_json
+    formatter(data)
 
 
 def print_error(message: str) -> None:
@@ -327,3 +425,18 @@ def print_info(message: str) -> None:
         message: Info message
     """
     console.print(f"[bold blue]Info:[/bold blue] {message}")
+
+
+def print_raw(text: str) -> None:
+    """Print text as is, bypassing Rich markup parsing and rendering.
+
+    Used for resource contents, which can be large and may contain square
+    brackets that Rich would take for markup.
+
+    Args:
+        text: Text to print
+    """
+    sys.stdout.write(text)
+    if not text.endswith("\n"):
+        sys.stdout.write("\n")
+    sys.stdout.flush()
@@ -1,10 +1,13 @@
 """Interactive prompt utilities."""
 
+import sys
 from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
+from sage_mcp.cli.utils.output import print_error
+
 console = Console()
 
 
@@ -21,6 +24,25 @@ def confirm(message: str, default: bool = False) -> bool:
     return Confirm.ask(message, default=default)
 
 
+def confirm_or_exit(message: str) -> None:
+    """Ask to confirm a destructive action, exiting unless the user agrees.
+
+    When stdin is not a terminal (scripts, CI) nobody can answer, so this
+    fails right away with exit code 2 instead of waiting on input; such
+    callers pass --force.
+
+    Args:
+        message: Prompt message
+    """
+    if not sys.stdin.isatty():
+        print_error("Confirmation required but stdin is not a terminal; use --force")
+        sys.exit(2)
+
+    if not confirm(message):
+        print_error("Cancelled")
+        sys.exit(0)
+
+
 def prompt_text(
     message: str, default: Optional[str] = None, password: bool = False
 ) -> str:
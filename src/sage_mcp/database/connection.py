@@ -43,11 +43,23 @@ class DatabaseManager:
                 }
             })
 
+        # Keep a warm, bounded pool and discard connections that died while idle
+        engine_kwargs = {"pool_pre_ping": True}
+        if self.settings.environment == "test":
+            engine_kwargs["poolclass"] = NullPool
+        elif not database_url.startswith("sqlite"):
+            engine_kwargs.update({
+                "pool_size": self.settings.database_pool_size,
+                "max_overflow": self.settings.database_max_overflow,
+                "pool_timeout": self.settings.database_pool_timeout,
+                "pool_recycle": self.settings.database_pool_recycle,
+            })
+
         self.engine = create_async_engine(
             database_url,
-            poolclass=NullPool if self.settings.environment == "test" else None,
             echo=self.settings.debug,
             connect_args=connect_args,
+            **engine_kwargs,
         )
 
         self.session_factory = async_sessionmaker(
@@ -1,11 +1,20 @@
 """Database migration utilities."""
 
+import ast
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy import text
 
 from ..models.base import Base
 from ..models.connector_tool_state import ConnectorToolState
 from ..models.mcp_process import MCPProcess
+from ..utils.secret_encryption import (
+    FERNET_TOKEN_PREFIX,
+    MIN_FERNET_TOKEN_LENGTH,
+    encrypt_secret,
+    is_encrypted_secret,
+)
 from .connection import db_manager
 
 
@@ -289,3 +298,223 @@ async def upgrade_remove_connector_unique_constraint(engine: AsyncEngine = None)
             print("✓ Dropped unique constraint uq_tenant_connector_type from connectors table")
         else:
             print("✓ Unique constraint uq_tenant_connector_type does not exist")
+
+
+async def upgrade_cascade_oauth_config_tenant_fk(engine: AsyncEngine = None):
+    """Migration: Make oauth_configs.tenant_id cascade on tenant delete.
+
+    Tenant deletion relies on ON DELETE CASCADE to remove dependent rows in a
+    single statement. Older databases created oauth_configs without it.
+
+    Safe to run on existing databases - checks the current delete rule first.
+    """
+    if engine is None:
+        if not db_manager.engine:
+            db_manager.initialize()
+        engine = db_manager.engine
+
+    async with engine.begin() as conn:
+        # Find the foreign key constraint and its delete rule
+        result = await conn.execute(text(
+            "SELECT rc.constraint_name, rc.delete_rule "
+            "FROM information_schema.referential_constraints rc "
+            "JOIN information_schema.key_column_usage kcu "
+            "ON rc.constraint_name = kcu.constraint_name "
+            "WHERE kcu.table_name = 'oauth_configs' "
+            "AND kcu.column_name = 'tenant_id'"
+        ))
+        row = result.first()
+
+        if row and row.delete_rule != "CASCADE":
+            await conn.execute(text(
+                f"ALTER TABLE oauth_configs DROP CONSTRAINT {row.constraint_name}"
+            ))
+            await conn.execute(text(
+                f"ALTER TABLE oauth_configs ADD CONSTRAINT {row.constraint_name} "
+                "FOREIGN KEY (tenant_id) REFERENCES tenants (id) ON DELETE CASCADE"
+            ))
+            print("✓ Added ON DELETE CASCADE to oauth_configs.tenant_id")
+        else:
+            print("✓ oauth_configs.tenant_id already cascades on delete")
+
+
+async def upgrade_add_connector_tenant_type_index(engine: AsyncEngine = None):
+    """Migration: Add composite index on connectors (tenant_id, connector_type).
+
+    Tenant-scoped connector queries and the per-type uniqueness check in
+    create_connector filter on both columns. Tenant.slug is already covered
+    by a unique index.
+
+    Safe to run on existing databases - uses CREATE INDEX IF NOT EXISTS.
+    """
+    if engine is None:
+        if not db_manager.engine:
+            db_manager.initialize()
+        engine = db_manager.engine
+
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_connectors_tenant_id_connector_type "
+            "ON connectors (tenant_id, connector_type)"
+        ))
+        print("✓ Ensured index ix_connectors_tenant_id_connector_type exists")
+
+
+async def upgrade_add_oauth_unique_constraints(engine: AsyncEngine = None):
+    """Migration: Enforce one OAuth config per provider and one credential per account.
+
+    Adds the uq_oauth_config_tenant_provider constraint on oauth_configs and the
+    unique ix_oauth_cred_tenant_provider_user index on oauth_credentials. Both
+    back the OAuth endpoint lookups and allow single-statement upserts.
+    Duplicate rows left by earlier select-then-insert races are removed first,
+    keeping the most recently updated row.
+
+    Safe to run on existing databases - checks for the constraint and uses
+    CREATE UNIQUE INDEX IF NOT EXISTS.
+    """
+    if engine is None:
+        if not db_manager.engine:
+            db_manager.initialize()
+        engine = db_manager.engine
+
+    async with engine.begin() as conn:
+        result = await conn.execute(text(
+            "SELECT constraint_name FROM information_schema.table_constraints "
+            "WHERE table_name = 'oauth_configs' "
+            "AND constraint_type = 'UNIQUE' "
+            "AND constraint_name = 'uq_oauth_config_tenant_provider'"
+        ))
+        constraint_exists = result.scalar_one_or_none()
+
+        if not constraint_exists:
+            await conn.execute(text(
+                "DELETE FROM oauth_configs a USING oauth_configs b "
+                "WHERE a.tenant_id = b.tenant_id AND a.provider = b.provider "
+                "AND (a.updated_at, a.id) < (b.updated_at, b.id)"
+            ))
+            await conn.execute(text(
+                "ALTER TABLE oauth_configs "
+                "ADD CONSTRAINT uq_oauth_config_tenant_provider "
+                "UNIQUE (tenant_id, provider)"
+            ))
+            print(
+                "✓ Added unique constraint uq_oauth_config_tenant_provider "
+                "to oauth_configs table"
+            )
+        else:
+            print(
+                "✓ Unique constraint uq_oauth_config_tenant_provider already exists"
+            )
+
+        await conn.execute(text(
+            "DELETE FROM oauth_credentials a USING oauth_credentials b "
+            "WHERE a.tenant_id = b.tenant_id AND a.provider = b.provider "
+            "AND a.provider_user_id = b.provider_user_id "
+            "AND (a.updated_at, a.id) < (b.updated_at, b.id)"
+        ))
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_oauth_cred_tenant_provider_user "
+            "ON oauth_credentials (tenant_id, provider, provider_user_id)"
+        ))
+        print("✓ Ensured index ix_oauth_cred_tenant_provider_user exists")
+
+
+async def upgrade_convert_oauth_provider_data_to_json(engine: AsyncEngine = None):
+    """Migration: Rewrite oauth_credentials.provider_data as JSON.
+
+    Older callbacks stored str(user_info), a Python repr that JSON cannot parse.
+    provider_data is now a JSON column, so legacy values are converted with
+    ast.literal_eval and unparseable ones are cleared.
+
+    Safe to run on existing databases - only rows that do not hold a JSON object
+    are selected. A JSON object starts with '{"' (or is '{}'), while str(dict)
+    starts with "{'", so once every row is converted the query matches nothing
+    and later startups do no work.
+    """
+    if engine is None:
+        if not db_manager.engine:
+            db_manager.initialize()
+        engine = db_manager.engine
+
+    converted = 0
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT id, provider_data FROM oauth_credentials "
+                "WHERE provider_data IS NOT NULL "
+                "AND provider_data NOT LIKE :json_object "
+                "AND provider_data <> :empty_object"
+            ),
+            {"json_object": '{"%', "empty_object": "{}"},
+        )
+        for row in result.all():
+            try:
+                orjson.loads(row.provider_data)
+                continue
+            except orjson.JSONDecodeError:
+                pass
+
+            try:
+                data = orjson.dumps(ast.literal_eval(row.provider_data)).decode()
+            except (ValueError, SyntaxError, TypeError):
+                data = None
+
+            await conn.execute(
+                text(
+                    "UPDATE oauth_credentials SET provider_data = :data WHERE id = :id"
+                ),
+                {"data": data, "id": row.id}
+            )
+            converted += 1
+
+    if converted:
+        print(
+            f"✓ Converted {converted} legacy oauth_credentials.provider_data values "
+            "to JSON"
+        )
+
+
+async def upgrade_encrypt_oauth_client_secrets(engine: AsyncEngine = None):
+    """Migration: Encrypt plaintext oauth_configs.client_secret values.
+
+    Client secrets are now stored as Fernet tokens keyed from SECRET_KEY and
+    decrypted only for the token exchange.
+
+    Safe to run on existing databases - only values that are not Fernet tokens
+    are encrypted. Tokens are recognized by their structure, not by decrypting
+    them, so tokens from a previous SECRET_KEY are left alone (and reported as
+    undecryptable at use) instead of being wrapped a second time. The query
+    selects values without the token prefix, and prefixed values too short to
+    be a token; once every row is encrypted it matches nothing, so later
+    startups do no work.
+    """
+    if engine is None:
+        if not db_manager.engine:
+            db_manager.initialize()
+        engine = db_manager.engine
+
+    encrypted = 0
+    async with engine.begin() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT id, client_secret FROM oauth_configs "
+                "WHERE client_secret NOT LIKE :prefix "
+                "OR LENGTH(client_secret) < :min_length"
+            ),
+            {
+                "prefix": f"{FERNET_TOKEN_PREFIX}%",
+                "min_length": MIN_FERNET_TOKEN_LENGTH,
+            },
+        )
+        for row in result.all():
+            if is_encrypted_secret(row.client_secret):
+                continue
+
+            await conn.execute(
+                text("UPDATE oauth_configs SET client_secret = :secret WHERE id = :id"),
+                {"secret": encrypt_secret(row.client_secret), "id": row.id}
+            )
+            encrypted += 1
+
+    if encrypted:
+        print(f"✓ Encrypted {encrypted} plaintext oauth_configs.client_secret values")
@@ -16,6 +16,11 @@ from .database.migrations import (
     upgrade_add_runtime_type_values,
     upgrade_add_process_status_values,
     upgrade_remove_connector_unique_constraint,
+    upgrade_cascade_oauth_config_tenant_fk,
+    upgrade_add_connector_tenant_type_index,
+    upgrade_add_oauth_unique_constraints,
+    upgrade_convert_oauth_provider_data_to_json,
+    upgrade_encrypt_oauth_client_secrets,
 )
 
 # Import connectors to register them
@@ -40,6 +45,11 @@ async def lifespan(app: FastAPI):
     await upgrade_add_runtime_type_values()
     await upgrade_add_process_status_values()
     await upgrade_remove_connector_unique_constraint()
+    await upgrade_cascade_oauth_config_tenant_fk()
+    await upgrade_add_connector_tenant_type_index()
+    await upgrade_add_oauth_unique_constraints()
+    await upgrade_convert_oauth_provider_data_to_json()
+    await upgrade_encrypt_oauth_client_secrets()
 
     # Warm up HTTP client (creates connection pool)
     from .connectors.http_client import get_http_client
@@ -1,6 +1,7 @@
 """MCP (Model Context Protocol) implementation."""
 
+from .pool import TransportPool
 from .server import MCPServer
 from .transport import MCPTransport
 
-__all__ = ["MCPServer", "MCPTransport"]
+__all__ = ["MCPServer", "MCPTransport", "TransportPool"]
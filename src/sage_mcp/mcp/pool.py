@@ -0,0 +1,99 @@
+"""Pool of initialized MCP transports shared across requests."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from .transport import MCPTransport
+
+
+class TransportPool:
+    """Reuse initialized MCPTransport instances per (tenant_slug, connector_id).
+
+    Request handling does not mutate a transport, so one initialized transport
+    is shared by concurrent requests instead of being checked out exclusively.
+    Transports carrying a user token are never pooled so that tokens cannot
+    leak between requests.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_size: int = 4096):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        # (tenant_slug, connector_id) -> (transport, expires_at)
+        self._entries: Dict[Tuple[str, str], Tuple[MCPTransport, float]] = {}
+        # Per-key locks so concurrent misses initialize a transport only once
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    @staticmethod
+    def _key(tenant_slug: str, connector_id: str) -> Tuple[str, str]:
+        return tenant_slug, str(connector_id).lower()
+
+    @asynccontextmanager
+    async def acquire(
+        self, tenant_slug: str, connector_id: str, user_token: Optional[str] = None
+    ) -> AsyncIterator[MCPTransport]:
+        """Yield a transport for the connector, reusing a pooled one when possible."""
+        if user_token:
+            yield MCPTransport(tenant_slug, connector_id, user_token=user_token)
+        else:
+            yield await self._get(tenant_slug, connector_id)
+
+    async def _get(self, tenant_slug: str, connector_id: str) -> MCPTransport:
+        key = self._key(tenant_slug, connector_id)
+        transport = self._lookup(key)
+        if transport:
+            return transport
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have initialized it while we waited
+            transport = self._lookup(key)
+            if transport:
+                return transport
+
+            transport = MCPTransport(tenant_slug, connector_id)
+            initialized = False
+            try:
+                initialized = await transport.initialize()
+            finally:
+                if initialized:
+                    self._store(key, transport)
+                else:
+                    # Nothing is pooled for the key, so don't keep its lock
+                    # either; requests already waiting on it still get it
+                    self._entries.pop(key, None)
+                    if self._locks.get(key) is lock:
+                        del self._locks[key]
+
+        return transport
+
+    def _lookup(self, key: Tuple[str, str]) -> Optional[MCPTransport]:
+        entry = self._entries.get(key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        return None
+
+    def _store(self, key: Tuple[str, str], transport: MCPTransport) -> None:
+        if key not in self._entries and len(self._entries) >= self.max_size:
+            # Evict the oldest entry (dicts preserve insertion order)
+            oldest = next(iter(self._entries))
+            del self._entries[oldest]
+            self._locks.pop(oldest, None)
+        self._entries[key] = (transport, time.monotonic() + self.ttl_seconds)
+
+    def invalidate(self, tenant_slug: str, connector_id: Optional[str] = None) -> None:
+        """Drop pooled transports after a tenant or connector has been modified."""
+        if connector_id is not None:
+            keys = [self._key(tenant_slug, connector_id)]
+        else:
+            keys = [key for key in self._entries if key[0] == tenant_slug]
+
+        for key in keys:
+            self._entries.pop(key, None)
+            self._locks.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all pooled transports."""
+        self._entries.clear()
+        self._locks.clear()
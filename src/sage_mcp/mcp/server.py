@@ -1,11 +1,13 @@
 """MCP Server implementation for multi-tenant support."""
 
+import uuid
 from typing import Any, Dict, List, Optional
 
 from mcp import types
 from mcp.server import Server
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, selectinload, undefer_group
 
 from ..database.connection import get_db_context
 from ..models.tenant import Tenant
@@ -31,24 +33,33 @@ class MCPServer:
     async def initialize(self) -> bool:
         """Initialize the MCP server for a specific connector."""
         async with get_db_context() as session:
-            # Load tenant
-            tenant = await self._get_tenant(session, self.tenant_slug)
-            if not tenant or not tenant.is_active:
-                return False
-
-            self.tenant = tenant
-
-            # Load specific connector by ID
+            # Load specific connector by ID, together with its tenant
             if self.connector_id:
-                connector = await self._get_connector_by_id(session, self.connector_id, tenant.id)
-                if not connector or not connector.is_enabled:
+                connector = await self._get_connector_by_id(
+                    session, self.connector_id, self.tenant_slug
+                )
+                if (
+                    not connector
+                    or not connector.tenant.is_active
+                    or not connector.is_enabled
+                ):
                     return False
 
+                self.tenant = connector.tenant
                 self.connector = connector
                 self.connectors = [connector]  # For backward compatibility with existing handlers
-            else:
-                # Fallback: Load all enabled connectors for this tenant (for backward compatibility)
-                self.connectors = await self._get_tenant_connectors(session, tenant.id)
+                return True
+
+            # Fallback: Load tenant with all its connectors prefetched
+            # (for backward compatibility)
+            tenant = await self._get_tenant(session, self.tenant_slug)
+            if not tenant or not tenant.is_active:
+                return False
+
+            self.tenant = tenant
+            self.connectors = [
+                connector for connector in tenant.connectors if connector.is_enabled
+            ]
 
             return True
 
@@ -155,44 +166,34 @@ class MCPServer:
                 raise ValueError(f"Error reading resource {uri}: {str(e)}")
 
     async def _get_tenant(self, session: AsyncSession, tenant_slug: str) -> Optional[Tenant]:
-        """Get tenant by slug."""
-        from sqlalchemy import select
-
+        """Get tenant by slug, with its connectors loaded in a single IN query."""
         result = await session.execute(
-            select(Tenant).where(Tenant.slug == tenant_slug)
+            select(Tenant)
+            .options(selectinload(Tenant.connectors))
+            .where(Tenant.slug == tenant_slug)
         )
         return result.scalar_one_or_none()
 
-    async def _get_connector_by_id(self, session: AsyncSession, connector_id: str, tenant_id: str) -> Optional[Connector]:
-        """Get a specific connector by ID."""
-        from sqlalchemy import select
-        import uuid
-
+    async def _get_connector_by_id(
+        self, session: AsyncSession, connector_id: str, tenant_slug: str
+    ) -> Optional[Connector]:
+        """Get a specific connector by ID, together with its tenant."""
         try:
             connector_uuid = uuid.UUID(connector_id)
         except ValueError:
             return None
 
         result = await session.execute(
-            select(Connector).where(
+            select(Connector)
+            .join(Connector.tenant)
+            .options(contains_eager(Connector.tenant))
+            .where(
                 Connector.id == connector_uuid,
-                Connector.tenant_id == tenant_id
+                Tenant.slug == tenant_slug
             )
         )
         return result.scalar_one_or_none()
 
-    async def _get_tenant_connectors(self, session: AsyncSession, tenant_id: str) -> List[Connector]:
-        """Get enabled connectors for a tenant."""
-        from sqlalchemy import select
-
-        result = await session.execute(
-            select(Connector).where(
-                Connector.tenant_id == tenant_id,
-                Connector.is_enabled
-            )
-        )
-        return list(result.scalars().all())
-
     async def _get_connector_tools(self, connector: Connector) -> List[types.Tool]:
         """Get tools for a specific connector, filtered by enabled state."""
         print(f"DEBUG: Getting tools for connector {connector.name} ({connector.connector_type.value})")
@@ -323,10 +324,10 @@ class MCPServer:
 
         # Fallback to tenant-level credential from database
         async with get_db_context() as session:
-            from sqlalchemy import select
-
             result = await session.execute(
-                select(OAuthCredential).where(
+                select(OAuthCredential)
+                .options(undefer_group("tokens"))
+                .where(
                     OAuthCredential.tenant_id == tenant_id,
                     OAuthCredential.provider == provider,
                     OAuthCredential.is_active.is_(True)
@@ -1,8 +1,7 @@
 """MCP transport layer for HTTP and WebSocket connections."""
 
-import asyncio
 import json
-from typing import Any, Dict
+from typing import Any, AsyncIterable, AsyncIterator, Dict
 
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -89,45 +88,48 @@ class MCPTransport:
             except Exception:
                 pass
 
-    async def handle_sse(self, messages: asyncio.Queue):
-        """Handle Server-Sent Events for MCP protocol."""
+    async def handle_sse(
+        self, messages: AsyncIterable[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Handle Server-Sent Events for MCP protocol.
+
+        Consumes client messages from ``messages`` and yields responses to send
+        as SSE events, without an intermediate queue between the two.
+        """
         if not await self.initialize():
-            await messages.put({
+            yield {
                 "error": "Tenant not found or inactive",
                 "code": 4004
-            })
+            }
             return
 
         try:
-            # For now, handle SSE through message queue processing
-            while True:
-                try:
-                    # Get message from queue (this would be from client)
-                    message = await messages.get()
-                    if message is None:  # Sentinel to close
-                        break
+            async for message in messages:
+                if message is None:  # Sentinel to close
+                    break
 
+                try:
                     # Process the message
                     response = await self.handle_http_message(message)
-
-                    # Send response back through the queue only if there is a response
-                    # (notifications return None and don't expect a response)
-                    if response is not None:
-                        await messages.put(response)
-
                 except Exception as e:
                     print(f"SSE message processing error: {e}")
-                    await messages.put({
+                    yield {
                         "error": f"Internal server error: {str(e)}",
                         "code": 1011
-                    })
+                    }
+                    continue
+
+                # Only yield when there is a response
+                # (notifications return None and don't expect a response)
+                if response is not None:
+                    yield response
 
         except Exception as e:
             print(f"SSE error for tenant {self.tenant_slug}: {e}")
-            await messages.put({
+            yield {
                 "error": f"Internal server error: {str(e)}",
                 "code": 1011
-            })
+            }
 
     async def handle_http_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Handle single HTTP message for MCP protocol."""
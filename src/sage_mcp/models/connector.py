@@ -1,11 +1,11 @@
 """Connector model for managing tenant-specific connector configurations."""
 
 import enum
-import json
 import uuid
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import Boolean, Enum, ForeignKey, String, Text, TypeDecorator
+import orjson
+from sqlalchemy import Boolean, Enum, ForeignKey, Index, String, Text, TypeDecorator
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,13 +21,13 @@ class JSONType(TypeDecorator):
     def process_bind_param(self, value: Optional[Dict[str, Any]], dialect) -> Optional[str]:
         """Convert dict to JSON string before storing."""
         if value is not None:
-            return json.dumps(value)
+            return orjson.dumps(value).decode()
         return None
 
     def process_result_value(self, value: Optional[str], dialect) -> Optional[Dict[str, Any]]:
         """Convert JSON string back to dict after loading."""
         if value is not None:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
 
 
@@ -70,6 +70,10 @@ class Connector(Base):
     """Connector configuration for tenants."""
 
     __tablename__ = "connectors"
+    __table_args__ = (
+        # Serves tenant-scoped lookups and the one-connector-per-type check
+        Index("ix_connectors_tenant_id_connector_type", "tenant_id", "connector_type"),
+    )
 
     # Foreign key to tenant
     tenant_id: Mapped[uuid.UUID] = mapped_column(
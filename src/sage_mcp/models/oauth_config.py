@@ -1,4 +1,6 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import (
+    Column, String, DateTime, Boolean, ForeignKey, Text, UniqueConstraint
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -10,12 +12,23 @@ from .base import Base
 class OAuthConfig(Base):
     """OAuth application configuration for each tenant and provider."""
     __tablename__ = "oauth_configs"
+    __table_args__ = (
+        # One OAuth application per tenant and provider; also serves the
+        # (tenant_id, provider) lookups in the OAuth endpoints
+        UniqueConstraint(
+            "tenant_id", "provider", name="uq_oauth_config_tenant_provider"
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
+    tenant_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     provider = Column(String(50), nullable=False)  # github, slack
     client_id = Column(String(255), nullable=False)
-    client_secret = Column(Text, nullable=False)  # Encrypted in production
+    client_secret = Column(Text, nullable=False)  # Fernet token, see secret_encryption
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -2,13 +2,14 @@
 
 import uuid
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .connector import JSONType
 
 if TYPE_CHECKING:
     from .tenant import Tenant
@@ -18,6 +19,14 @@ class OAuthCredential(Base):
     """OAuth credentials for tenant-specific service access."""
 
     __tablename__ = "oauth_credentials"
+    __table_args__ = (
+        # One credential per provider account and tenant
+        Index(
+            "ix_oauth_cred_tenant_provider_user",
+            "tenant_id", "provider", "provider_user_id",
+            unique=True
+        ),
+    )
 
     # Foreign key to tenant
     tenant_id: Mapped[uuid.UUID] = mapped_column(
@@ -37,8 +46,14 @@ class OAuthCredential(Base):
     provider_username: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # OAuth tokens
-    access_token: Mapped[str] = mapped_column(Text, nullable=False)
-    refresh_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Deferred so that listings never load them; code paths that call the
+    # provider API undefer the "tokens" group explicitly
+    access_token: Mapped[str] = mapped_column(
+        Text, nullable=False, deferred=True, deferred_group="tokens"
+    )
+    refresh_token: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="tokens"
+    )
     token_type: Mapped[str] = mapped_column(String(50), default="bearer", nullable=False)
 
     # Token expiration
@@ -47,8 +62,10 @@ class OAuthCredential(Base):
     # OAuth scopes granted
     scopes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Additional provider-specific data (JSON)
-    provider_data: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Additional provider-specific data (user info returned by the provider)
+    provider_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONType, nullable=True, deferred=True
+    )
 
     # Status
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
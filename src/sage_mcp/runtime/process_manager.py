@@ -2,10 +2,11 @@
 
 import asyncio
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Optional
 
 from sqlalchemy import select, update
+from sqlalchemy.orm import undefer_group
 
 from .generic_connector import GenericMCPConnector
 from ..database.connection import get_db_context
@@ -227,7 +228,9 @@ class MCPProcessManager:
 
                                 # Get OAuth credential
                                 result = await session.execute(
-                                    select(OAuthCredential).where(
+                                    select(OAuthCredential)
+                                    .options(undefer_group("tokens"))
+                                    .where(
                                         OAuthCredential.tenant_id == tenant_id,
                                         OAuthCredential.provider
                                         == connector.connector_type.value,
@@ -271,7 +274,7 @@ class MCPProcessManager:
                                     MCPProcess.tenant_id == tenant_id,
                                     MCPProcess.connector_id == connector_id,
                                 )
-                                .values(last_health_check=datetime.utcnow())
+                                .values(last_health_check=datetime.now(timezone.utc))
                             )
                             await session.commit()
 
@@ -319,7 +322,7 @@ class MCPProcessManager:
                 if restart_count is not None:
                     update_values["restart_count"] = restart_count
                 if status == ProcessStatus.RUNNING:
-                    update_values["last_health_check"] = datetime.utcnow()
+                    update_values["last_health_check"] = datetime.now(timezone.utc)
 
                 await session.execute(
                     update(MCPProcess)
@@ -338,15 +341,16 @@ class MCPProcessManager:
                     connector = result.scalar_one_or_none()
 
                     if connector:
+                        now = datetime.now(timezone.utc)
                         new_process = MCPProcess(
                             connector_id=connector_id,
                             tenant_id=tenant_id,
                             pid=pid,
                             runtime_type=connector.runtime_type.value,
                             status=status,
-                            started_at=datetime.utcnow(),
+                            started_at=now,
                             last_health_check=(
-                                datetime.utcnow()
+                                now
                                 if status == ProcessStatus.RUNNING
                                 else None
                             ),
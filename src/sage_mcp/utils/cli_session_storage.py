@@ -5,7 +5,7 @@ can poll for. Sessions expire after 5 minutes.
 """
 
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 from threading import Lock
 
@@ -34,7 +34,7 @@ class CLISessionStorage:
             self._sessions[session_id] = {
                 "data": data,
                 "expires_at": time.time() + self._expiry_seconds,
-                "created_at": datetime.utcnow().isoformat()
+                "created_at": datetime.now(timezone.utc).isoformat()
             }
             # Clean up expired sessions
             self._cleanup_expired()
@@ -0,0 +1,102 @@
+"""Encryption at rest for OAuth client secrets.
+
+Client secrets configured per tenant are stored as Fernet tokens under a key
+derived from the application secret key. The plaintext is only needed for the
+outbound token exchange, so decrypted values are cached in-process for a short
+time and bursts of OAuth callbacks do not pay for a decryption each.
+"""
+
+import base64
+import binascii
+import hashlib
+import time
+from typing import Dict, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from ..config import get_settings
+
+DECRYPT_CACHE_TTL_SECONDS = 300.0
+MAX_CACHED_SECRETS = 1024
+
+# Fernet tokens are urlsafe base64 of a 0x80 version byte, an 8-byte timestamp,
+# a 16-byte IV, at least one 16-byte AES block and a 32-byte HMAC
+FERNET_VERSION = 0x80
+MIN_FERNET_TOKEN_BYTES = 1 + 8 + 16 + 16 + 32
+# Shortest stored token, in (padded) base64 characters
+MIN_FERNET_TOKEN_LENGTH = (MIN_FERNET_TOKEN_BYTES + 2) // 3 * 4
+
+# Every token starts with this, as the version byte is followed by the high
+# (zero) bytes of the timestamp
+FERNET_TOKEN_PREFIX = "gAAAAA"
+
+# (secret key, ciphertext) -> (plaintext, expires_at)
+_decrypted: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+_fernet: Optional[Tuple[str, Fernet]] = None
+
+
+def _get_fernet() -> Fernet:
+    """Return a Fernet instance keyed from the current application secret key."""
+    global _fernet
+    secret_key = get_settings().secret_key
+    if _fernet is None or _fernet[0] != secret_key:
+        key_material = f"sage-mcp:oauth-client-secret:{secret_key}".encode()
+        digest = hashlib.sha256(key_material).digest()
+        _fernet = (secret_key, Fernet(base64.urlsafe_b64encode(digest)))
+    return _fernet[1]
+
+
+def is_encrypted_secret(value: str) -> bool:
+    """Check whether a stored value is a Fernet token rather than plaintext.
+
+    This only looks at the token structure, so values encrypted under a
+    previous secret key are still recognized as ciphertext.
+    """
+    if not value.startswith(FERNET_TOKEN_PREFIX):
+        return False
+    try:
+        token = base64.urlsafe_b64decode(value.encode())
+    except (ValueError, binascii.Error):
+        return False
+    return len(token) >= MIN_FERNET_TOKEN_BYTES and token[0] == FERNET_VERSION
+
+
+def encrypt_secret(plaintext: str) -> str:
+    """Encrypt a secret for storage."""
+    return _get_fernet().encrypt(plaintext.encode()).decode()
+
+
+def decrypt_secret(ciphertext: str) -> Optional[str]:
+    """Decrypt a stored secret.
+
+    Args:
+        ciphertext: Value previously returned by ``encrypt_secret``
+
+    Returns:
+        The plaintext secret, or None if the value cannot be decrypted with
+        the current secret key
+    """
+    now = time.monotonic()
+    # Keyed by the secret key too, so a key change never serves stale plaintext
+    cache_key = (get_settings().secret_key, ciphertext)
+    entry = _decrypted.get(cache_key)
+    if entry and entry[1] > now:
+        return entry[0]
+
+    try:
+        plaintext = _get_fernet().decrypt(ciphertext.encode()).decode()
+    except InvalidToken:
+        return None
+
+    if cache_key not in _decrypted and len(_decrypted) >= MAX_CACHED_SECRETS:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _decrypted.pop(next(iter(_decrypted)))
+    _decrypted[cache_key] = (plaintext, now + DECRYPT_CACHE_TTL_SECONDS)
+
+    return plaintext
+
+
+def clear_secret_cache() -> None:
+    """Drop all cached plaintext secrets."""
+    _decrypted.clear()
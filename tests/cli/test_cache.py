@@ -0,0 +1,87 @@
+"""Tests for the CLI response cache."""
+
+import stat
+
+from sage_mcp.cli.utils.cache import ResponseCache
+
+
+def test_set_and_get(tmp_path):
+    """Test stored responses are returned and fresh within their TTL."""
+    cache = ResponseCache(tmp_path)
+    cache.set("http://api/tenants/test", {"slug": "test"}, 60, '"etag"')
+
+    entry = cache.get("http://api/tenants/test")
+
+    assert entry["data"] == {"slug": "test"}
+    assert entry["etag"] == '"etag"'
+    assert cache.is_fresh(entry)
+
+
+def test_expired_entry_is_kept_for_revalidation(tmp_path):
+    """Test expired entries are still returned but not fresh."""
+    cache = ResponseCache(tmp_path)
+    cache.set("http://api/providers", [], -1)
+
+    entry = cache.get("http://api/providers")
+
+    assert entry is not None
+    assert not cache.is_fresh(entry)
+
+
+def test_missing_entry(tmp_path):
+    """Test a missing entry returns None."""
+    assert ResponseCache(tmp_path / "missing").get("http://api/providers") is None
+
+
+def test_invalidate_removes_entry_and_children(tmp_path):
+    """Test invalidating a key removes entries below it but not siblings."""
+    cache = ResponseCache(tmp_path)
+    cache.set("http://api/tenants/test", {}, 60)
+    cache.set("http://api/tenants/test/connectors/1", {}, 60)
+    cache.set("http://api/tenants/test-other", {}, 60)
+
+    cache.invalidate("http://api/tenants/test")
+
+    assert cache.get("http://api/tenants/test") is None
+    assert cache.get("http://api/tenants/test/connectors/1") is None
+    assert cache.get("http://api/tenants/test-other") is not None
+
+
+def test_entries_are_scoped(tmp_path):
+    """Test entries are only returned for the scope they were stored under."""
+    cache = ResponseCache(tmp_path)
+    cache.set("http://api/tenants/test", {"slug": "test"}, 60, scope="a")
+
+    assert cache.get("http://api/tenants/test", "a") is not None
+    assert cache.get("http://api/tenants/test", "b") is None
+    assert cache.get("http://api/tenants/test") is None
+
+
+def test_invalidate_removes_entry_in_every_scope(tmp_path):
+    """Test invalidating a key removes it for all scopes."""
+    cache = ResponseCache(tmp_path)
+    cache.set("http://api/tenants/test", {}, 60, scope="a")
+    cache.set("http://api/tenants/test", {}, 60, scope="b")
+
+    cache.invalidate("http://api/tenants/test")
+
+    assert cache.get("http://api/tenants/test", "a") is None
+    assert cache.get("http://api/tenants/test", "b") is None
+
+
+def test_cache_is_private_to_owner(tmp_path):
+    """Test the cache directory and entries are created owner-only."""
+    cache = ResponseCache(tmp_path / "cache")
+    cache.set("http://api/tenants/test", {"configuration": {"token": "x"}}, 60)
+
+    assert stat.S_IMODE(cache.cache_dir.stat().st_mode) == 0o700
+    for path in cache.cache_dir.iterdir():
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_unserializable_data_is_not_cached(tmp_path):
+    """Test write failures are ignored."""
+    cache = ResponseCache(tmp_path)
+    cache.set("http://api/providers", object(), 60)
+
+    assert cache.get("http://api/providers") is None
@@ -1,10 +1,17 @@
 """Tests for CLI API client."""
 
+import orjson
 import pytest
-from unittest.mock import Mock, patch
-
-from sage_mcp.cli.client import APIError, SageMCPClient
+from unittest.mock import AsyncMock, Mock, patch
+
+from sage_mcp.cli.client import (
+    APIError,
+    AsyncSageMCPClient,
+    SageMCPClient,
+    get_profile_client,
+)
 from sage_mcp.cli.config import ProfileConfig
+from sage_mcp.cli.utils.cache import response_cache
 
 
 @pytest.fixture
@@ -17,6 +24,13 @@ def profile_config():
     )
 
 
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path):
+    """Keep cached responses out of the user's configuration directory."""
+    with patch.object(response_cache, "cache_dir", tmp_path / "cache"):
+        yield response_cache
+
+
 @pytest.fixture
 def client(profile_config):
     """Create a test client."""
@@ -47,15 +61,22 @@ def test_client_get_headers_no_api_key():
     assert "Authorization" not in headers
 
 
+def test_api_error_exit_code():
+    """Test API errors map client errors to 3 and everything else to 4."""
+    assert APIError("Not found", 404).cli_exit_code == 3
+    assert APIError("Server error", 500).cli_exit_code == 4
+    assert APIError("Connection refused").cli_exit_code == 4
+
+
 @patch("httpx.Client")
 def test_list_tenants_success(mock_client_class, client):
     """Test successful tenant listing."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [
+    mock_response.content = orjson.dumps([
         {"slug": "tenant1", "name": "Tenant 1"},
         {"slug": "tenant2", "name": "Tenant 2"},
-    ]
+    ])
     mock_response.raise_for_status = Mock()
 
     mock_client = Mock()
@@ -76,11 +97,11 @@ def test_create_tenant_success(mock_client_class, client):
     """Test successful tenant creation."""
     mock_response = Mock()
     mock_response.status_code = 201
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "slug": "new-tenant",
         "name": "New Tenant",
         "is_active": True,
-    }
+    })
     mock_response.raise_for_status = Mock()
 
     mock_client = Mock()
@@ -103,7 +124,7 @@ def test_api_error_handling(mock_client_class, client):
 
     mock_response = Mock()
     mock_response.status_code = 404
-    mock_response.json.return_value = {"detail": "Tenant not found"}
+    mock_response.content = orjson.dumps({"detail": "Tenant not found"})
 
     mock_client = Mock()
     mock_client.__enter__ = Mock(return_value=mock_client)
@@ -137,6 +158,29 @@ def test_ping_success(client):
         assert result is True
 
 
+def test_ping_result_is_cached(client):
+    """Test repeated pings reuse the first result."""
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock()
+        mock_client.get.return_value = Mock(status_code=200)
+        mock_client_class.return_value = mock_client
+
+        assert client.ping() is True
+        assert client.ping() is True
+        mock_client.get.assert_called_once_with("/health", timeout=5)
+
+
+def test_ping_timeout(client):
+    """Test the health check uses the given timeout."""
+    with patch("httpx.Client") as mock_client_class:
+        mock_client = Mock()
+        mock_client.get.return_value = Mock(status_code=200)
+        mock_client_class.return_value = mock_client
+
+        assert client.ping(timeout=2) is True
+        mock_client.get.assert_called_once_with("/health", timeout=2)
+
+
 def test_ping_failure(client):
     """Test failed ping."""
     with patch("httpx.Client") as mock_client_class:
@@ -176,11 +220,11 @@ def test_get_cli_session_result_success(mock_client_class, client):
     """Test successful CLI session result retrieval."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "status": "success",
         "provider": "github",
         "provider_user_id": "12345"
-    }
+    })
     mock_response.raise_for_status = Mock()
 
     mock_client = Mock()
@@ -194,8 +238,7 @@ def test_get_cli_session_result_success(mock_client_class, client):
     assert result["status"] == "success"
     assert result["provider"] == "github"
     mock_client.get.assert_called_once_with(
-        "http://test.example.com/api/v1/oauth/cli-sessions/cli-session-abc123",
-        headers=client._get_headers()
+        "/api/v1/oauth/cli-sessions/cli-session-abc123"
     )
 
 
@@ -204,10 +247,10 @@ def test_list_oauth_configs(mock_client_class, client):
     """Test listing OAuth configurations."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [
+    mock_response.content = orjson.dumps([
         {"provider": "github", "client_id": "abc123", "is_active": True},
         {"provider": "slack", "client_id": "xyz789", "is_active": True}
-    ]
+    ])
     mock_response.raise_for_status = Mock()
 
     mock_client = Mock()
@@ -228,11 +271,11 @@ def test_create_oauth_config(mock_client_class, client):
     """Test creating OAuth configuration."""
     mock_response = Mock()
     mock_response.status_code = 201
-    mock_response.json.return_value = {
+    mock_response.content = orjson.dumps({
         "provider": "github",
         "client_id": "new-client-id",
         "is_active": True
-    }
+    })
     mock_response.raise_for_status = Mock()
 
     mock_client = Mock()
@@ -257,7 +300,7 @@ def test_delete_oauth_config(mock_client_class, client):
     """Test deleting OAuth configuration."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {"message": "Configuration deleted"}
+    mock_response.content = orjson.dumps({"message": "Configuration deleted"})
     mock_response.raise_for_status = Mock()
 
     mock_client = Mock()
@@ -277,11 +320,11 @@ def test_get_available_connector_types(mock_client_class, client):
     """Test getting available connector types."""
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = [
+    mock_response.content = orjson.dumps([
         {"id": "github", "name": "GitHub"},
         {"id": "slack", "name": "Slack"},
         {"id": "jira", "name": "Jira"}
-    ]
+    ])
     mock_response.raise_for_status = Mock()
 
     mock_client = Mock()
@@ -293,3 +336,310 @@ def test_get_available_connector_types(mock_client_class, client):
     types = client.get_available_connector_types()
 
     assert types == ["github", "slack", "jira"]
+
+
+@patch("httpx.Client")
+def test_http_client_is_reused(mock_client_class, client):
+    """Test all requests share one pooled HTTP client."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps([])
+    mock_response.raise_for_status = Mock()
+
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    client.list_tenants()
+    client.list_oauth_providers()
+
+    mock_client_class.assert_called_once()
+    assert mock_client_class.call_args.kwargs["base_url"] == "http://test.example.com"
+    assert mock_client_class.call_args.kwargs["headers"] == client._get_headers()
+    assert mock_client.get.call_count == 2
+
+
+@patch("httpx.Client")
+def test_close_releases_http_client(mock_client_class, profile_config):
+    """Test closing the client closes the pooled HTTP client."""
+    mock_client = Mock()
+    mock_client.get.return_value = Mock(status_code=200)
+    mock_client_class.return_value = mock_client
+
+    with SageMCPClient(profile_config) as client:
+        client.ping()
+
+    mock_client.close.assert_called_once()
+
+
+def test_profile_client_is_cached(profile_config):
+    """Test the client for a profile is built once and reused."""
+    get_profile_client.cache_clear()
+    with patch(
+        "sage_mcp.cli.client.config_manager.get_profile", return_value=profile_config
+    ) as mock_get_profile:
+        first = get_profile_client("default")
+        second = get_profile_client("default")
+
+    assert first is second
+    mock_get_profile.assert_called_once_with("default")
+    get_profile_client.cache_clear()
+
+
+@patch("httpx.Client")
+def test_update_tenant_sends_single_patch(mock_client_class, client):
+    """Test updating a tenant sends only the changed fields in one request."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps({"slug": "test", "name": "Renamed"})
+    mock_response.raise_for_status = Mock()
+
+    mock_client = Mock()
+    mock_client.patch.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    tenant = client.update_tenant("test", name="Renamed")
+
+    assert tenant["name"] == "Renamed"
+    mock_client.get.assert_not_called()
+    mock_client.patch.assert_called_once_with(
+        "/api/v1/admin/tenants/test", content=orjson.dumps({"name": "Renamed"})
+    )
+
+
+@patch("httpx.Client")
+def test_list_connectors_with_include(mock_client_class, client):
+    """Test related connector data is requested in the list call itself."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps([{"id": "abc", "process_status": "running"}])
+    mock_response.raise_for_status = Mock()
+
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    connectors = client.list_connectors("test", include=["status"])
+
+    assert connectors[0]["process_status"] == "running"
+    mock_client.get.assert_called_once_with(
+        "/api/v1/admin/tenants/test/connectors", params={"include": "status"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_client_lists_tools(profile_config):
+    """Test the async client lists MCP tools through the pooled client."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps(
+        {"result": {"tools": [{"name": "list_repositories"}]}}
+    )
+    mock_response.raise_for_status = Mock()
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = Mock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        mock_client.aclose = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        async with AsyncSageMCPClient(profile_config) as client:
+            tools = await client.list_mcp_tools("test-tenant", "connector-1")
+
+    assert tools == [{"name": "list_repositories"}]
+    assert mock_client_class.call_args.kwargs["base_url"] == "http://test.example.com"
+    assert mock_client_class.call_args.kwargs["http2"] is True
+    mock_client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_cached_connector(profile_config):
+    """Test the async client reads connector details from the shared cache."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps({"id": "connector-1", "name": "GitHub"})
+    mock_response.raise_for_status = Mock()
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        mock_client = Mock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+        mock_client.aclose = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        async with AsyncSageMCPClient(profile_config) as client:
+            first = await client.get_connector("test-tenant", "connector-1")
+        async with AsyncSageMCPClient(profile_config) as client:
+            second = await client.get_connector("test-tenant", "connector-1")
+
+    assert first == second == {"id": "connector-1", "name": "GitHub"}
+    mock_client.get.assert_awaited_once()
+
+
+@patch("httpx.Client")
+def test_get_tenant_uses_response_cache(mock_client_class, client):
+    """Test tenant details are served from the cache until invalidated."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps({"slug": "test", "name": "Test"})
+    mock_response.raise_for_status = Mock()
+
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+    mock_client.patch.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    assert client.get_tenant("test")["name"] == "Test"
+    assert client.get_tenant("test")["name"] == "Test"
+    assert mock_client.get.call_count == 1
+
+    client.update_tenant("test", name="Renamed")
+    client.get_tenant("test")
+    assert mock_client.get.call_count == 2
+
+
+@patch("httpx.Client")
+def test_response_cache_is_scoped_by_api_key(mock_client_class, client):
+    """Test profiles with different API keys don't share cached responses."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps({"slug": "test", "name": "Test"})
+    mock_response.raise_for_status = Mock()
+
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    other = SageMCPClient(
+        ProfileConfig(base_url="http://test.example.com", api_key="other-key")
+    )
+
+    client.get_tenant("test")
+    other.get_tenant("test")
+    assert mock_client.get.call_count == 2
+
+    client.get_tenant("test")
+    assert mock_client.get.call_count == 2
+
+
+@patch("httpx.Client")
+def test_oauth_credentials_cache_refresh_and_revoke(mock_client_class, client):
+    """Test credential listings are cached until refreshed or revoked."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.content = orjson.dumps([{"provider": "github"}])
+    mock_response.raise_for_status = Mock()
+
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+    mock_client.delete.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    client.list_oauth_credentials("test")
+    client.list_oauth_credentials("test")
+    assert mock_client.get.call_count == 1
+
+    client.list_oauth_credentials("test", refresh=True)
+    assert mock_client.get.call_count == 2
+
+    client.revoke_oauth_credential("test", "github")
+    client.list_oauth_credentials("test")
+    assert mock_client.get.call_count == 3
+
+
+@patch("httpx.Client")
+def test_expired_cache_entry_is_revalidated(
+    mock_client_class, client, isolated_response_cache
+):
+    """Test an expired entry is revalidated with its ETag and reused on 304."""
+    isolated_response_cache.set(
+        "http://test.example.com/api/v1/oauth/providers",
+        [{"id": "github"}],
+        -1,
+        '"v1"',
+        client._cache_scope,
+    )
+
+    mock_response = Mock()
+    mock_response.status_code = 304
+
+    mock_client = Mock()
+    mock_client.get.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    assert client.list_oauth_providers() == [{"id": "github"}]
+    mock_client.get.assert_called_once_with(
+        "/api/v1/oauth/providers", headers={"If-None-Match": '"v1"'}
+    )
+
+
+@patch("httpx.Client")
+def test_list_mcp_catalog_uses_one_batch_request(mock_client_class, client):
+    """Test tools and resources are listed with a single JSON-RPC batch."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.content = orjson.dumps([
+        {"jsonrpc": "2.0", "id": 2, "result": {"resources": [{"uri": "repo://a"}]}},
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"tools": [{"name": "list_repositories"}]},
+        },
+    ])
+    mock_response.raise_for_status = Mock()
+
+    mock_client = Mock()
+    mock_client.post.return_value = mock_response
+    mock_client_class.return_value = mock_client
+
+    tools, resources = client.list_mcp_catalog("test-tenant", "connector-1")
+
+    assert tools == [{"name": "list_repositories"}]
+    assert resources == [{"uri": "repo://a"}]
+    mock_client.post.assert_called_once()
+    batch = orjson.loads(mock_client.post.call_args.kwargs["content"])
+    assert [item["method"] for item in batch] == ["tools/list", "resources/list"]
+
+
+@patch("httpx.Client")
+def test_read_mcp_resource_streams_first_text(mock_client_class, client):
+    """Test resource reads parse the streamed body and return the first text."""
+    body = (
+        b'{"jsonrpc": "2.0", "id": 1, "result": {"contents": '
+        b'[{"uri": "repo://readme", "text": "# README"}, {"text": "ignored"}]}}'
+    )
+    mock_response = Mock()
+    mock_response.is_error = False
+    mock_response.iter_bytes.return_value = iter([body[:20], body[20:]])
+
+    mock_client = Mock()
+    mock_client.stream.return_value.__enter__ = Mock(return_value=mock_response)
+    mock_client.stream.return_value.__exit__ = Mock(return_value=False)
+    mock_client_class.return_value = mock_client
+
+    content = client.read_mcp_resource("test-tenant", "connector-1", "repo://readme")
+    assert content == "# README"
+
+
+@patch("httpx.Client")
+def test_read_mcp_resource_raises_jsonrpc_error(mock_client_class, client):
+    """Test JSON-RPC errors in a streamed resource read raise APIError."""
+    mock_response = Mock()
+    mock_response.is_error = False
+    mock_response.iter_bytes.return_value = iter([
+        b'{"jsonrpc": "2.0", "id": 1, '
+        b'"error": {"code": -32002, "message": "Not found"}}'
+    ])
+
+    mock_client = Mock()
+    mock_client.stream.return_value.__enter__ = Mock(return_value=mock_response)
+    mock_client.stream.return_value.__exit__ = Mock(return_value=False)
+    mock_client_class.return_value = mock_client
+
+    with pytest.raises(APIError) as exc_info:
+        client.read_mcp_resource("test-tenant", "connector-1", "repo://missing")
+
+    assert exc_info.value.message == "Not found"
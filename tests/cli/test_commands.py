@@ -1,10 +1,19 @@
 """Tests for CLI commands."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
+from sage_mcp.cli.client import APIError
+from sage_mcp.cli.commands.mcp import (
+    INTERACTIVE_HANDLERS,
+    InteractiveSession,
+    app as mcp_app,
+    parse_tool_arguments,
+)
+from sage_mcp.cli.commands.oauth import app as oauth_app
 from sage_mcp.cli.commands.tenant import app as tenant_app
 
 
@@ -46,6 +55,17 @@ def test_show_tenant_success(mock_client):
     mock_client.get_tenant.assert_called_once_with("test")
 
 
+def test_list_tenants_json_when_piped(mock_client):
+    """Test JSON output is written as plain JSON when stdout is not a terminal."""
+    tenants = [{"slug": "test", "name": "Test [Tenant]", "is_active": True}]
+    mock_client.list_tenants.return_value = tenants
+
+    result = runner.invoke(tenant_app, ["list", "--format", "json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == tenants
+
+
 def test_create_tenant_non_interactive(mock_client):
     """Test creating tenant in non-interactive mode."""
     mock_client.create_tenant.return_value = {
@@ -85,8 +105,100 @@ def test_delete_tenant_with_force(mock_client):
     mock_client.delete_tenant.assert_called_once_with("test")
 
 
+def test_delete_tenant_without_terminal_requires_force(mock_client):
+    """Test deleting without --force fails instead of prompting when stdin is piped."""
+    result = runner.invoke(tenant_app, ["delete", "test"], input="y\n")
+
+    assert result.exit_code == 2
+    mock_client.delete_tenant.assert_not_called()
+
+
 def test_update_tenant_no_fields():
     """Test updating tenant with no fields fails."""
     result = runner.invoke(tenant_app, ["update", "test"])
 
     assert result.exit_code == 2
+
+
+def test_oauth_authorize_polls_with_backoff():
+    """Test OAuth polling starts fast and backs off while the result is pending."""
+    with patch("sage_mcp.cli.commands.oauth.get_client") as mock_get_client, patch(
+        "time.sleep"
+    ) as mock_sleep:
+        client = MagicMock()
+        client.get_oauth_auth_url.return_value = "http://auth.example.com"
+        client.get_cli_session_result.side_effect = [
+            APIError("Not ready", 404),
+            APIError("Not ready", 404),
+            {"status": "success", "provider_username": "octocat"},
+        ]
+        mock_get_client.return_value = client
+
+        result = runner.invoke(
+            oauth_app, ["authorize", "test", "github", "--no-browser"]
+        )
+
+    assert result.exit_code == 0
+    assert client.get_cli_session_result.call_count == 3
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.25, 0.375]
+
+
+def test_mcp_command_api_error_exit_code():
+    """Test API errors are reported and mapped to exit codes."""
+    with patch("sage_mcp.cli.commands.mcp.get_client") as mock_get_client:
+        client = MagicMock()
+        client.get_mcp_info.side_effect = APIError("Connector not found", 404)
+        mock_get_client.return_value = client
+
+        result = runner.invoke(mcp_app, ["info", "test", "connector-1"])
+
+    assert result.exit_code == 3
+    assert "Failed to get MCP info: Connector not found" in result.output
+
+
+def test_parse_tool_arguments():
+    """Test interactive tool arguments are parsed from JSON or key=value pairs."""
+    assert parse_tool_arguments('{"owner": "octo"}') == {"owner": "octo"}
+    assert parse_tool_arguments('owner=octo limit=5 title="a b"') == {
+        "owner": "octo",
+        "limit": 5,
+        "title": "a b",
+    }
+    assert parse_tool_arguments("") == {}
+
+    with pytest.raises(ValueError):
+        parse_tool_arguments('title="unterminated')
+
+
+def test_parse_tool_arguments_keeps_json_values():
+    """Test inline JSON arrays/objects keep their quotes and decode as JSON."""
+    assert parse_tool_arguments('labels=["bug","p1"] meta={"a": 1} n=2') == {
+        "labels": ["bug", "p1"],
+        "meta": {"a": 1},
+        "n": 2,
+    }
+
+
+def test_parse_tool_arguments_apostrophes():
+    """Test apostrophes inside bare or quoted values are kept as text."""
+    assert parse_tool_arguments("body=it's") == {"body": "it's"}
+    assert parse_tool_arguments('body="it\'s done" title=\'a b\'') == {
+        "body": "it's done",
+        "title": "a b",
+    }
+
+
+def test_interactive_session_reuses_listings_until_tool_call():
+    """Test interactive listings are reused until a tool call invalidates them."""
+    client = MagicMock()
+    client.list_mcp_tools.return_value = [{"name": "list_repositories"}]
+    client.call_mcp_tool.return_value = {"content": []}
+    session = InteractiveSession(client, "test", "connector-1")
+
+    INTERACTIVE_HANDLERS["tools"](session, "")
+    INTERACTIVE_HANDLERS["tools"](session, "")
+    assert client.list_mcp_tools.call_count == 1
+
+    INTERACTIVE_HANDLERS["call"](session, "list_repositories")
+    INTERACTIVE_HANDLERS["tools"](session, "")
+    assert client.list_mcp_tools.call_count == 2
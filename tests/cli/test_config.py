@@ -1,7 +1,9 @@
 """Tests for CLI configuration management."""
 
+import stat
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -40,6 +42,24 @@ def test_cli_config_defaults():
     assert config.settings.log_level == "INFO"
 
 
+def test_cli_config_from_dict_round_trip():
+    """Test CLIConfig is rebuilt from TOML data, ignoring unknown keys."""
+    data = {
+        "profiles": {
+            "dev": {"base_url": "https://dev.com", "timeout": "60", "legacy": 1}
+        },
+        "settings": {"default_profile": "dev"},
+    }
+
+    config = CLIConfig.from_dict(data)
+
+    assert config.profiles["dev"] == ProfileConfig(
+        base_url="https://dev.com", timeout=60
+    )
+    assert config.settings.default_profile == "dev"
+    assert CLIConfig.from_dict(config.to_dict()) == config
+
+
 def test_config_manager_initialization():
     """Test ConfigManager initialization."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -200,6 +220,20 @@ def test_config_manager_list_profiles():
         assert "prod" in profiles
 
 
+def test_config_manager_save_is_owner_only():
+    """Test saving writes config.toml with mode 0600 and leaves no temp files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+        manager = ConfigManager(config_dir)
+        manager.add_profile("default", "http://localhost:8000", api_key="secret")
+        manager.config_file.chmod(0o644)
+
+        manager.set_default_profile("default")
+
+        assert stat.S_IMODE(manager.config_file.stat().st_mode) == 0o600
+        assert not list(config_dir.glob("*.tmp"))
+
+
 def test_config_manager_initialize_default():
     """Test initializing default configuration."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -211,3 +245,49 @@ def test_config_manager_initialize_default():
         config = manager.load()
         assert "default" in config.profiles
         assert config.profiles["default"].base_url == "http://localhost:8000"
+
+
+def test_config_manager_load_uses_cache_until_file_changes():
+    """Test the parsed config is reused from the pickle cache until the file changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+        manager = ConfigManager(config_dir)
+        manager.add_profile("dev", "https://dev.com")
+        assert manager.cache_file.exists()
+
+        with patch("tomllib.load") as toml_load:
+            config = ConfigManager(config_dir).load()
+        toml_load.assert_not_called()
+        assert config.profiles["dev"].base_url == "https://dev.com"
+
+        manager.config_file.write_text(
+            '[profiles.dev]\nbase_url = "https://edited.com"\n'
+        )
+        config = ConfigManager(config_dir).load()
+        assert config.profiles["dev"].base_url == "https://edited.com"
+
+
+def test_config_manager_cache_is_owner_only():
+    """Test the pickle cache is written 0600 and ignored if others can write it."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+        manager = ConfigManager(config_dir)
+        manager.add_profile("dev", "https://dev.com", api_key="secret")
+        assert stat.S_IMODE(manager.cache_file.stat().st_mode) == 0o600
+
+        manager.cache_file.chmod(0o666)
+        with patch("pickle.load") as pickle_load:
+            config = ConfigManager(config_dir).load()
+        pickle_load.assert_not_called()
+        assert config.profiles["dev"].api_key == "secret"
+
+
+def test_config_manager_load_ignores_corrupt_cache():
+    """Test a corrupt cache file falls back to parsing config.toml."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+        ConfigManager(config_dir).add_profile("dev", "https://dev.com")
+        (config_dir / "config.cache.pkl").write_bytes(b"not a pickle")
+
+        config = ConfigManager(config_dir).load()
+        assert config.profiles["dev"].base_url == "https://dev.com"
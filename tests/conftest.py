@@ -18,6 +18,8 @@ os.environ["ENVIRONMENT"] = "test"
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only"
 
 from sage_mcp.main import app
+from sage_mcp.api.mcp import transport_pool
+from sage_mcp.api.tenant_cache import clear_tenant_cache
 from sage_mcp.database.connection import get_db_session, db_manager
 from sage_mcp.models.base import Base
 from sage_mcp.models.tenant import Tenant
@@ -104,6 +106,9 @@ def cleanup_db():
         session.rollback()
     finally:
         session.close()
+    # Tenants are deleted behind the API's back, so drop cached lookups
+    clear_tenant_cache()
+    transport_pool.clear()
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 """Integration tests for API endpoints."""
 
+import pytest
 from fastapi.testclient import TestClient
 
 
@@ -106,6 +107,63 @@ class TestAdminAPI:
 
         assert response.status_code == 404
 
+    def test_update_tenant(self, client: TestClient):
+        """Test updating a tenant."""
+        tenant_data = {
+            "slug": "update-test-tenant",
+            "name": "Update Test Tenant",
+            "description": "A tenant for update testing",
+            "contact_email": "updatetest@example.com"
+        }
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+
+        tenant_data["name"] = "Renamed Tenant"
+        response = client.put(
+            "/api/v1/admin/tenants/update-test-tenant", json=tenant_data
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["slug"] == "update-test-tenant"
+        assert data["name"] == "Renamed Tenant"
+
+        response = client.put(
+            "/api/v1/admin/tenants/nonexistent-tenant", json=tenant_data
+        )
+        assert response.status_code == 404
+
+    def test_patch_tenant(self, client: TestClient):
+        """Test partially updating a tenant."""
+        tenant_data = {
+            "slug": "patch-test-tenant",
+            "name": "Patch Test Tenant",
+            "description": "A tenant for patch testing",
+            "contact_email": "patchtest@example.com"
+        }
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+
+        response = client.patch(
+            "/api/v1/admin/tenants/patch-test-tenant", json={"name": "Patched Tenant"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name"] == "Patched Tenant"
+        # Fields not sent are left unchanged
+        assert data["description"] == "A tenant for patch testing"
+        assert data["contact_email"] == "patchtest@example.com"
+
+        assert client.patch(
+            "/api/v1/admin/tenants/patch-test-tenant", json={}
+        ).status_code == 400
+        # name is NOT NULL, so an explicit null is rejected instead of failing the write
+        assert client.patch(
+            "/api/v1/admin/tenants/patch-test-tenant", json={"name": None}
+        ).status_code == 422
+        assert client.patch(
+            "/api/v1/admin/tenants/nonexistent-tenant", json={"name": "Missing"}
+        ).status_code == 404
+
     def test_create_connector(self, client: TestClient):
         """Test creating a connector."""
         # Create a tenant first
@@ -169,10 +227,125 @@ class TestAdminAPI:
         assert len(data) > 0
         assert data[0]["name"] == "List Test Connector"
 
+        # Process status is embedded on request
+        response = client.get(
+            "/api/v1/admin/tenants/list-connector-tenant/connectors?include=status"
+        )
+
+        assert response.status_code == 200
+        assert response.json()[0]["process_status"] is None
+
+    def test_connector_lifecycle(self, client: TestClient):
+        """Test getting, toggling and deleting a connector."""
+        tenant_data = {
+            "slug": "lifecycle-tenant",
+            "name": "Lifecycle Tenant",
+            "description": "A tenant for connector lifecycle testing",
+            "contact_email": "lifecycle@example.com"
+        }
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+
+        connector_data = {
+            "name": "Lifecycle Connector",
+            "connector_type": "GITHUB",
+            "configuration": {}
+        }
+        connector = client.post(
+            "/api/v1/admin/tenants/lifecycle-tenant/connectors",
+            json=connector_data
+        ).json()
+        url = f"/api/v1/admin/tenants/lifecycle-tenant/connectors/{connector['id']}"
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.json()["name"] == "Lifecycle Connector"
+
+        response = client.patch(url, json={"description": "Patched description"})
+        assert response.status_code == 200
+        assert response.json()["name"] == "Lifecycle Connector"
+        assert response.json()["description"] == "Patched description"
+
+        # Configuration keys are merged server-side; null removes a key
+        client.patch(url, json={"configuration": {"org": "sage", "team": "core"}})
+        response = client.patch(
+            url, json={"configuration": {"team": None, "repo": "mcp"}}
+        )
+        assert response.status_code == 200
+        assert response.json()["configuration"] == {"org": "sage", "repo": "mcp"}
+
+        assert client.patch(url, json={"name": None}).status_code == 422
+
+        response = client.patch(f"{url}/toggle")
+        assert response.status_code == 200
+        assert response.json()["is_enabled"] is False
+
+        # Connector is not visible through another tenant's slug
+        assert client.get(
+            f"/api/v1/admin/tenants/other-tenant/connectors/{connector['id']}"
+        ).status_code == 404
+
+        response = client.delete(url)
+        assert response.status_code == 200
+        assert "Lifecycle Connector" in response.json()["message"]
+
+        assert client.get(url).status_code == 404
+        assert client.delete(url).status_code == 404
+
+        # Malformed IDs are rejected before reaching the database
+        assert client.get(
+            "/api/v1/admin/tenants/lifecycle-tenant/connectors/not-a-uuid"
+        ).status_code == 422
+
+    def test_recreated_tenant_does_not_reuse_cached_id(self, client: TestClient):
+        """Test connectors resolve against a tenant recreated with the same slug."""
+        tenant_data = {
+            "slug": "recreated-tenant",
+            "name": "Recreated Tenant",
+            "description": "A tenant that is deleted and created again",
+            "contact_email": "recreated@example.com"
+        }
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+        assert client.get(
+            "/api/v1/admin/tenants/recreated-tenant/connectors"
+        ).status_code == 200
+
+        assert client.delete(
+            "/api/v1/admin/tenants/recreated-tenant"
+        ).status_code == 200
+        assert client.get(
+            "/api/v1/admin/tenants/recreated-tenant/connectors"
+        ).status_code == 404
+
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+        connector_data = {
+            "name": "Recreated Connector",
+            "connector_type": "GITHUB",
+            "configuration": {}
+        }
+        response = client.post(
+            "/api/v1/admin/tenants/recreated-tenant/connectors",
+            json=connector_data
+        )
+        assert response.status_code == 201
+
+        tenant = client.get("/api/v1/admin/tenants/recreated-tenant").json()
+        assert response.json()["tenant_id"] == tenant["id"]
+
 
 class TestOAuthAPI:
     """Test OAuth API endpoints."""
 
+    def test_oauth_providers_etag(self, client: TestClient):
+        """Test the provider listing can be revalidated with its ETag."""
+        response = client.get("/api/v1/oauth/providers")
+        etag = response.headers["etag"]
+
+        response = client.get(
+            "/api/v1/oauth/providers", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
     def test_oauth_providers(self, client: TestClient):
         """Test getting OAuth providers."""
         response = client.get("/api/v1/oauth/providers")
@@ -244,6 +417,20 @@ class TestOAuthAPI:
         assert data["provider"] == "slack"
         assert data["client_id"] == "test-client-id"
         assert data["is_active"] is True
+        assert "client_secret" not in data
+
+        # Posting again for the same provider updates the existing configuration
+        oauth_config["client_id"] = "updated-client-id"
+        response = client.post(
+            "/api/v1/oauth/oauth-config-tenant/config",
+            json=oauth_config
+        )
+        assert response.status_code == 200
+        assert response.json()["id"] == data["id"]
+        assert response.json()["client_id"] == "updated-client-id"
+
+        configs = client.get("/api/v1/oauth/oauth-config-tenant/config").json()
+        assert len(configs) == 1
 
     def test_list_oauth_configs(self, client: TestClient):
         """Test listing OAuth configurations for a tenant."""
@@ -276,6 +463,7 @@ class TestOAuthAPI:
         assert isinstance(data, list)
         assert len(data) > 0
         assert data[0]["provider"] == "github"
+        assert "client_secret" not in data[0]
 
     def test_delete_oauth_config(self, client: TestClient):
         """Test deleting OAuth configuration."""
@@ -310,6 +498,12 @@ class TestOAuthAPI:
         assert "message" in data
         assert "deleted successfully" in data["message"]
 
+        # The configuration is gone, so deleting it again is a 404
+        response = client.delete(
+            "/api/v1/oauth/oauth-delete-config-tenant/config/slack"
+        )
+        assert response.status_code == 404
+
     def test_list_oauth_credentials(self, client: TestClient):
         """Test listing OAuth credentials for a tenant."""
         # Create a tenant first
@@ -328,3 +522,438 @@ class TestOAuthAPI:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
+        assert data == []
+
+        response = client.get("/api/v1/oauth/missing-tenant/auth")
+        assert response.status_code == 404
+
+
+    def test_oauth_callback_stores_credential(self, client: TestClient, monkeypatch):
+        """Test the OAuth callback exchanges the code and stores the credential."""
+        import httpx
+
+        from sage_mcp.api import oauth as oauth_api
+
+        tenant_data = {
+            "slug": "oauth-callback-tenant",
+            "name": "OAuth Callback Tenant",
+            "description": "A tenant for OAuth callback testing",
+            "contact_email": "oauthcallback@example.com"
+        }
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+        client.post(
+            "/api/v1/oauth/oauth-callback-tenant/config",
+            json={
+                "provider": "github",
+                "client_id": "callback-client-id",
+                "client_secret": "callback-client-secret"
+            }
+        )
+
+        class FakeProviderClient:
+            async def post(self, url, **kwargs):
+                return httpx.Response(
+                    200,
+                    json={"access_token": "gho_test", "scope": "repo"},
+                    request=httpx.Request("POST", url)
+                )
+
+            async def get(self, url, **kwargs):
+                return httpx.Response(
+                    200,
+                    json={"id": 42, "login": "octocat"},
+                    request=httpx.Request("GET", url)
+                )
+
+        monkeypatch.setattr(oauth_api, "get_http_client", lambda: FakeProviderClient())
+
+        # Callbacks without the signed state issued by initiate_oauth are rejected
+        response = client.get(
+            "/api/v1/oauth/oauth-callback-tenant/callback/github",
+            params={"code": "test-code", "state": "forged"},
+            follow_redirects=False
+        )
+        assert response.status_code == 400
+
+        response = client.get(
+            "/api/v1/oauth/oauth-callback-tenant/auth/github",
+            follow_redirects=False
+        )
+        location = httpx.URL(response.headers["location"])
+        state = location.params["state"]
+
+        # Authorizing the same account twice refreshes the stored credential
+        for _ in range(2):
+            response = client.get(
+                "/api/v1/oauth/oauth-callback-tenant/callback/github",
+                params={"code": "test-code", "state": state},
+                follow_redirects=False
+            )
+            assert response.status_code in [302, 307]
+            assert response.headers["location"] == (
+                "http://testserver/oauth/success"
+                "?provider=github&tenant=oauth-callback-tenant"
+            )
+
+        credentials = client.get("/api/v1/oauth/oauth-callback-tenant/auth").json()
+        assert len(credentials) == 1
+        assert credentials[0]["provider_user_id"] == "42"
+        assert credentials[0]["provider_username"] == "octocat"
+
+        response = client.delete("/api/v1/oauth/oauth-callback-tenant/auth/github")
+        assert response.status_code == 200
+        assert response.json()["revoked_count"] == 1
+        assert client.get("/api/v1/oauth/oauth-callback-tenant/auth").json() == []
+
+    def test_oauth_callback_token_exchange_failure(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test a failed token exchange is reported as a 400."""
+        import httpx
+
+        from sage_mcp.api import oauth as oauth_api
+        from sage_mcp.utils.oauth_state import sign_state
+
+        tenant_data = {
+            "slug": "oauth-failure-tenant",
+            "name": "OAuth Failure Tenant",
+            "description": "A tenant for OAuth failure testing",
+            "contact_email": "oauthfailure@example.com"
+        }
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+        client.post(
+            "/api/v1/oauth/oauth-failure-tenant/config",
+            json={
+                "provider": "github",
+                "client_id": "failure-client-id",
+                "client_secret": "failure-client-secret"
+            }
+        )
+
+        class RejectingProviderClient:
+            async def post(self, url, **kwargs):
+                return httpx.Response(
+                    401,
+                    text="bad_verification_code",
+                    request=httpx.Request("POST", url),
+                )
+
+        monkeypatch.setattr(
+            oauth_api, "get_http_client", lambda: RejectingProviderClient()
+        )
+
+        response = client.get(
+            "/api/v1/oauth/oauth-failure-tenant/callback/github",
+            params={
+                "code": "bad-code",
+                "state": sign_state("oauth-failure-tenant", "github"),
+            },
+            follow_redirects=False
+        )
+
+        assert response.status_code == 400
+        assert "bad_verification_code" in response.json()["detail"]
+
+    def test_revoke_oauth_without_credentials(self, client: TestClient):
+        """Test revoking OAuth credentials that do not exist."""
+        tenant_data = {
+            "slug": "oauth-revoke-tenant",
+            "name": "OAuth Revoke Tenant",
+            "description": "A tenant for OAuth revocation testing",
+            "contact_email": "oauthrevoke@example.com"
+        }
+        client.post("/api/v1/admin/tenants", json=tenant_data)
+
+        response = client.delete("/api/v1/oauth/oauth-revoke-tenant/auth/github")
+        assert response.status_code == 404
+        assert "No OAuth credentials" in response.json()["detail"]
+
+        response = client.delete("/api/v1/oauth/missing-tenant/auth/github")
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Tenant not found"
+
+class TestMCPAPI:
+    """Test MCP HTTP endpoints."""
+
+    def test_mcp_post_invalid_json(self, client: TestClient):
+        """Test malformed JSON-RPC bodies are rejected before any lookups."""
+        response = client.post(
+            "/api/v1/test-tenant/connectors/some-connector/mcp",
+            content=b"{not json",
+            headers={"Accept": "application/json, text/event-stream"}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid JSON"
+
+    def test_mcp_post_notification_accepted(self, client: TestClient):
+        """Test JSON-RPC notifications are acknowledged with 202."""
+        response = client.post(
+            "/api/v1/test-tenant/connectors/some-connector/mcp",
+            json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+            headers={"Accept": "application/json, text/event-stream"}
+        )
+
+        assert response.status_code == 202
+
+
+    def test_mcp_post_batch_of_notifications_accepted(self, client: TestClient):
+        """Test a JSON-RPC batch without requests is acknowledged with 202."""
+        response = client.post(
+            "/api/v1/test-tenant/connectors/some-connector/mcp",
+            json=[
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                {"jsonrpc": "2.0", "method": "notifications/cancelled"}
+            ],
+            headers={"Accept": "application/json, text/event-stream"}
+        )
+
+        assert response.status_code == 202
+
+    def test_mcp_post_empty_batch_or_scalar_rejected(self, client: TestClient):
+        """Test an empty batch or a non-object body gets a -32600 Invalid Request."""
+        for body in ([], 42, "tools/list"):
+            response = client.post(
+                "/api/v1/test-tenant/connectors/some-connector/mcp",
+                json=body,
+                headers={"Accept": "application/json, text/event-stream"}
+            )
+
+            assert response.status_code == 400
+            assert response.json()["error"]["code"] == -32600
+            assert response.json()["id"] is None
+
+    def test_mcp_post_batch_of_invalid_entries(self, client: TestClient):
+        """Test each invalid batch entry gets its own Invalid Request error."""
+        response = client.post(
+            "/api/v1/test-tenant/connectors/some-connector/mcp",
+            json=[1, {"jsonrpc": "2.0", "id": 7}],
+            headers={"Accept": "application/json, text/event-stream"}
+        )
+
+        assert response.status_code == 200
+        errors = response.json()
+        assert [error["id"] for error in errors] == [None, 7]
+        assert all(error["error"]["code"] == -32600 for error in errors)
+
+    def test_mcp_post_batch_returns_response_per_request(
+        self, client: TestClient, monkeypatch
+    ):
+        """Test each request in a JSON-RPC batch gets a response, in order."""
+        from sage_mcp.mcp.transport import MCPTransport
+
+        async def fake_initialize(self):
+            self.initialized = True
+            return True
+
+        async def fake_handle_http_message(self, message):
+            return {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "result": {"method": message["method"]},
+            }
+
+        monkeypatch.setattr(MCPTransport, "initialize", fake_initialize)
+        monkeypatch.setattr(
+            MCPTransport, "handle_http_message", fake_handle_http_message
+        )
+
+        response = client.post(
+            "/api/v1/batch-tenant/connectors/some-connector/mcp",
+            json=[
+                {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                "not a message",
+                {"jsonrpc": "2.0", "id": 2, "method": "resources/list"}
+            ],
+            headers={"Accept": "application/json, text/event-stream"}
+        )
+
+        assert response.status_code == 200
+        responses = response.json()
+        assert responses[0] == {
+            "jsonrpc": "2.0", "id": 1, "result": {"method": "tools/list"}
+        }
+        assert responses[1]["error"]["code"] == -32600
+        assert responses[2] == {
+            "jsonrpc": "2.0", "id": 2, "result": {"method": "resources/list"}
+        }
+
+
+class TestMCPTransportPool:
+    """Test reuse of initialized MCP transports."""
+
+    @pytest.mark.asyncio
+    async def test_transport_reused_until_invalidated(self, monkeypatch):
+        """Test transports are pooled per connector and dropped on invalidation."""
+        from sage_mcp.mcp.pool import TransportPool
+        from sage_mcp.mcp.transport import MCPTransport
+
+        async def fake_initialize(self):
+            self.initialized = True
+            return True
+
+        monkeypatch.setattr(MCPTransport, "initialize", fake_initialize)
+        pool = TransportPool()
+
+        async with pool.acquire("cache-tenant", "connector-1") as first:
+            pass
+        async with pool.acquire("cache-tenant", "connector-1") as second:
+            assert second is first
+
+        # Requests carrying a user token always get their own transport
+        async with pool.acquire("cache-tenant", "connector-1", "tok") as with_token:
+            assert with_token is not first
+            assert with_token.user_token == "tok"
+
+        pool.invalidate("cache-tenant")
+        async with pool.acquire("cache-tenant", "connector-1") as third:
+            assert third is not first
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_initializes_once(self, monkeypatch):
+        """Test concurrent requests for the same connector share one initialization."""
+        import asyncio
+
+        from sage_mcp.mcp.pool import TransportPool
+        from sage_mcp.mcp.transport import MCPTransport
+
+        calls = []
+
+        async def fake_initialize(self):
+            calls.append(self)
+            await asyncio.sleep(0)
+            self.initialized = True
+            return True
+
+        monkeypatch.setattr(MCPTransport, "initialize", fake_initialize)
+        pool = TransportPool()
+
+        async def acquire():
+            async with pool.acquire("cache-tenant", "connector-1") as transport:
+                return transport
+
+        transports = await asyncio.gather(*(acquire() for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(transport is transports[0] for transport in transports)
+
+    @pytest.mark.asyncio
+    async def test_failed_acquire_keeps_no_lock(self, monkeypatch):
+        """Test connectors that fail to initialize leave nothing behind in the pool."""
+        import asyncio
+
+        from sage_mcp.mcp.pool import TransportPool
+        from sage_mcp.mcp.transport import MCPTransport
+
+        async def fake_initialize(self):
+            await asyncio.sleep(0)
+            if self.connector_id == "broken":
+                raise RuntimeError("database unavailable")
+            return False
+
+        monkeypatch.setattr(MCPTransport, "initialize", fake_initialize)
+        pool = TransportPool()
+
+        async def acquire(connector_id):
+            async with pool.acquire("cache-tenant", connector_id) as transport:
+                return transport
+
+        await asyncio.gather(*(acquire(f"missing-{i}") for i in range(5)))
+        await asyncio.gather(*(acquire("missing") for _ in range(5)))
+        with pytest.raises(RuntimeError):
+            await acquire("broken")
+
+        assert len(pool._entries) == 0
+        assert len(pool._locks) == 0
+
+
+class TestMCPTransportSSE:
+    """Test the SSE message handler on MCPTransport."""
+
+    @pytest.mark.asyncio
+    async def test_handle_sse_yields_responses(self, monkeypatch):
+        """Test responses are yielded directly and notifications are skipped."""
+        from sage_mcp.mcp.transport import MCPTransport
+
+        async def fake_initialize(self):
+            return True
+
+        async def fake_handle_http_message(self, message):
+            if "id" not in message:
+                return None
+            return {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+
+        monkeypatch.setattr(MCPTransport, "initialize", fake_initialize)
+        monkeypatch.setattr(
+            MCPTransport, "handle_http_message", fake_handle_http_message
+        )
+
+        async def incoming():
+            yield {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+            yield {"jsonrpc": "2.0", "method": "notifications/initialized"}
+            yield {"jsonrpc": "2.0", "id": 2, "method": "resources/list"}
+            yield None
+            yield {"jsonrpc": "2.0", "id": 3, "method": "tools/list"}
+
+        transport = MCPTransport("sse-tenant", "connector-1")
+        responses = [response async for response in transport.handle_sse(incoming())]
+
+        assert [response["id"] for response in responses] == [1, 2]
+
+
+class TestMCPServerInitialize:
+    """Test MCPServer loading tenant and connector state."""
+
+    @pytest.fixture
+    def patched_db_context(self, monkeypatch):
+        """Point MCPServer at the async test database."""
+        from contextlib import asynccontextmanager
+
+        from sage_mcp.mcp import server as server_module
+        from tests.conftest import TestingAsyncSessionLocal
+
+        @asynccontextmanager
+        async def get_test_db_context():
+            async with TestingAsyncSessionLocal() as session:
+                yield session
+
+        monkeypatch.setattr(server_module, "get_db_context", get_test_db_context)
+
+    def _create_tenant_with_connector(self, client: TestClient, slug: str) -> dict:
+        client.post("/api/v1/admin/tenants", json={"slug": slug, "name": slug})
+        return client.post(
+            f"/api/v1/admin/tenants/{slug}/connectors",
+            json={"name": "GitHub", "connector_type": "GITHUB", "configuration": {}}
+        ).json()
+
+    def test_initialize_with_connector_id(self, client: TestClient, patched_db_context):
+        """Test a connector-scoped server loads the connector and its tenant."""
+        import asyncio
+
+        from sage_mcp.mcp.server import MCPServer
+
+        connector = self._create_tenant_with_connector(client, "init-tenant")
+
+        server = MCPServer("init-tenant", connector["id"])
+        assert asyncio.run(server.initialize()) is True
+        assert server.tenant.slug == "init-tenant"
+        assert [str(c.id) for c in server.connectors] == [connector["id"]]
+
+        # Connector IDs are only resolved within their own tenant
+        other = MCPServer("other-tenant", connector["id"])
+        assert asyncio.run(other.initialize()) is False
+
+    def test_initialize_without_connector_id(
+        self, client: TestClient, patched_db_context
+    ):
+        """Test a tenant-wide server prefetches the tenant's enabled connectors."""
+        import asyncio
+
+        from sage_mcp.mcp.server import MCPServer
+
+        connector = self._create_tenant_with_connector(client, "prefetch-tenant")
+
+        server = MCPServer("prefetch-tenant")
+        assert asyncio.run(server.initialize()) is True
+        assert [str(c.id) for c in server.connectors] == [connector["id"]]
@@ -61,6 +61,9 @@ class TestSettings:
             assert settings.refresh_token_expire_days == 7
             assert settings.mcp_server_timeout == 30
             assert settings.mcp_max_connections_per_tenant == 10
+            assert settings.database_pool_size == 20
+            assert settings.database_max_overflow == 10
+            assert settings.database_pool_recycle == 1800
 
     def test_settings_from_env(self):
         """Test settings from environment variables."""
@@ -0,0 +1,130 @@
+"""Test the idempotent data migrations run at startup."""
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from sage_mcp.database.migrations import (
+    create_tables,
+    upgrade_convert_oauth_provider_data_to_json,
+    upgrade_encrypt_oauth_client_secrets,
+)
+from sage_mcp.models.oauth_config import OAuthConfig
+from sage_mcp.models.oauth_credential import OAuthCredential
+from sage_mcp.models.tenant import Tenant
+from sage_mcp.utils.secret_encryption import decrypt_secret, encrypt_secret
+
+
+async def create_engine() -> AsyncEngine:
+    """Create an empty in-memory database with all tables."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    await create_tables(engine)
+    return engine
+
+
+async def add_tenant(session: AsyncSession) -> Tenant:
+    """Add a tenant for migration rows to belong to."""
+    tenant = Tenant(slug=f"tenant-{uuid.uuid4().hex[:8]}", name="Tenant")
+    session.add(tenant)
+    await session.flush()
+    return tenant
+
+
+class TestConvertOAuthProviderData:
+    """Test upgrade_convert_oauth_provider_data_to_json."""
+
+    @pytest.mark.asyncio
+    async def test_converts_only_legacy_rows(self, capsys):
+        """Test legacy reprs are converted and JSON rows are not selected again."""
+        engine = await create_engine()
+        async with AsyncSession(engine) as session:
+            tenant = await add_tenant(session)
+            for provider, data in [
+                ("github", {"login": "octocat"}),
+                ("gitlab", None),
+                ("slack", {}),
+            ]:
+                session.add(OAuthCredential(
+                    tenant_id=tenant.id,
+                    provider=provider,
+                    provider_user_id="1",
+                    access_token="token",
+                    provider_data=data,
+                ))
+            await session.commit()
+
+        # Older callbacks stored str(user_info)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "UPDATE oauth_credentials SET provider_data = :data "
+                    "WHERE provider = 'gitlab'"
+                ),
+                {"data": str({"login": "tanuki", "admin": False})},
+            )
+
+        await upgrade_convert_oauth_provider_data_to_json(engine)
+        assert "Converted 1 " in capsys.readouterr().out
+
+        async with engine.connect() as conn:
+            stored = (await conn.execute(text(
+                "SELECT provider_data FROM oauth_credentials ORDER BY provider"
+            ))).scalars().all()
+        assert stored == [
+            '{"login":"octocat"}',
+            '{"login":"tanuki","admin":false}',
+            "{}",
+        ]
+
+        await upgrade_convert_oauth_provider_data_to_json(engine)
+        assert capsys.readouterr().out == ""
+        await engine.dispose()
+
+
+class TestEncryptOAuthClientSecrets:
+    """Test upgrade_encrypt_oauth_client_secrets."""
+
+    @pytest.mark.asyncio
+    async def test_encrypts_plaintext_once(self, capsys):
+        """Test plaintext secrets are encrypted, including ones with a token prefix."""
+        engine = await create_engine()
+        token = encrypt_secret("already-encrypted")
+        async with AsyncSession(engine) as session:
+            tenant = await add_tenant(session)
+            for provider, client_secret in [
+                ("github", "plain-secret"),
+                ("gitlab", "gAAAAAshort"),
+                ("slack", token),
+            ]:
+                session.add(OAuthConfig(
+                    tenant_id=tenant.id,
+                    provider=provider,
+                    client_id="client",
+                    client_secret=client_secret,
+                ))
+            await session.commit()
+
+        await upgrade_encrypt_oauth_client_secrets(engine)
+        assert "Encrypted 2 " in capsys.readouterr().out
+
+        async with engine.connect() as conn:
+            stored = (await conn.execute(text(
+                "SELECT client_secret FROM oauth_configs ORDER BY provider"
+            ))).scalars().all()
+        assert [decrypt_secret(value) for value in stored] == [
+            "plain-secret",
+            "gAAAAAshort",
+            "already-encrypted",
+        ]
+        assert stored[2] == token
+
+        await upgrade_encrypt_oauth_client_secrets(engine)
+        assert capsys.readouterr().out == ""
+        await engine.dispose()
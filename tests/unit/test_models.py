@@ -130,6 +130,53 @@ class TestOAuthCredential:
         assert credential.is_active is True
         assert credential.scopes == "repo,user:email"
 
+    def test_oauth_credential_tokens_deferred(self, db_session, sample_tenant):
+        """Test tokens are only loaded when accessed or explicitly undeferred."""
+        from sqlalchemy.orm import undefer_group
+
+        credential = OAuthCredential(
+            tenant_id=sample_tenant.id,
+            provider="github",
+            provider_user_id="123",
+            access_token="token"
+        )
+        db_session.add(credential)
+        db_session.commit()
+        credential_id = credential.id
+        db_session.expunge_all()
+
+        loaded = db_session.query(OAuthCredential).filter_by(id=credential_id).one()
+        assert "access_token" not in loaded.__dict__
+        assert loaded.access_token == "token"
+
+        db_session.expunge_all()
+        loaded = (
+            db_session.query(OAuthCredential)
+            .options(undefer_group("tokens"))
+            .filter_by(id=credential_id)
+            .one()
+        )
+        assert loaded.__dict__["access_token"] == "token"
+
+    def test_oauth_credential_provider_data_round_trip(self, db_session, sample_tenant):
+        """Test provider data is stored and loaded as JSON."""
+        credential = OAuthCredential(
+            tenant_id=sample_tenant.id,
+            provider="github",
+            provider_user_id="123",
+            access_token="token",
+            provider_data={"id": 123, "login": "testuser", "site_admin": False}
+        )
+        db_session.add(credential)
+        db_session.commit()
+        db_session.expire(credential)
+
+        assert credential.provider_data == {
+            "id": 123,
+            "login": "testuser",
+            "site_admin": False,
+        }
+
     def test_oauth_credential_expiration(self, db_session, sample_tenant):
         """Test OAuth credential expiration check."""
         # Create expired credential
@@ -0,0 +1,50 @@
+"""Test OAuth state signing."""
+
+from unittest.mock import patch
+
+from sage_mcp.utils import oauth_state
+from sage_mcp.utils.oauth_state import sign_state, verify_state
+
+
+class TestOAuthState:
+    """Test signing and verification of the OAuth state parameter."""
+
+    def test_round_trip_returns_embedded_state(self):
+        """Test a signed state verifies and yields the custom state."""
+        signed = sign_state("tenant", "github", "cli-session-123")
+
+        assert verify_state(signed, "tenant", "github") == "cli-session-123"
+
+    def test_random_state_when_not_provided(self):
+        """Test a random state is generated when none is given."""
+        first = verify_state(sign_state("tenant", "github"), "tenant", "github")
+        second = verify_state(sign_state("tenant", "github"), "tenant", "github")
+
+        assert first and second
+        assert first != second
+
+    def test_rejects_other_tenant_or_provider(self):
+        """Test a state is bound to the tenant and provider it was issued for."""
+        signed = sign_state("tenant", "github")
+
+        assert verify_state(signed, "other-tenant", "github") is None
+        assert verify_state(signed, "tenant", "slack") is None
+
+    def test_rejects_tampered_or_malformed_state(self):
+        """Test modified and malformed states are rejected."""
+        signed = sign_state("tenant", "github", "original")
+        _, issued_at, signature = signed.rsplit(".", 2)
+
+        tampered = f"changed.{issued_at}.{signature}"
+        assert verify_state(tampered, "tenant", "github") is None
+        assert verify_state("cli-flow", "tenant", "github") is None
+        assert verify_state("", "tenant", "github") is None
+
+    def test_rejects_expired_state(self):
+        """Test states older than the TTL are rejected."""
+        signed = sign_state("tenant", "github")
+        issued_at = int(signed.rsplit(".", 2)[1])
+
+        expired = issued_at + oauth_state.STATE_TTL_SECONDS + 1
+        with patch.object(oauth_state.time, "time", return_value=expired):
+            assert verify_state(signed, "tenant", "github") is None
@@ -0,0 +1,71 @@
+"""Test encryption of OAuth client secrets at rest."""
+
+from unittest.mock import Mock, patch
+
+from sage_mcp.utils import secret_encryption
+from sage_mcp.utils.secret_encryption import (
+    clear_secret_cache,
+    decrypt_secret,
+    encrypt_secret,
+    is_encrypted_secret,
+)
+
+
+class TestSecretEncryption:
+    """Test encrypting and decrypting stored client secrets."""
+
+    def setup_method(self):
+        clear_secret_cache()
+
+    def test_round_trip(self):
+        """Test an encrypted secret decrypts to the original plaintext."""
+        ciphertext = encrypt_secret("client-secret")
+
+        assert ciphertext != "client-secret"
+        assert decrypt_secret(ciphertext) == "client-secret"
+
+    def test_plaintext_is_not_decryptable(self):
+        """Test legacy plaintext values are reported as undecryptable."""
+        assert decrypt_secret("client-secret") is None
+
+    def test_decrypted_value_is_cached(self):
+        """Test repeated decryption of the same value reuses the cached plaintext."""
+        ciphertext = encrypt_secret("client-secret")
+        decrypt_secret(ciphertext)
+
+        with patch.object(secret_encryption, "_get_fernet") as get_fernet:
+            assert decrypt_secret(ciphertext) == "client-secret"
+            get_fernet.assert_not_called()
+
+    def test_cache_entry_expires(self):
+        """Test cached plaintext is dropped after the TTL."""
+        ciphertext = encrypt_secret("client-secret")
+        now = secret_encryption.time.monotonic()
+        decrypt_secret(ciphertext)
+
+        later = now + secret_encryption.DECRYPT_CACHE_TTL_SECONDS + 1
+        track_fernet = patch.object(
+            secret_encryption, "_get_fernet", wraps=secret_encryption._get_fernet
+        )
+        with patch.object(secret_encryption.time, "monotonic", return_value=later), \
+                track_fernet as get_fernet:
+            assert decrypt_secret(ciphertext) == "client-secret"
+            get_fernet.assert_called_once()
+
+    def test_is_encrypted_secret(self):
+        """Test Fernet tokens are recognized by their structure, without decrypting."""
+        ciphertext = encrypt_secret("client-secret")
+
+        assert is_encrypted_secret(ciphertext)
+        assert not is_encrypted_secret("client-secret")
+        assert not is_encrypted_secret("gAAAAA-not-a-token")
+
+    def test_cache_is_keyed_by_secret_key(self):
+        """Test a cached plaintext is not served after the secret key changes."""
+        ciphertext = encrypt_secret("client-secret")
+        assert decrypt_secret(ciphertext) == "client-secret"
+
+        other_settings = Mock(secret_key="another-secret-key")
+        with patch.object(secret_encryption, "get_settings") as get_settings:
+            get_settings.return_value = other_settings
+            assert decrypt_secret(ciphertext) is None